@@ -16,14 +16,14 @@ Example:
 
 Dependencies:
     - falcon
-    - wsgiref (standard library)
+    - AddasuSec.ServerBackend (waitress or wsgiref)
     - API.WebAPI (application-specific resources)
 
 Author: Paul Grace
 """
 
 import falcon
-from wsgiref.simple_server import make_server
+from AddasuSec.ServerBackend import create_backend
 import logging
 import time
 import jwt
@@ -42,7 +42,8 @@ class APIServer:
     Falcon API Server for managing components with detailed logging and OAuth Bearer token authentication.
     """
 
-    def __init__(self, host='0.0.0.0', port=8654, log_file='apiserver.log', jwt_secret='your_jwt_secret'):
+    def __init__(self, host='0.0.0.0', port=8654, log_file='apiserver.log', jwt_secret='your_jwt_secret',
+                 backend=None, **server_options):
         """
         Initialize the APIServer instance.
 
@@ -51,10 +52,15 @@ class APIServer:
             port (int): Port number to listen on.
             log_file (str): Path to the log file.
             jwt_secret (str): Secret key for decoding JWT tokens.
+            backend (str): Server backend name, "waitress" or "wsgiref"; the default when None.
+            **server_options: Backend settings such as threads, connection_limit and keep_alive.
         """
         self.host = host
         self.port = port
         self.jwt_secret = jwt_secret
+        self.server = None
+        self.backend = backend
+        self.server_options = server_options
 
         self.app = falcon.App(middleware=[self.LoggingMiddleware(self.jwt_secret, log_file)])
 
@@ -127,12 +133,22 @@ class APIServer:
 
     def run(self):
         """
-        Run the Falcon server using wsgiref.simple_server.
+        Run the Falcon server with the configured server backend until stop() is called.
         """
         print(f"Starting API server on {self.host}:{self.port}...")
-        with make_server(self.host, self.port, self.app) as httpd:
-            print(f"Serving on http://{self.host}:{self.port}")
-            httpd.serve_forever()
+        self.server = create_backend(self.backend, self.app, self.port, host=self.host, **self.server_options)
+        print(f"Serving on http://{self.host}:{self.port} ({self.server.name})")
+        try:
+            self.server.serve()
+        except KeyboardInterrupt:
+            self.server.stop()
+
+    def stop(self):
+        """
+        Shut the server down cleanly.
+        """
+        if self.server is not None:
+            self.server.stop()
 
 
 if __name__ == '__main__':
@@ -5,12 +5,13 @@ This module defines the Falcon web application and registers the main API routes
 for managing components, including creation, deletion, connection, disconnection,
 and starting components.
 
-The server can be run standalone with the built-in WSGI server or deployed with
-production WSGI servers such as Gunicorn or Waitress.
+The server can be run standalone with a server backend from AddasuSec.ServerBackend
+(multi-threaded waitress by default) or deployed with production WSGI servers such as
+Gunicorn.
 """
 
 import falcon
-from wsgiref.simple_server import make_server
+from AddasuSec.ServerBackend import create_backend
 
 from API.WebAPI import (
     StartComponentResource,
@@ -31,13 +32,20 @@ app.add_route('/disconnect', DisconnectResource())
 app.add_route('/start', StartComponentResource())
 
 
-def main():
+def main(backend=None, **options):
     """
     Starts the WSGI server on port 8654 and serves the Falcon app until terminated.
+
+    Args:
+        backend (str): Server backend name, "waitress" or "wsgiref"; the default when None.
+        **options: Backend settings such as threads, connection_limit and keep_alive.
     """
-    with make_server('', 8654, app) as httpd:
-        print('Serving on port 8654...')
-        httpd.serve_forever()
+    server = create_backend(backend, app, 8654, **options)
+    print(f'Serving on port 8654 ({server.name})...')
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        server.stop()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,295 @@
+"""
+Admission Module
+
+This module sheds load at the component servers instead of letting every caller slow
+down under overload. Each component wrapper has an AdmissionController that lets at most
+"MaxConcurrency" calls run at once and queues up to "MaxQueue" more, in arrival order;
+both are component attributes read on every call, so they can be changed at runtime. A
+call arriving when the queue is full is rejected at once with 503 and the X-Overloaded
+header, whose value is the estimated time for the queue to drain, computed from its depth
+and the observed service time, in seconds with sub-second precision; Retry-After carries
+it rounded up to whole seconds for other HTTP clients.
+A queued call whose deadline passes (see AddasuSec.Deadline) is rejected with 504.
+"MaxConcurrency" 0 (the default) admits every call. Rejections are counted in the
+"ShedRequests" attribute.
+
+With a threaded server backend a queued call holds one of the server's threads, so the
+queue only fills while "MaxConcurrency" is below the backend's "ServerThreads"; the ASGI
+backend queues calls without holding threads.
+
+WebReceptacle and its async proxy retry a call rejected with X-Overloaded after that
+delay, spread by random jitter and doubled on each attempt, up to the "OverloadRetries"
+receptacle attribute. The retries are budgeted against the receptacle's "Timeout",
+cut at the caller's deadline, rather than against the adaptive timeout of one attempt;
+then the call fails with OverloadedException.
+
+Classes:
+    OverloadedException: Raised for calls the sink kept rejecting as overloaded.
+    AdmissionController: Concurrency limit and bounded queue of one component.
+
+Functions:
+    overload_delay: Retry delay of an overload rejection, or None.
+    backoff_delay: Jittered delay before retrying an overloaded call.
+
+Author: Paul Grace
+"""
+
+import asyncio
+import collections
+import contextlib
+import math
+import random
+import threading
+import time
+import falcon
+
+OVERLOAD_HEADER = "X-Overloaded"
+DEFAULT_MAX_CONCURRENCY = 0
+DEFAULT_MAX_QUEUE = 100
+DEFAULT_OVERLOAD_RETRIES = 2
+# Fraction of the delay added at random to spread the retries of rejected callers
+BACKOFF_JITTER = 0.5
+# Shortest delay before a retry, in seconds, when the sink estimates no wait at all
+MIN_BACKOFF = 0.01
+# Weight of the latest call in the moving average of the service time
+SMOOTHING = 0.2
+
+
+# Exception raised when a call is still rejected as overloaded after its retries.
+class OverloadedException(Exception):
+    pass
+
+
+class _ThreadWaiter:
+    def __init__(self):
+        self.event = threading.Event()
+
+    def wake(self):
+        self.event.set()
+
+
+class _AsyncWaiter:
+    def __init__(self, loop):
+        self.loop = loop
+        self.future = loop.create_future()
+
+    def _grant(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+    def wake(self):
+        self.loop.call_soon_threadsafe(self._grant)
+
+
+class AdmissionController:
+    """
+    Concurrency limit and bounded FIFO queue of one component. Synchronous servers call
+    admit(), ASGI servers admit_async(); both can be used on the same controller.
+
+    Attributes:
+        wrapper (WebComponent | WebServerComponent): The component served; its attributes
+            give the limits.
+        active (int): Calls running.
+        shed (int): Calls rejected because the queue was full.
+        service_time (float): Moving average of the call duration, in seconds.
+    """
+
+    def __init__(self, wrapper):
+        """
+        Initialize an idle controller.
+
+        Args:
+            wrapper (WebComponent | WebServerComponent): The component served.
+        """
+        self.wrapper = wrapper
+        self.lock = threading.Lock()
+        self.active = 0
+        self.waiters = collections.deque()
+        self.shed = 0
+        self.service_time = 0.0
+
+    def limits(self):
+        """
+        Return the limits from the "MaxConcurrency" and "MaxQueue" attributes.
+
+        Returns:
+            tuple: (max_concurrency, max_queue); max_concurrency 0 means no limit.
+        """
+        limit = self.wrapper.attribute("MaxConcurrency")
+        queue = self.wrapper.attribute("MaxQueue")
+        return (int(limit) if limit else DEFAULT_MAX_CONCURRENCY,
+                int(queue) if queue is not None else DEFAULT_MAX_QUEUE)
+
+    def queued(self) -> int:
+        """Return the number of calls waiting for a slot."""
+        return len(self.waiters)
+
+    def retry_after(self, limit) -> float:
+        """
+        Estimate the seconds until the queue drains: its depth, plus one, times the mean
+        service time, divided by the concurrency limit.
+
+        Args:
+            limit (int): The concurrency limit.
+
+        Returns:
+            float: Seconds.
+        """
+        return (len(self.waiters) + 1) * self.service_time / limit
+
+    def enter(self, waiter) -> bool:
+        """
+        Take a slot for a call, or queue its waiter.
+
+        Returns:
+            bool: True if the call may run now, False if the waiter was queued.
+
+        Raises:
+            falcon.HTTPServiceUnavailable: If the queue is full.
+        """
+        limit, queue = self.limits()
+        with self.lock:
+            if not limit or (self.active < limit and not self.waiters):
+                self.active += 1
+                return True
+            if len(self.waiters) < queue:
+                self.waiters.append(waiter)
+                return False
+            self.shed += 1
+            shed, retry = self.shed, self.retry_after(limit)
+        if self.wrapper.meta is not None:
+            self.wrapper.meta.setComponentAttributeValue(self.wrapper.label, "ShedRequests", shed)
+        raise falcon.HTTPServiceUnavailable(title="Overloaded",
+                                            description="The component is at its concurrency and queue limits.",
+                                            retry_after=max(1, math.ceil(retry)),
+                                            headers={OVERLOAD_HEADER: f"{retry:.3f}"})
+
+    def abandon(self, waiter) -> bool:
+        """
+        Take a waiter out of the queue, e.g. when its deadline passes.
+
+        Returns:
+            bool: True if it was removed; False if it had been granted a slot meanwhile.
+        """
+        with self.lock:
+            try:
+                self.waiters.remove(waiter)
+                return True
+            except ValueError:
+                return False
+
+    def release(self, elapsed: float = None) -> None:
+        """
+        Free the slot of a finished call and hand slots to the waiters at the head of the
+        queue.
+
+        Args:
+            elapsed (float): Duration of the call in seconds, or None for a slot given back
+                unused, which leaves the service time unchanged.
+        """
+        limit, _ = self.limits()
+        with self.lock:
+            if elapsed is not None:
+                self.service_time += SMOOTHING * (elapsed - self.service_time)
+            self.active -= 1
+            while self.waiters and (not limit or self.active < limit):
+                self.active += 1
+                self.waiters.popleft().wake()
+
+    @contextlib.contextmanager
+    def admit(self, deadline: float = None):
+        """
+        Hold a slot for the duration of the with-block, waiting in the queue if needed.
+
+        Args:
+            deadline (float): Seconds since the epoch after which a queued call gives up.
+
+        Raises:
+            falcon.HTTPServiceUnavailable: If the queue is full.
+            falcon.HTTPGatewayTimeout: If the deadline passed while the call was queued.
+        """
+        waiter = _ThreadWaiter()
+        if not self.enter(waiter):
+            timeout = None if deadline is None else max(0.0, deadline - time.time())
+            if not waiter.event.wait(timeout) and self.abandon(waiter):
+                raise _queue_timeout()
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - start)
+
+    @contextlib.asynccontextmanager
+    async def admit_async(self, deadline: float = None):
+        """
+        Hold a slot for the duration of the async with-block; queued calls wait without
+        blocking the event loop.
+
+        Args:
+            deadline (float): Seconds since the epoch after which a queued call gives up.
+
+        Raises:
+            falcon.HTTPServiceUnavailable: If the queue is full.
+            falcon.HTTPGatewayTimeout: If the deadline passed while the call was queued.
+        """
+        waiter = _AsyncWaiter(asyncio.get_running_loop())
+        if not self.enter(waiter):
+            timeout = None if deadline is None else max(0.0, deadline - time.time())
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+            except asyncio.TimeoutError:
+                if self.abandon(waiter):
+                    raise _queue_timeout()
+            except asyncio.CancelledError:
+                # The caller went away; give back a slot granted in the meantime
+                if not self.abandon(waiter):
+                    self.release()
+                raise
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - start)
+
+
+def _queue_timeout():
+    return falcon.HTTPGatewayTimeout(title="Deadline Exceeded",
+                                     description="The call's deadline passed while it was queued")
+
+
+def overload_delay(status: int, headers) -> float:
+    """
+    Return the delay a reply rejecting a call as overloaded asks for: the X-Overloaded
+    estimate, which may be below a second or zero, or else its Retry-After.
+
+    Args:
+        status (int): HTTP status of the reply.
+        headers (Mapping): Its headers.
+
+    Returns:
+        float: Seconds to wait, or None if the reply is not an overload rejection.
+    """
+    if status != 503 or OVERLOAD_HEADER not in headers:
+        return None
+    for value in (headers.get(OVERLOAD_HEADER), headers.get("Retry-After")):
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            continue
+    return 1.0
+
+
+def backoff_delay(retry_after: float, attempt: int) -> float:
+    """
+    Return the delay before retrying an overloaded call: never less than the delay the
+    sink asked for, doubled on every attempt and spread by random jitter so rejected
+    callers do not return together.
+
+    Args:
+        retry_after (float): Seconds from overload_delay.
+        attempt (int): Number of retries already made.
+
+    Returns:
+        float: Seconds to wait.
+    """
+    return max(retry_after, MIN_BACKOFF) * (2 ** attempt) * random.uniform(1.0, 1.0 + BACKOFF_JITTER)
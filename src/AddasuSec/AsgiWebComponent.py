@@ -0,0 +1,174 @@
+"""
+AsgiWebComponent Module
+
+This module defines the ASGI variant of WebComponent. The component's methods are served
+by a falcon.asgi.App hosted by the "asgi" server backend (uvicorn, see
+AddasuSec.ServerBackend), whose servers all run on one shared event loop:
+
+    - async methods are awaited on that loop, so thousands of IO-bound calls can be in
+      flight at once without a thread each;
+    - synchronous methods, and batches, run in the component's thread pool, sized by the
+      backend's "threads" option, so they never block the loop;
+    - generator results are streamed and file results sent chunk by chunk without
+      blocking the loop.
+
+Routes, dispatch entries, receptacles and meta attributes are shared with WebComponent.
+WebRuntime creates an AsgiWebComponent for components whose server backend is "asgi"
+(WebRuntime.setServerBackend).
+
+Classes:
+    AsgiWebComponent: WebComponent serving its methods over ASGI.
+
+Author: Paul Grace
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+import falcon
+import falcon.asgi
+from AddasuSec.WebComponent import WebComponent
+from AddasuSec.Batch import invoke_batch
+from AddasuSec import WireCodec
+from AddasuSec.RequestContext import bearer_token, bind_request, capture_request, reset_request
+from AddasuSec.Streaming import is_stream, stream_result_async
+from AddasuSec.Deadline import bind_deadline, request_deadline, reset_deadline
+from AddasuSec.Blobs import blob_arguments_async, is_blob_request, is_blob_result, send_blob_async
+from AddasuSec.ServerBackend import DEFAULT_ASGI_THREADS
+
+
+class AsgiWebComponent(WebComponent):
+    """
+    A web wrapper that exposes an internal component's methods over ASGI.
+
+    Attributes:
+        executor (ThreadPoolExecutor): Pool running the synchronous methods.
+    """
+
+    app_class = falcon.asgi.App
+
+    def __init__(self, component, secure, threads=None):
+        """
+        Initialize the AsgiWebComponent.
+
+        Args:
+            component (object): Component instance with callable methods.
+            secure (bool): Enable JWT authentication if True.
+            threads (int): Size of the pool running synchronous methods.
+        """
+        super().__init__(component, secure)
+        self.executor = ThreadPoolExecutor(max_workers=threads or DEFAULT_ASGI_THREADS,
+                                           thread_name_prefix="AsgiWorker")
+
+    def stopThreadedServer(self):
+        """
+        Stop the running servers and release the worker threads.
+        """
+        super().stopThreadedServer()
+        self.executor.shutdown(wait=False)
+
+    async def on_post(self, req, resp):
+        """
+        Handle POST request to invoke a component method through its dispatch entry.
+        Arguments are read from the query string, a codec-encoded body or a blob body.
+        """
+        # Reject calls whose deadline passed while they were queued
+        expires = request_deadline(req)
+        nm = req.path.rpartition('/')[-1]
+        entry = self.dispatch.get(nm)
+        if entry is None:
+            raise falcon.HTTPServiceUnavailable(
+                title='Service Outage',
+                description='The method called is not implemented on the component.',
+                retry_after=30
+            )
+
+        if is_blob_request(req):
+            # Binary arguments in a raw or multipart body (see AddasuSec.Blobs)
+            args = await blob_arguments_async(req, entry.signature, entry.read_param(req), self.maxBodySize())
+        elif req.content_length:
+            # Arguments encoded in the body with a negotiated codec
+            args = entry.body_arguments(await req.get_media() or {})
+        else:
+            args = entry.query_arguments(req)
+
+        result = await self.call_method_async(entry, req, args, expires)
+
+        resp.set_header('Powered-By', 'Falcon')
+        resp.status = falcon.HTTP_200
+        if is_stream(result):
+            # Generators are streamed item by item (see AddasuSec.Streaming)
+            stream_result_async(req, resp, result, WireCodec.negotiate(req.accept),
+                                capture_request(getattr(req.context, "user", None), bearer_token(req)),
+                                self.executor)
+            return
+        if is_blob_result(entry.signature.return_annotation, result):
+            send_blob_async(resp, result, self.executor)
+            return
+        resp.content_type = WireCodec.negotiate(req.accept).content_type
+        resp.media = {"result": result}
+
+    async def on_post_batch(self, req, resp):
+        """
+        Handle POST request carrying a batch of method invocations. The batch runs in the
+        thread pool; results are returned in order, with errors reported per item.
+        """
+        expires = request_deadline(req)
+        calls = (await req.get_media()).get("calls", [])
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self.executor, contextvars.copy_context().run,
+                                             invoke_batch, self, req, calls, expires)
+        resp.media = {"results": results}
+        resp.set_header('Powered-By', 'Falcon')
+        resp.status = falcon.HTTP_200
+
+    async def call_method_async(self, entry, req, args, expires=None):
+        """
+        Invoke a component method through its dispatch entry: async methods are awaited on
+        the event loop, synchronous ones run in the thread pool, once the component's
+        admission controller grants a slot. The request's principal, bearer token and
+        deadline are bound for the duration of the call. A coalesced call arriving while
+        an identical one runs awaits its result instead (see AddasuSec.Coalescing).
+
+        Args:
+            entry (DispatchEntry): The method's precompiled dispatch entry.
+            req (falcon.asgi.Request): The incoming request.
+            args (list): Converted method arguments.
+            expires (float): The call's deadline from request_deadline, or None.
+
+        Returns:
+            Any: The method's result.
+        """
+        key = self.coalescing.key(entry, req, args)
+        if key is not None:
+            return await self.coalescing.run_async(
+                key, lambda: self.run_method_async(entry, req, args, expires), expires)
+        return await self.run_method_async(entry, req, args, expires)
+
+    async def run_method_async(self, entry, req, args, expires):
+        """
+        Invoke a component method once the admission controller grants a slot, with the
+        request context and deadline bound.
+
+        Args:
+            entry (DispatchEntry): The method's precompiled dispatch entry.
+            req (falcon.asgi.Request): The incoming request.
+            args (list): Converted method arguments.
+            expires (float): The call's deadline, or None.
+
+        Returns:
+            Any: The method's result.
+        """
+        # Queued calls wait on the event loop, without holding a thread
+        async with self.admission.admit_async(expires):
+            deadline = bind_deadline(expires)
+            handle = bind_request(getattr(req.context, "user", None), bearer_token(req))
+            try:
+                if entry.is_async:
+                    return await entry.call(req, args)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, contextvars.copy_context().run,
+                                                  entry.call, req, args)
+            finally:
+                reset_request(handle)
+                reset_deadline(deadline)
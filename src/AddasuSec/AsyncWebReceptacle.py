@@ -0,0 +1,376 @@
+"""
+AsyncWebReceptacle Module
+
+This module provides the asyncio mode of WebReceptacle connections. A component obtains
+it with getReceptacle(r_type, asynchronous=True); the returned proxy exposes the
+interface's methods as coroutines, so a component can fan out to several sinks and wait
+only as long as the slowest one. Cacheable methods share the connection's result cache.
+Iterator methods return an AsyncResultStream to be consumed with `async for`.
+
+Requests are issued by aiohttp on a single background event loop owned by this module.
+Each connection keeps its own aiohttp session and connection pool there, which lets the
+proxy be awaited from any event loop, including the short-lived loops WebComponent uses
+for async component methods. Sinks reached over a Unix domain socket get a session of
+their own using aiohttp's UnixConnector. Cancelling the awaiting task cancels the HTTP request.
+Calls shed by an overloaded sink are retried after a jittered backoff (see
+AddasuSec.Admission).
+
+Classes:
+    AsyncPooledSession: Per-connection aiohttp session living on the client loop.
+    AsyncReceptacleProxy: Awaitable view of a connected WebReceptacle.
+
+Functions:
+    send_request: Send one request of a call through the connection's replicas and breaker.
+    run_blocking: Run a coroutine on the client loop from a synchronous caller.
+    hedge: Run a request with a hedged duplicate (see AddasuSec.Hedging).
+    gather: Await several receptacle calls concurrently.
+
+Dependencies:
+    - aiohttp (imported on first use)
+
+Author: Paul Grace
+"""
+
+import asyncio
+import threading
+import time
+from AddasuSec.WireCodec import get_codec
+from AddasuSec.Streaming import AsyncResultStream, ResultStream
+from AddasuSec.Blobs import MEDIA_OCTET, encode_blobs
+from AddasuSec.Deadline import DEADLINE_HEADER, DeadlineExceededException
+from AddasuSec.Admission import OverloadedException, backoff_delay, overload_delay
+from AddasuSec.UnixSocket import socket_path
+
+_client_loop = None
+_client_lock = threading.Lock()
+
+
+def client_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the background event loop that runs all async receptacle requests.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running client loop.
+    """
+    global _client_loop
+    with _client_lock:
+        if _client_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="AsyncReceptacleLoop", daemon=True).start()
+            _client_loop = loop
+    return _client_loop
+
+
+class AsyncPooledSession:
+    """
+    The aiohttp counterpart of PooledSession. The session is created on the client loop
+    the first time it is used.
+
+    Attributes:
+        pool_size (int): Maximum number of simultaneous connections to the sink.
+    """
+
+    def __init__(self, pool_size: int):
+        """
+        Initialize the session.
+
+        Args:
+            pool_size (int): Maximum number of simultaneous connections to the sink.
+        """
+        self.pool_size = pool_size
+        self.session = None
+        self.unix_sessions = {}
+
+    def _session(self, url):
+        import aiohttp
+        path = socket_path(url)
+        if path is None:
+            if self.session is None or self.session.closed:
+                self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.pool_size))
+            return self.session, url
+        session = self.unix_sessions.get(path)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(connector=aiohttp.UnixConnector(path=path, limit=self.pool_size))
+            self.unix_sessions[path] = session
+        # The connector reaches the socket; the URL only needs a host for the Host header
+        return session, "http://localhost/" + url.split("/", 3)[3]
+
+    async def _post(self, url, params, data, headers, files=None):
+        import aiohttp
+        if files:
+            data = aiohttp.FormData()
+            for name, (filename, value, content_type) in files.items():
+                data.add_field(name, value, filename=filename, content_type=content_type)
+        session, url = self._session(url)
+        auth = None if headers and 'Authorization' in headers else aiohttp.BasicAuth('user', 'pass')
+        async with session.post(url, params=params, data=data, headers=headers, auth=auth) as response:
+            if response.status == 504:
+                raise DeadlineExceededException(f"Deadline of {url} passed at the sink")
+            retry_after = overload_delay(response.status, response.headers)
+            if retry_after is not None:
+                return None, None, retry_after
+            # Error replies carry no result: surface them rather than decoding them to None
+            response.raise_for_status()
+            return await response.read(), response.headers.get('Content-Type'), None
+
+    async def post(self, url: str, params: dict, headers: dict = None, codec=None, blobs=None,
+                   retries: int = 0, timeout: float = None, budget: float = None) -> tuple:
+        """
+        Send a POST request from any event loop.
+
+        Args:
+            url (str): Target URL.
+            params (dict): Arguments of the call.
+            headers (dict): Extra request headers; basic auth is used when None.
+            codec (Codec): Encodes the arguments in the body; query-string parameters are
+                sent when None.
+            blobs (list[str]): Parameters sent as the raw or multipart body, the others
+                going in the query string (see AddasuSec.Blobs).
+            retries (int): Times a call shed by an overloaded sink is sent again, after
+                the delay it asks for with jittered backoff; blob calls are not retried.
+            timeout (float): Seconds one attempt may take, also sent as its deadline.
+            budget (float): Seconds all the attempts and the delays between them may take.
+
+        Returns:
+            tuple: The response body and its Content-Type.
+
+        Raises:
+            OverloadedException: If the sink still sheds the call after the retries.
+            asyncio.TimeoutError: If an attempt exceeded its timeout.
+            aiohttp.ClientResponseError: If the sink replied with an error status.
+        """
+        data = files = None
+        if blobs:
+            data, files = encode_blobs({name: params.get(name) for name in blobs})
+            if files is None:
+                headers = dict(headers or {}, **{'Content-Type': MEDIA_OCTET})
+            params = {k: v if isinstance(v, str) else str(v) for k, v in params.items() if k not in blobs}
+        elif codec is not None:
+            data = codec.dumps(params)
+            headers = dict(headers or {}, **{'Content-Type': codec.content_type,
+                                             'Accept': codec.content_type})
+            params = None
+        else:
+            params = {k: v if isinstance(v, str) else str(v) for k, v in params.items()}
+        end = None if budget is None else time.monotonic() + budget
+        attempt = 0
+        while True:
+            limit = timeout
+            if end is not None:
+                left = end - time.monotonic()
+                limit = left if limit is None or left < limit else limit
+            attempt_headers = headers
+            if limit is not None:
+                attempt_headers = dict(headers or {}, **{DEADLINE_HEADER: f"{time.time() + limit:.3f}"})
+            future = asyncio.run_coroutine_threadsafe(self._post(url, params, data, attempt_headers, files),
+                                                      client_loop())
+            content, content_type, retry_after = await asyncio.wait_for(asyncio.wrap_future(future), limit)
+            if retry_after is None:
+                return content, content_type
+            delay = backoff_delay(retry_after, attempt)
+            if blobs or attempt >= retries or (end is not None and time.monotonic() + delay >= end):
+                raise OverloadedException(f"{url} rejected by an overloaded sink, retry after {retry_after:.3g}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """Close the aiohttp session and its pooled connections."""
+        if self.session is not None:
+            asyncio.run_coroutine_threadsafe(self.session.close(), client_loop())
+            self.session = None
+        for session in self.unix_sessions.values():
+            asyncio.run_coroutine_threadsafe(session.close(), client_loop())
+        self.unix_sessions.clear()
+
+
+class AsyncReceptacleProxy:
+    """
+    Awaitable view of a connected WebReceptacle. Attribute access returns coroutine
+    functions for the interface methods.
+
+    Attributes:
+        receptacle (WebReceptacle): The underlying connection.
+        timeout (float): Seconds after which a call is cancelled; None uses the
+            receptacle's timeout. Calls never outlive the active deadline.
+    """
+
+    def __init__(self, receptacle, timeout: float = None):
+        """
+        Initialize the proxy.
+
+        Args:
+            receptacle (WebReceptacle): The connection to call through.
+            timeout (float): Per-call timeout in seconds, or None for the receptacle's.
+        """
+        self.receptacle = receptacle
+        self.timeout = timeout
+
+    def __getattr__(self, name):
+        stub = self.receptacle.stub
+        if stub is None or name not in stub.specs:
+            raise AttributeError(f"'{name}' is not available on receptacle '{self.receptacle.iid}'")
+        spec = stub.specs[name]
+        receptacle = self.receptacle
+        cache = receptacle.cache
+        proxy_timeout = self.timeout
+
+        if spec.streaming:
+            def stream(*args, **kwargs):
+                return AsyncResultStream(ResultStream(receptacle, spec, spec.bind(args, kwargs)))
+            stream.__name__ = name
+            return stream
+
+        async def method(*args, **kwargs):
+            params = spec.bind(args, kwargs)
+            timeout, budget = receptacle.callTimeout(name), receptacle.retryBudget()
+            if proxy_timeout is not None:
+                timeout, budget = min(timeout, proxy_timeout), min(budget, proxy_timeout)
+            local = receptacle.local
+            if local is not None and local.active(name):
+                return await local.invoke_async(spec, params)
+            key = spec.cache_key(params) if spec.cacheable else None
+            if key is not None:
+                found, value = cache.get(key)
+                if found:
+                    return value
+
+            def request():
+                return send_request(receptacle, spec, params, None, timeout, budget)
+
+            hedging = receptacle.hedging
+            hedged = hedging is not None and spec.idempotent and not spec.blobs
+            call = hedge(hedging, request) if hedged else request()
+            content, content_type = await asyncio.wait_for(call, budget)
+            value = spec.decode(content, get_codec(content_type))
+            if key is not None and value is not None:
+                cache.put(key, value, spec.cache_ttl)
+            return value
+        method.__name__ = name
+        return method
+
+
+async def send_request(receptacle, spec, params: dict, headers: dict = None,
+                       timeout: float = None, budget: float = None) -> tuple:
+    """
+    Send one request of a call to the replica chosen by the receptacle's balancing policy,
+    through its circuit breaker, and record the outcome.
+
+    Args:
+        receptacle (WebReceptacle): The connection to call through.
+        spec (MethodSpec): Precomputed description of the method.
+        params (dict): Parameter name to value.
+        headers (dict): Extra request headers; basic auth is used when None.
+        timeout (float): Seconds one attempt may take.
+        budget (float): Seconds the attempts and overload retries may take.
+
+    Returns:
+        tuple: The response body and its Content-Type.
+    """
+    replica = receptacle.acquire()
+    start = time.monotonic()
+    ok = healthy = False
+    try:
+        content = await receptacle.async_session.post(replica.endpoints[spec.name], params, headers,
+                                                      codec=receptacle.codec, blobs=spec.blobs,
+                                                      retries=receptacle.overload_retries,
+                                                      timeout=timeout, budget=budget)
+        ok = healthy = True
+    except Exception as e:
+        # As in WebReceptacle.send, only server errors count against the sink; calls it
+        # shed are not failures
+        healthy = isinstance(e, OverloadedException) or getattr(e, "status", 500) < 500
+        raise
+    finally:
+        latency = time.monotonic() - start
+        receptacle.release(replica, latency, healthy)
+        if ok and receptacle.adaptive is not None:
+            receptacle.adaptive.record(spec.name, latency)
+        if ok and receptacle.hedging is not None:
+            receptacle.hedging.record(latency)
+    return content
+
+
+def run_blocking(coroutine, timeout: float):
+    """
+    Run a coroutine on the client loop and wait for its result on the calling thread.
+    Failures are raised as the requests exceptions synchronous callers handle.
+
+    Args:
+        coroutine (Coroutine): The coroutine to run.
+        timeout (float): Seconds after which it is cancelled.
+
+    Returns:
+        Any: The coroutine's result.
+
+    Raises:
+        requests.HTTPError: If the sink replied with an error status.
+        requests.Timeout: If the timeout expired.
+        requests.ConnectionError: If the sink could not be reached.
+    """
+    import aiohttp
+    import requests
+    future = asyncio.run_coroutine_threadsafe(asyncio.wait_for(coroutine, timeout), client_loop())
+    try:
+        return future.result()
+    except aiohttp.ClientResponseError as e:
+        raise requests.HTTPError(f"{e.status} {e.message} for url: {e.request_info.real_url}") from e
+    except asyncio.TimeoutError as e:
+        raise requests.Timeout(f"No reply within {timeout:.3f}s") from e
+    except aiohttp.ClientError as e:
+        raise requests.ConnectionError(str(e)) from e
+
+
+async def hedge(policy, request, delay: float = None) -> tuple:
+    """
+    Run a request and, if it is slower than the policy's delay, a second one; the first
+    successful reply wins and the other request is cancelled.
+
+    Args:
+        policy (HedgingPolicy): The connection's hedging policy.
+        request (callable): Coroutine function sending one request.
+        delay (float): Delay already taken from policy.delay(); taken from the policy
+            when None.
+
+    Returns:
+        tuple: The winning response body and its Content-Type.
+    """
+    if delay is None:
+        delay = policy.delay()
+    first = asyncio.ensure_future(request())
+    pending = {first}
+    try:
+        if delay is None:
+            return await first
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done or not policy.spend():
+            return await first
+        second = asyncio.ensure_future(request())
+        pending.add(second)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None or not pending:
+                    if task is second and task.exception() is None:
+                        policy.won()
+                    return task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def gather(*calls, timeout: float = None, return_exceptions: bool = False) -> list:
+    """
+    Await several receptacle calls concurrently and return their results in order.
+
+    Args:
+        *calls: Awaitables returned by AsyncReceptacleProxy methods.
+        timeout (float): Overall timeout in seconds; pending calls are cancelled on expiry.
+        return_exceptions (bool): Return failures in place of results instead of raising.
+
+    Returns:
+        list: The results, in the order of the calls.
+    """
+    pending = asyncio.gather(*calls, return_exceptions=return_exceptions)
+    if timeout is None:
+        return await pending
+    return await asyncio.wait_for(pending, timeout)
@@ -0,0 +1,290 @@
+"""
+Batch Module
+
+This module implements batched invocation of component methods. Many calls are carried in
+one POST to the "/{label}/__batch__" route of a WebComponent or WebServerComponent, and the
+results come back in order with errors reported per item. This removes one HTTP round trip
+per call for chatty interfaces such as IAdd.add called in a loop.
+
+Server side:
+    invoke_batch: Run the calls of a batch request against a component wrapper.
+
+Client side:
+    BatchCall: Pending result of one call inside a batch.
+    ExplicitBatch: Batch context returned by WebReceptacle.batch(); calls issued on it are
+        sent together when the context exits.
+    CallBatcher: Collects ordinary receptacle calls issued by concurrent callers within a
+        short window into one request (WebReceptacle.enableBatching).
+
+Request body:
+    {"calls": [{"method": "add", "params": {"a": 1, "b": 2}}, ...]}
+
+Reply body:
+    {"results": [{"result": 3}, {"error": "...", "type": "HTTPForbidden"}, ...]}
+
+Author: Paul Grace
+"""
+
+import json
+import threading
+import time
+from AddasuSec.TypeCodec import loads, wire_default
+from AddasuSec.Deadline import DEADLINE_HEADER, DeadlineExceededException, current_deadline, reject_expired
+
+BATCH_ROUTE = "__batch__"
+
+
+# Exception raised on the client for a call that failed inside a batch.
+class BatchCallException(Exception):
+    pass
+
+
+def invoke_batch(wrapper, req, calls: list, expires: float = None) -> list:
+    """
+    Invoke each call of a batch on the wrapped component.
+
+    Only methods exposed through the wrapper's routes can be called. Parameters arrive as
+    JSON values and are converted by the decoders of the method's dispatch entry.
+
+    Args:
+        wrapper (WebComponent | WebServerComponent): The component wrapper serving the batch.
+        req (falcon.Request): The batch request, passed on for authorization.
+        calls (list[dict]): The "calls" list of the request body.
+        expires (float): The batch's deadline in seconds since the epoch, or None; calls
+            reached after it are rejected with 504.
+
+    Returns:
+        list[dict]: One {"result": ...} or {"error": ..., "type": ...} entry per call.
+    """
+    results = []
+    for call in calls:
+        try:
+            name = call.get("method")
+            entry = wrapper.dispatch.get(name) if name in wrapper.exposed_methods else None
+            if entry is None:
+                raise AttributeError(f"Method '{name}' is not implemented on the component")
+            reject_expired(expires)
+            args = entry.body_arguments(call.get("params") or {})
+            results.append({"result": wrapper.call_method(entry, req, args, expires)})
+        except Exception as e:
+            description = getattr(e, "description", None) or str(e)
+            results.append({"error": description, "type": type(e).__name__})
+    return results
+
+
+class BatchCall:
+    """
+    Pending result of one call inside a batch.
+
+    Attributes:
+        spec (MethodSpec): The interface method being called.
+        params (dict): Parameter name to value.
+        deadline (float): The caller's deadline in seconds since the epoch, or None.
+    """
+
+    def __init__(self, spec, params: dict, flush=None):
+        """
+        Initialize the pending call.
+
+        Args:
+            spec (MethodSpec): The interface method being called.
+            params (dict): Parameter name to value.
+            flush (callable): Sends the owning batch if the result is needed before it was sent.
+        """
+        self.spec = spec
+        self.params = params
+        self.flush = flush
+        self.deadline = current_deadline()
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+    def set(self, value=None, error=None) -> None:
+        """Complete the call with a value or an exception."""
+        self.value = value
+        self.error = error
+        self.done.set()
+
+    def result(self, timeout: float = None):
+        """
+        Wait for and return the call's result.
+
+        Args:
+            timeout (float): Seconds to wait, or None to wait until the batch completes or
+                the caller's deadline passes.
+
+        Returns:
+            Any: The decoded result.
+
+        Raises:
+            BatchCallException: If the call failed on the component.
+            TimeoutError: If the result did not arrive in time.
+            DeadlineExceededException: If the caller's deadline passed first.
+        """
+        if not self.done.is_set() and self.flush is not None:
+            self.flush()
+        if timeout is None and self.deadline is not None:
+            if not self.done.wait(max(0.0, self.deadline - time.time())):
+                raise DeadlineExceededException(f"Deadline passed before the batched call to {self.spec.name} completed")
+        elif not self.done.wait(timeout):
+            raise TimeoutError(f"Batched call to {self.spec.name} timed out")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def send_batch(receptacle, calls: list, headers: dict = None) -> None:
+    """
+    Send a list of BatchCalls in one request and complete each of them.
+
+    Args:
+        receptacle (WebReceptacle): The connection to send on.
+        calls (list[BatchCall]): The calls, in order.
+        headers (dict): Extra request headers; basic auth is used when None.
+    """
+    body = json.dumps({"calls": [{"method": c.spec.name, "params": c.params} for c in calls]},
+                      default=wire_default)
+    try:
+        # The request serves every call in it: it may run until the last of their
+        # deadlines, within the slowest of their methods' adaptive timeouts
+        deadlines = [call.deadline for call in calls]
+        timeout = max(receptacle.callTimeout(name, deadlines) for name in {c.spec.name for c in calls})
+        replica = receptacle.acquire()
+    except Exception as e:
+        for call in calls:
+            call.set(error=e)
+        return
+    start = time.monotonic()
+    ok = False
+    try:
+        request_headers = {"Content-Type": "application/json",
+                           DEADLINE_HEADER: f"{time.time() + timeout:.3f}"}
+        request_headers.update(headers or {})
+        response = receptacle.session.post(replica.url + BATCH_ROUTE, data=body,
+                                           headers=request_headers,
+                                           auth=None if headers and 'Authorization' in headers else receptacle.auth,
+                                           timeout=timeout)
+        response.raise_for_status()
+        items = loads(response.content)["results"]
+        ok = True
+    except Exception as e:
+        for call in calls:
+            call.set(error=e)
+        return
+    finally:
+        receptacle.release(replica, time.monotonic() - start, ok)
+    for call, item in zip(calls, items):
+        if "error" in item:
+            call.set(error=BatchCallException(f"{item.get('type')}: {item['error']}"))
+        else:
+            value = item.get("result")
+            call.set(value=None if value is None else call.spec.decoder(value))
+
+
+class ExplicitBatch:
+    """
+    Batch context returned by WebReceptacle.batch(). Interface methods called on it return
+    BatchCall objects; all of them are sent in one request when the context exits or when
+    any result is requested.
+    """
+
+    def __init__(self, receptacle, headers: dict = None):
+        """
+        Initialize the batch.
+
+        Args:
+            receptacle (WebReceptacle): The connected receptacle.
+            headers (dict): Extra request headers, e.g. a bearer token.
+        """
+        self.receptacle = receptacle
+        self.headers = headers
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name):
+        stub = self.receptacle.stub
+        if stub is None or name not in stub.specs:
+            raise AttributeError(f"'{name}' is not available on receptacle '{self.receptacle.iid}'")
+        spec = stub.specs[name]
+
+        def method(*args, **kwargs):
+            call = BatchCall(spec, spec.bind(args, kwargs), self.flush)
+            with self.lock:
+                self.calls.append(call)
+            return call
+        return method
+
+    def flush(self) -> None:
+        """Send all calls issued so far."""
+        with self.lock:
+            calls, self.calls = self.calls, []
+        if calls:
+            send_batch(self.receptacle, calls, self.headers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+
+class CallBatcher:
+    """
+    Gathers calls issued by concurrent callers on one receptacle into a single request.
+
+    The first caller of a batch waits up to `window` seconds (or until `max_size` calls are
+    queued), then sends the batch; the other callers block until their result arrives.
+    Calls carrying different Authorization headers are never mixed in one batch.
+    """
+
+    def __init__(self, receptacle, window: float = 0.002, max_size: int = 64):
+        """
+        Initialize the batcher.
+
+        Args:
+            receptacle (WebReceptacle): The connection to send on.
+            window (float): Seconds to wait for further calls before sending.
+            max_size (int): Number of calls that triggers an immediate send.
+        """
+        self.receptacle = receptacle
+        self.window = window
+        self.max_size = max_size
+        self.pending = {}
+        self.cond = threading.Condition()
+
+    def call(self, spec, params: dict, headers: dict = None):
+        """
+        Queue a call and block until its result is available.
+
+        Args:
+            spec (MethodSpec): The interface method being called.
+            params (dict): Parameter name to value.
+            headers (dict): Extra request headers; basic auth is used when None.
+
+        Returns:
+            Any: The decoded result.
+        """
+        key = headers.get("Authorization") if headers else None
+        item = BatchCall(spec, params)
+        with self.cond:
+            batch = self.pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self.pending[key] = []
+            batch.append(item)
+            if len(batch) >= self.max_size:
+                self.pending.pop(key, None)
+                self.cond.notify_all()
+        if leader:
+            with self.cond:
+                self.cond.wait_for(lambda: self.pending.get(key) is not batch, self.window)
+                if self.pending.get(key) is batch:
+                    self.pending.pop(key)
+            if item.deadline is None:
+                send_batch(self.receptacle, batch, headers)
+            else:
+                # The batch may outlive the leader's deadline, so the leader must not send it
+                threading.Thread(target=send_batch, args=(self.receptacle, batch, headers),
+                                 name="BatchSender", daemon=True).start()
+        return item.result()
@@ -0,0 +1,356 @@
+"""
+Blobs Module
+
+This module carries large binary arguments and results between components without
+encoding them in the query string or the codec body. An interface parameter annotated as
+bytes, bytearray, memoryview or a binary file type (typing.BinaryIO, typing.IO[bytes],
+io.IOBase and its subclasses) is a blob:
+
+    - a call with a single blob argument sends it as the raw request body
+      (application/octet-stream);
+    - a call with several blob arguments sends them as multipart/form-data, one part per
+      argument, named after the parameter.
+
+The remaining arguments of a blob call travel in the query string. The component server
+hands each blob to the method according to its annotation: a file-like parameter gets a
+stream reading straight from req.bounded_stream, a memoryview parameter a view over a
+buffer filled in place, and bytes parameters the body read in one piece. Multipart parts
+arrive one after the other, so each is read in full before the method runs. Bodies (or
+parts) larger than the component's "MaxBodySize" attribute are rejected with 413.
+
+A method annotated as returning a blob type that returns bytes, bytearray, memoryview or
+an open binary file replies with the raw body; other results are encoded as usual, as the
+caller decodes the reply according to the same annotation. Files are handed to the WSGI
+server's file wrapper, which uses sendfile where the server supports it.
+
+Classes:
+    LimitedStream: Binary stream that refuses to read past a size limit.
+
+Functions:
+    is_blob_type: Return True if an annotation denotes a blob.
+    blob_params: Names of the blob parameters of a signature.
+    encode_blobs: Build the request body of a blob call.
+    is_blob_request: Return True if a request carries blob arguments.
+    blob_arguments: Convert the arguments of a blob request.
+    blob_arguments_async: Convert the arguments of a blob request to a falcon.asgi app.
+    is_blob_result: Return True if a method result is sent as a raw body.
+    send_blob: Set a falcon response to a raw binary body.
+    send_blob_async: Set a falcon.asgi response to a raw binary body.
+    decode_blob: Convert a raw reply body into a return annotation.
+
+Author: Paul Grace
+"""
+
+import asyncio
+import io
+import os
+import typing
+import falcon
+import falcon.stream
+
+MEDIA_OCTET = "application/octet-stream"
+DEFAULT_MAX_BODY_SIZE = 64 * 1024 * 1024
+
+_BUFFERS = (bytes, bytearray, memoryview)
+
+
+class LimitedStream(io.RawIOBase):
+    """
+    Read-only binary stream over a request body that raises 413 once more than a limit
+    has been read.
+
+    Attributes:
+        stream (io.IOBase): The underlying stream, e.g. req.bounded_stream.
+        limit (int): Maximum number of bytes that may be read.
+    """
+
+    def __init__(self, stream, limit: int):
+        super().__init__()
+        self.stream = stream
+        self.limit = limit
+        self.consumed = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.stream.read(len(buffer))
+        self.consumed += len(data)
+        if self.consumed > self.limit:
+            raise falcon.HTTPContentTooLarge(description=f"Body exceeds {self.limit} bytes")
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def is_blob_type(annotation) -> bool:
+    """
+    Return True if a parameter or return annotation denotes binary data sent raw.
+
+    Args:
+        annotation (type): The annotation.
+
+    Returns:
+        bool: True for bytes, bytearray, memoryview and binary file types.
+    """
+    if annotation in _BUFFERS or annotation is typing.BinaryIO:
+        return True
+    origin = typing.get_origin(annotation)
+    if origin is typing.IO:
+        return typing.get_args(annotation) == (bytes,)
+    return isinstance(annotation, type) and issubclass(annotation, io.IOBase)
+
+
+def _is_file_type(annotation) -> bool:
+    return is_blob_type(annotation) and annotation not in _BUFFERS
+
+
+def blob_params(signature) -> list:
+    """
+    Return the names of the blob parameters of a signature.
+
+    Args:
+        signature (inspect.Signature): The method signature.
+
+    Returns:
+        list[str]: Parameter names annotated as blobs, in declaration order.
+    """
+    return [name for name, param in signature.parameters.items() if is_blob_type(param.annotation)]
+
+
+def encode_blobs(blobs: dict) -> tuple:
+    """
+    Build the request body of a call with blob arguments.
+
+    Args:
+        blobs (dict): Parameter name to bytes-like object or binary file.
+
+    Returns:
+        tuple: (data, files) keyword arguments for requests: a raw body for a single blob,
+        else multipart parts.
+    """
+    if len(blobs) == 1:
+        return next(iter(blobs.values())), None
+    return None, {name: (name, value, MEDIA_OCTET) for name, value in blobs.items()}
+
+
+def is_blob_request(req: falcon.Request) -> bool:
+    """
+    Return True if a request carries blob arguments in a raw or multipart body.
+
+    Args:
+        req (falcon.Request): The incoming request.
+    """
+    content_type = req.content_type
+    if not content_type:
+        return False
+    media = content_type.split(";", 1)[0].strip().lower()
+    return media == MEDIA_OCTET or media == falcon.MEDIA_MULTIPART
+
+
+def _read_body(stream, annotation, length, limit):
+    if length is not None and length > limit:
+        raise falcon.HTTPContentTooLarge(description=f"Body exceeds {limit} bytes")
+    if _is_file_type(annotation):
+        return io.BufferedReader(LimitedStream(stream, limit))
+    if annotation is memoryview and length is not None:
+        # Fill a buffer of the announced size in place and hand out a view over it
+        view = memoryview(bytearray(length))
+        # The whole bounded body is read, so the WSGI input can be read into directly
+        source = stream.stream if isinstance(stream, falcon.stream.BoundedStream) else stream
+        readinto = getattr(source, "readinto", None)
+        filled = 0
+        while filled < length:
+            if readinto is not None:
+                read = readinto(view[filled:])
+            else:
+                chunk = source.read(length - filled)
+                read = len(chunk)
+                view[filled:filled + read] = chunk
+            if not read:
+                break
+            filled += read
+        return view[:filled]
+    data = stream.read(limit + 1)
+    if len(data) > limit:
+        raise falcon.HTTPContentTooLarge(description=f"Body exceeds {limit} bytes")
+    if annotation is memoryview:
+        return memoryview(data)
+    return bytearray(data) if annotation is bytearray else data
+
+
+def blob_arguments(req: falcon.Request, signature, read_param, limit: int) -> list:
+    """
+    Convert the arguments of a request carrying blobs.
+
+    Args:
+        req (falcon.Request): The incoming request.
+        signature (inspect.Signature): Signature of the called method.
+        read_param (callable): Converts a query-string argument, given its name and
+            annotation.
+        limit (int): Maximum size of the body, or of each part, in bytes.
+
+    Returns:
+        list: Arguments in declaration order.
+
+    Raises:
+        falcon.HTTPContentTooLarge: If the body or a part is larger than the limit.
+    """
+    blobs = {}
+    names = blob_params(signature)
+    params = signature.parameters
+    if req.content_type.split(";", 1)[0].strip().lower() == falcon.MEDIA_MULTIPART:
+        # Parts arrive in order and must be read before the method runs
+        for part in req.get_media():
+            if part.name in names:
+                annotation = params[part.name].annotation
+                if _is_file_type(annotation):
+                    blobs[part.name] = io.BytesIO(_read_body(part.stream, bytes, None, limit))
+                else:
+                    blobs[part.name] = _read_body(part.stream, annotation, None, limit)
+    elif names:
+        blobs[names[0]] = _read_body(req.bounded_stream, params[names[0]].annotation,
+                                     req.content_length, limit)
+    args = []
+    for name, param in params.items():
+        if name in names:
+            args.append(blobs.get(name))
+        else:
+            annotation = param.annotation
+            args.append(read_param(name, annotation if annotation is not param.empty else str))
+    return args
+
+
+async def blob_arguments_async(req, signature, read_param, limit: int) -> list:
+    """
+    Convert the arguments of a falcon.asgi request carrying blobs. The body, or each
+    part, is read in full before the method runs.
+
+    Args:
+        req (falcon.asgi.Request): The incoming request.
+        signature (inspect.Signature): Signature of the called method.
+        read_param (callable): Converts a query-string argument, given its name and
+            annotation.
+        limit (int): Maximum size of the body, or of each part, in bytes.
+
+    Returns:
+        list: Arguments in declaration order.
+
+    Raises:
+        falcon.HTTPContentTooLarge: If the body or a part is larger than the limit.
+    """
+    blobs = {}
+    names = blob_params(signature)
+    params = signature.parameters
+    if req.content_type.split(";", 1)[0].strip().lower() == falcon.MEDIA_MULTIPART:
+        async for part in await req.get_media():
+            if part.name in names:
+                data = await part.stream.read(limit + 1)
+                annotation = params[part.name].annotation
+                if _is_file_type(annotation):
+                    annotation = bytes
+                blobs[part.name] = _read_body(io.BytesIO(data), annotation, len(data), limit)
+                if annotation is not params[part.name].annotation:
+                    blobs[part.name] = io.BytesIO(blobs[part.name])
+    elif names:
+        length = req.content_length
+        if length is not None and length > limit:
+            raise falcon.HTTPContentTooLarge(description=f"Body exceeds {limit} bytes")
+        data = await req.stream.read(limit + 1)
+        blobs[names[0]] = _read_body(io.BytesIO(data), params[names[0]].annotation, len(data), limit)
+    args = []
+    for name, param in params.items():
+        if name in names:
+            args.append(blobs.get(name))
+        else:
+            annotation = param.annotation
+            args.append(read_param(name, annotation if annotation is not param.empty else str))
+    return args
+
+
+def _is_binary_stream(result) -> bool:
+    if isinstance(result, (io.BufferedIOBase, io.RawIOBase)):
+        return True
+    return hasattr(result, "read") and "b" in str(getattr(result, "mode", ""))
+
+
+def is_blob_result(annotation, result) -> bool:
+    """
+    Return True if a method result is sent as a raw body rather than encoded: the method
+    is annotated as returning a blob (so the caller's stub expects a raw body) and the
+    result is a buffer or a binary stream.
+
+    Args:
+        annotation (type): The method's return annotation.
+        result (Any): The method's result.
+    """
+    if not is_blob_type(annotation):
+        return False
+    return isinstance(result, _BUFFERS) or _is_binary_stream(result)
+
+
+def send_blob(resp: falcon.Response, result) -> None:
+    """
+    Set a falcon response to a raw binary body. A file is streamed through the WSGI
+    server's file wrapper and closed once sent.
+
+    Args:
+        resp (falcon.Response): The response.
+        result (bytes | bytearray | memoryview | io.IOBase): The method's result.
+    """
+    resp.content_type = MEDIA_OCTET
+    if isinstance(result, _BUFFERS):
+        resp.data = bytes(result) if isinstance(result, memoryview) else result
+        return
+    try:
+        resp.content_length = os.fstat(result.fileno()).st_size - result.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    resp.stream = result
+
+
+async def _read_file(file, executor):
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            chunk = await loop.run_in_executor(executor, file.read, 65536)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        file.close()
+
+
+def send_blob_async(resp, result, executor=None) -> None:
+    """
+    Set a falcon.asgi response to a raw binary body. A file is read in an executor, one
+    chunk at a time, and closed once sent.
+
+    Args:
+        resp (falcon.asgi.Response): The response.
+        result (bytes | bytearray | memoryview | io.IOBase): The method's result.
+        executor (concurrent.futures.Executor): Runs the file reads; the loop's default
+            executor when None.
+    """
+    send_blob(resp, result)
+    if resp.stream is not None:
+        resp.stream = _read_file(resp.stream, executor)
+
+
+def decode_blob(content: bytes, annotation):
+    """
+    Convert a raw reply body into the method's return annotation.
+
+    Args:
+        content (bytes): The reply body.
+        annotation (type): The return annotation.
+
+    Returns:
+        bytes | bytearray | memoryview | io.BytesIO: The result.
+    """
+    if annotation is memoryview:
+        return memoryview(content)
+    if annotation is bytearray:
+        return bytearray(content)
+    if _is_file_type(annotation):
+        return io.BytesIO(content)
+    return content
@@ -0,0 +1,148 @@
+"""
+CircuitBreaker Module
+
+This module defines the circuit breaker guarding each WebReceptacle connection. When a
+sink component is slow or down, the breaker opens after a run of failed or slow calls and
+subsequent calls fail immediately with CircuitOpenException instead of blocking a thread
+on the network. After a reset period one trial call is let through (half-open); its
+outcome closes the breaker again or re-opens it.
+
+Classes:
+    CircuitOpenException: Raised for calls rejected while the breaker is open.
+    CircuitBreaker: Closed / open / half-open state machine for one connection.
+
+Author: Paul Grace
+"""
+
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+# Exception raised when a call is rejected by an open circuit breaker.
+class CircuitOpenException(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one receptacle connection.
+
+    Attributes:
+        failure_threshold (int): Consecutive failed or slow calls that open the breaker.
+        latency_threshold (float): Call duration in seconds counted as a failure, or None.
+        reset_timeout (float): Seconds the breaker stays open before a trial call.
+        state (str): "closed", "open" or "half_open".
+        listener (callable): Called with the new state on every transition, or None.
+    """
+
+    def __init__(self, failure_threshold: int = 5, latency_threshold: float = None,
+                 reset_timeout: float = 10.0, listener=None):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker.
+            latency_threshold (float): Seconds above which a call counts as failed.
+            reset_timeout (float): Seconds to wait before the half-open trial call.
+            listener (callable): Notified with the new state on each transition.
+        """
+        self.failure_threshold = failure_threshold
+        self.latency_threshold = latency_threshold
+        self.reset_timeout = reset_timeout
+        self.listener = listener
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial = False
+        self.lock = threading.Lock()
+
+    def configure(self, failure_threshold: int = None, latency_threshold: float = None,
+                  reset_timeout: float = None) -> None:
+        """
+        Change the thresholds. None leaves a setting unchanged.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker.
+            latency_threshold (float): Seconds above which a call counts as failed.
+            reset_timeout (float): Seconds to wait before the half-open trial call.
+        """
+        if failure_threshold is not None:
+            self.failure_threshold = max(int(failure_threshold), 1)
+        if latency_threshold is not None:
+            self.latency_threshold = float(latency_threshold)
+        if reset_timeout is not None:
+            self.reset_timeout = float(reset_timeout)
+
+    def allow(self) -> None:
+        """
+        Admit a call or reject it.
+
+        Raises:
+            CircuitOpenException: If the breaker is open, or half-open with the trial call
+                already in flight.
+        """
+        with self.lock:
+            if self.state == CLOSED:
+                return
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenException("Circuit open: sink component is unavailable")
+                self._transition(HALF_OPEN)
+            if self.trial:
+                raise CircuitOpenException("Circuit half-open: trial call in progress")
+            self.trial = True
+
+    def record(self, latency: float, ok: bool) -> None:
+        """
+        Record the outcome of an admitted call.
+
+        Args:
+            latency (float): Call duration in seconds.
+            ok (bool): False if the call failed.
+        """
+        if ok and self.latency_threshold is not None and latency > self.latency_threshold:
+            ok = False
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.trial = False
+                if ok:
+                    self.failures = 0
+                    self._transition(CLOSED)
+                else:
+                    self._open()
+            elif ok:
+                self.failures = 0
+            else:
+                self.failures += 1
+                if self.state == CLOSED and self.failures >= self.failure_threshold:
+                    self._open()
+
+    def cancel(self) -> None:
+        """
+        Give back an admitted call that was never sent, without recording an outcome, so
+        a half-open breaker can admit another trial call.
+        """
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.trial = False
+
+    def reset(self) -> None:
+        """Close the breaker and forget past failures."""
+        with self.lock:
+            self.failures = 0
+            self.trial = False
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+
+    def _open(self):
+        self.opened_at = time.monotonic()
+        self._transition(OPEN)
+
+    def _transition(self, state):
+        self.state = state
+        if self.listener is not None:
+            self.listener(state)
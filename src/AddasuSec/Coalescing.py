@@ -0,0 +1,187 @@
+"""
+Coalescing Module
+
+This module collapses identical concurrent calls to a component into one execution
+("single flight"). When a call arrives while an identical one is still running, it does
+not run the method again: it waits for the running call and returns its result, or
+raises its error. Identical means the same method and arguments and, for methods keyed
+by principal, the same caller.
+
+Coalescing is opt-in per method: component methods decorated with
+AddasuSec.Component.coalesce, and the method names listed in the component's "Coalesce"
+attribute, which can be changed at runtime. Methods protected by role_required are
+always keyed by principal, so a caller never receives a result computed for another.
+Generator methods, whose results are consumed by one caller, and calls whose arguments
+are not hashable are never coalesced.
+
+A waiting call does not hold an admission slot (see AddasuSec.Admission) and gives up
+with 504 when its own deadline passes. Calls that shared another call's result are
+counted in the "CoalescedCalls" attribute.
+
+Classes:
+    SingleFlight: In-flight calls of one component and the callers waiting on them.
+
+Author: Paul Grace
+"""
+
+import asyncio
+import threading
+import time
+import falcon
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _freeze(value):
+    # Lists and dicts decoded from a request body become hashable tuples, tagged with
+    # their type so that e.g. a dict and a list of pairs never share a key
+    if isinstance(value, dict):
+        return ("d", tuple(sorted(((key, _freeze(item)) for key, item in value.items()), key=repr)))
+    if isinstance(value, (list, tuple)):
+        return ("l" if isinstance(value, list) else "t", tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return ("s", frozenset(_freeze(item) for item in value))
+    return value
+
+
+def _wait_timeout():
+    return falcon.HTTPGatewayTimeout(title="Deadline Exceeded",
+                                     description="The call's deadline passed while it waited for an identical call")
+
+
+class SingleFlight:
+    """
+    In-flight calls of one component. Synchronous servers call run(), ASGI servers
+    run_async(); the two keep separate flights.
+
+    Attributes:
+        wrapper (WebComponent | WebServerComponent): The component served; its attributes
+            list the coalesced methods.
+        coalesced (int): Calls answered with the result of an identical call.
+    """
+
+    def __init__(self, wrapper):
+        """
+        Initialize with no call in flight.
+
+        Args:
+            wrapper (WebComponent | WebServerComponent): The component served.
+        """
+        self.wrapper = wrapper
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.tasks = {}
+        self.coalesced = 0
+
+    def key(self, entry, req, args):
+        """
+        Return the coalescing key of a call: the method name, its arguments and, for
+        methods keyed by principal, the caller's identity and role.
+
+        Args:
+            entry (DispatchEntry): The method's dispatch entry.
+            req (falcon.Request): The incoming request.
+            args (list): Converted method arguments.
+
+        Returns:
+            tuple: The key, or None if the call is not to be coalesced.
+        """
+        if entry.is_generator:
+            return None
+        if not entry.coalesce:
+            listed = self.wrapper.attribute("Coalesce")
+            if not listed or entry.name not in listed:
+                return None
+        principal = None
+        if entry.auth_required or entry.coalesce_by_principal:
+            user = getattr(req.context, "user", None) or {}
+            principal = (user.get("user_id"), user.get("role"))
+        key = (entry.name, _freeze(args), principal)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def record(self):
+        with self.lock:
+            self.coalesced += 1
+            coalesced = self.coalesced
+        if self.wrapper.meta is not None:
+            self.wrapper.meta.setComponentAttributeValue(self.wrapper.label, "CoalescedCalls", coalesced)
+
+    def run(self, key, call, deadline: float = None):
+        """
+        Run a call, or wait for the identical call in flight and share its outcome.
+
+        Args:
+            key (tuple): The call's coalescing key.
+            call (callable): Runs the call; invoked only if no identical call is in flight.
+            deadline (float): Seconds since the epoch after which a waiting call gives up.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            falcon.HTTPGatewayTimeout: If the deadline passed while waiting.
+        """
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = _Flight()
+        if leader:
+            try:
+                flight.result = call()
+                return flight.result
+            except Exception as e:
+                flight.error = e
+                raise
+            finally:
+                with self.lock:
+                    del self.flights[key]
+                flight.done.set()
+        self.record()
+        timeout = None if deadline is None else max(0.0, deadline - time.time())
+        if not flight.done.wait(timeout):
+            raise _wait_timeout()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    async def run_async(self, key, call, deadline: float = None):
+        """
+        Run a call on the event loop, or await the identical call in flight. The call runs
+        as a task of its own, so it completes for the other callers even if the caller
+        that started it goes away.
+
+        Args:
+            key (tuple): The call's coalescing key.
+            call (callable): Returns the call's coroutine; invoked only if no identical
+                call is in flight.
+            deadline (float): Seconds since the epoch after which a waiting call gives up.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            falcon.HTTPGatewayTimeout: If the deadline passed while waiting.
+        """
+        task = self.tasks.get(key)
+        if task is None:
+            task = self.tasks[key] = asyncio.ensure_future(call())
+            task.add_done_callback(lambda done: self.tasks.pop(key, None))
+            return await asyncio.shield(task)
+        self.record()
+        timeout = None if deadline is None else max(0.0, deadline - time.time())
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            if task.done():
+                return task.result()
+            raise _wait_timeout()
@@ -11,7 +11,7 @@ License: MIT
 """
 
 from AddasuSec.Receptacle import Receptacle
-import inspect
+from AddasuSec.RequestContext import request_token
 
 def data_storage_method(func):
     """
@@ -39,6 +39,50 @@ def stakeholder_io_method(func):
     func.is_data_storage = True
     return func
 
+def cacheable(ttl=None):
+    """
+    Decorator that marks an interface method as pure, so remote callers may serve
+    repeated calls with the same arguments from their result cache.
+
+    Args:
+        ttl (float): Seconds a cached result stays valid, or None to keep it until the
+            connection is rebound or the entry is evicted.
+
+    Returns:
+        callable: Decorator adding the cache attributes to the function.
+    """
+    def decorator(func):
+        func.is_cacheable = True
+        func.cache_ttl = ttl
+        return func
+    return decorator
+
+def idempotent(func):
+    """
+    Decorator that marks an interface method as idempotent, so remote callers may send a
+    hedged duplicate request when the first one is slow.
+    """
+    func.is_idempotent = True
+    return func
+
+def coalesce(by_principal=False):
+    """
+    Decorator that marks a component method whose identical concurrent calls may share one
+    execution and its result (see AddasuSec.Coalescing).
+
+    Args:
+        by_principal (bool): Only share results between calls from the same principal.
+            Methods protected by role_required always are.
+
+    Returns:
+        callable: Decorator adding the coalescing attributes to the function.
+    """
+    def decorator(func):
+        func.is_coalesced = True
+        func.coalesce_by_principal = by_principal
+        return func
+    return decorator
+
 class Component():
     """
     Represents a software component with explicitly defined dependencies (receptacles).
@@ -63,25 +107,24 @@ class Component():
         return func(token, *args, **kwargs)
     
     def receptacle_with_token(self, func, *args, **kwargs):
-        stack = inspect.stack()
-        previous_frame = stack[2].frame
-        # Get local variables (including parameters) from that frame
-        prev_args = previous_frame.f_locals
-        print("Previous call's arguments:", prev_args)
-    
-        return func(prev_args['req'], *args, **kwargs)
+        # Forward the bearer token of the request being served (see AddasuSec.RequestContext)
+        return func(request_token(), *args, **kwargs)
 
-    def getReceptacle(self, r_type):
+    def getReceptacle(self, r_type, asynchronous=False):
         """
         Get the connected component instance for a given receptacle type.
 
         Args:
             r_type (str): The name of the receptacle.
+            asynchronous (bool): Return an awaitable proxy of a web receptacle, whose
+                methods are coroutines, instead of the synchronous connection.
 
         Returns:
             object: The connected component instance, or None if not connected.
         """
         rp = self.receptacles.get(r_type)
+        if asynchronous:
+            return rp.asyncProxy()
         return rp._Comp
 
     def setWrapper(self, c_inst):
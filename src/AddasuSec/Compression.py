@@ -0,0 +1,208 @@
+"""
+Compression Module
+
+This module compresses the replies of component servers for clients that accept it and
+decompresses compressed request bodies. CompressionMiddleware is installed on the falcon
+App of every WebComponent and WebServerComponent:
+
+    - a reply body of at least "CompressionThreshold" bytes is compressed with gzip or
+      deflate, whichever the client lists first in Accept-Encoding, at "CompressionLevel"
+      (1-9; 0 disables compression). Streamed and file replies are sent as they are;
+    - a request body sent with Content-Encoding gzip or deflate is decompressed before the
+      call is dispatched, up to the component's "MaxBodySize" attribute.
+
+Both attributes are read from the component's meta attributes on every request, so they
+can be tuned while the component runs. The middleware also serves falcon.asgi apps
+(AsgiWebComponent) through its *_async hooks. WebReceptacle connections advertise gzip and
+deflate on every request and decompress replies transparently.
+
+Classes:
+    CompressionMiddleware: falcon middleware compressing replies and inflating requests.
+
+Functions:
+    accepted_encoding: Pick the reply encoding from an Accept-Encoding header.
+    compress: Compress a body with an encoding.
+
+Author: Paul Grace
+"""
+
+import gzip
+import io
+import zlib
+import falcon
+from AddasuSec.Blobs import DEFAULT_MAX_BODY_SIZE
+
+DEFAULT_COMPRESSION_LEVEL = 6
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "x-gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def accepted_encoding(accept_encoding: str) -> str:
+    """
+    Pick the encoding of a reply from the client's Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): The header, or None.
+
+    Returns:
+        str: "gzip" or "deflate", whichever is listed first and not refused with q=0, or
+        None if the client accepts neither.
+    """
+    if not accept_encoding:
+        return None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding in ("gzip", "deflate"):
+            q = params.strip()
+            try:
+                if q.startswith("q=") and float(q[2:] or 0) == 0:
+                    continue
+            except ValueError:
+                continue
+            return coding
+    return None
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """
+    Compress a body.
+
+    Args:
+        data (bytes): The body.
+        encoding (str): "gzip" or "deflate" (zlib format, as HTTP defines it).
+        level (int): Compression level from 1 (fastest) to 9 (smallest).
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    return zlib.compress(data, level)
+
+
+def _inflate(data: bytes, encoding: str, limit: int) -> bytes:
+    wbits = _WBITS[encoding]
+    try:
+        inflater = zlib.decompressobj(wbits)
+        body = inflater.decompress(data, limit + 1)
+    except zlib.error:
+        if encoding != "deflate":
+            raise
+        # Some clients send raw deflate data without the zlib header
+        inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        body = inflater.decompress(data, limit + 1)
+    if len(body) > limit:
+        raise falcon.HTTPContentTooLarge(description=f"Decompressed body exceeds {limit} bytes")
+    return body
+
+
+class _InflatedStream:
+    # Async stream over a decompressed request body, standing in for falcon.asgi's stream
+    def __init__(self, body: bytes):
+        self.body = io.BytesIO(body)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self.body.read(size)
+
+    async def readall(self) -> bytes:
+        return self.body.read()
+
+    async def exhaust(self) -> None:
+        self.body.seek(0, io.SEEK_END)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        chunk = self.body.read(65536)
+        if not chunk:
+            raise StopAsyncIteration
+        return chunk
+
+
+class CompressionMiddleware:
+    """
+    falcon middleware compressing replies and decompressing request bodies.
+
+    Attributes:
+        component (WebComponent | WebServerComponent): The wrapper whose meta attributes
+            configure compression.
+    """
+
+    def __init__(self, component):
+        self.component = component
+
+    def setting(self, name: str, default: int) -> int:
+        """Return a compression attribute of the component, or its default."""
+        value = self.component.attribute(name)
+        return default if value is None else int(value)
+
+    def _request_encoding(self, req):
+        encoding = req.get_header("Content-Encoding")
+        if not encoding or encoding.strip().lower() == "identity":
+            return None, None
+        encoding = encoding.strip().lower()
+        if encoding not in _WBITS:
+            raise falcon.HTTPUnsupportedMediaType(description=f"Unsupported Content-Encoding {encoding}")
+        length = req.content_length
+        if not length:
+            return None, None
+        limit = self.setting("MaxBodySize", DEFAULT_MAX_BODY_SIZE)
+        if length > limit:
+            raise falcon.HTTPContentTooLarge(description=f"Body exceeds {limit} bytes")
+        return encoding, limit
+
+    def _inflate_request(self, data, encoding, limit):
+        try:
+            return _inflate(data, encoding, limit)
+        except zlib.error as e:
+            raise falcon.HTTPBadRequest(description=f"Malformed {encoding} body: {e}")
+
+    def process_request(self, req, resp):
+        encoding, limit = self._request_encoding(req)
+        if encoding is None:
+            return
+        body = self._inflate_request(req.stream.read(req.content_length), encoding, limit)
+        # Present the inflated body to the rest of the request as if it had been sent plain
+        req.stream = req.env["wsgi.input"] = io.BytesIO(body)
+        req.env["CONTENT_LENGTH"] = str(len(body))
+        req.env.pop("HTTP_CONTENT_ENCODING", None)
+
+    async def process_request_async(self, req, resp):
+        encoding, limit = self._request_encoding(req)
+        if encoding is None:
+            return
+        body = self._inflate_request(await req.stream.read(req.content_length), encoding, limit)
+        # falcon.asgi creates the stream lazily; put the inflated body in its place
+        req._stream = _InflatedStream(body)
+
+    def _reply_encoding(self, req, resp):
+        if resp.stream is not None or resp.get_header("Content-Encoding"):
+            return None, None
+        encoding = accepted_encoding(req.get_header("Accept-Encoding"))
+        if encoding is None:
+            return None, None
+        level = self.setting("CompressionLevel", DEFAULT_COMPRESSION_LEVEL)
+        if level <= 0:
+            return None, None
+        return encoding, level
+
+    def _compress_reply(self, resp, body, encoding, level):
+        if body is None or len(body) < self.setting("CompressionThreshold", DEFAULT_COMPRESSION_THRESHOLD):
+            return
+        resp.text = None
+        resp.data = compress(body, encoding, min(level, 9))
+        resp.set_header("Content-Encoding", encoding)
+        resp.append_header("Vary", "Accept-Encoding")
+
+    def process_response(self, req, resp, resource, req_succeeded):
+        encoding, level = self._reply_encoding(req, resp)
+        if encoding is not None:
+            self._compress_reply(resp, resp.render_body(), encoding, level)
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        encoding, level = self._reply_encoding(req, resp)
+        if encoding is not None:
+            self._compress_reply(resp, await resp.render_body(), encoding, level)
@@ -0,0 +1,228 @@
+"""
+Deadline Module
+
+This module bounds how long a chain of remote calls may take. A deadline is an absolute
+point in time held in a contextvars.ContextVar; code sets one with the deadline() context
+manager, and every WebReceptacle call made under it:
+
+    - fails with DeadlineExceededException, without sending anything, once it has passed;
+    - uses the time left as its HTTP timeout when that is shorter than the edge's timeout;
+    - sends the deadline in the X-Deadline header (seconds since the epoch).
+
+The component servers read the header, reject the call with 504 if it expired while the
+request was queued, and make it the active deadline while the method runs, so nested
+receptacle calls inherit it. Calls made without a deadline still send one, computed from
+the edge's timeout, so the server never works on a call its client has given up on.
+Deadlines are compared with the wall clock across hosts, which therefore need
+synchronised clocks.
+
+Each receptacle derives its per-method timeout from the latencies it observes
+(AdaptiveTimeout): a multiple of a high latency percentile, kept between a floor and the
+static "Timeout" receptacle attribute.
+
+Classes:
+    DeadlineExceededException: Raised when a call's deadline has passed.
+    AdaptiveTimeout: Per-method timeouts derived from latency percentiles.
+
+Functions:
+    deadline: Context manager bounding the calls made inside it.
+    current_deadline: Return the active deadline, or None.
+    remaining: Seconds left before the active deadline, or None.
+    bind_deadline: Make a deadline active.
+    reset_deadline: Restore the deadline active before bind_deadline.
+    request_deadline: Read the deadline of a falcon request, rejecting expired calls.
+    reject_expired: Reject a call whose deadline has passed.
+
+Author: Paul Grace
+"""
+
+import collections
+import contextlib
+import contextvars
+import time
+import falcon
+from AddasuSec.Hedging import _percentile
+
+DEADLINE_HEADER = "X-Deadline"
+
+_deadline = contextvars.ContextVar("addasusec_deadline", default=None)
+
+
+# Exception raised when a call's deadline has passed.
+class DeadlineExceededException(Exception):
+    pass
+
+
+def current_deadline() -> float:
+    """
+    Return the active deadline.
+
+    Returns:
+        float: Deadline in seconds since the epoch, or None if none is set.
+    """
+    return _deadline.get()
+
+
+def remaining() -> float:
+    """
+    Return the time left before the active deadline.
+
+    Returns:
+        float: Seconds left (negative once expired), or None if no deadline is set.
+    """
+    value = _deadline.get()
+    return None if value is None else value - time.time()
+
+
+def bind_deadline(value: float) -> contextvars.Token:
+    """
+    Make a deadline active; an earlier active deadline is kept.
+
+    Args:
+        value (float): Deadline in seconds since the epoch, or None.
+
+    Returns:
+        contextvars.Token: Handle to pass to reset_deadline.
+    """
+    active = _deadline.get()
+    if active is not None and (value is None or active < value):
+        value = active
+    return _deadline.set(value)
+
+
+def reset_deadline(handle: contextvars.Token) -> None:
+    """
+    Restore the deadline that was active before the matching bind_deadline.
+
+    Args:
+        handle (contextvars.Token): The value returned by bind_deadline.
+    """
+    _deadline.reset(handle)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float):
+    """
+    Bound every receptacle call made inside the with-block, including the calls the sinks
+    make in turn, to finish within a number of seconds.
+
+    Args:
+        seconds (float): Time budget from now.
+    """
+    handle = bind_deadline(time.time() + seconds)
+    try:
+        yield
+    finally:
+        reset_deadline(handle)
+
+
+def request_deadline(req: falcon.Request) -> float:
+    """
+    Read the deadline sent with a call and reject the call if it has already passed.
+
+    Args:
+        req (falcon.Request): The incoming request.
+
+    Returns:
+        float: The deadline in seconds since the epoch, or None if the request has none.
+
+    Raises:
+        falcon.HTTPGatewayTimeout: If the deadline passed before the call was dispatched.
+    """
+    value = req.get_header(DEADLINE_HEADER)
+    if value is None:
+        return None
+    try:
+        value = float(value)
+    except ValueError:
+        raise falcon.HTTPBadRequest(description=f"Malformed {DEADLINE_HEADER} header")
+    reject_expired(value)
+    return value
+
+
+def reject_expired(expires: float) -> None:
+    """
+    Reject a call whose deadline has passed.
+
+    Args:
+        expires (float): The deadline in seconds since the epoch, or None.
+
+    Raises:
+        falcon.HTTPGatewayTimeout: If the deadline has passed.
+    """
+    if expires is not None and expires <= time.time():
+        raise falcon.HTTPGatewayTimeout(title="Deadline Exceeded",
+                                        description="The call's deadline passed before it was served")
+
+
+class AdaptiveTimeout:
+    """
+    Per-method timeouts of one connection, derived from the latencies observed on it.
+
+    Attributes:
+        percentile (float): Latency percentile (0-100) the timeout is based on.
+        factor (float): Multiple of the percentile latency allowed.
+        floor (float): Shortest timeout ever used, in seconds.
+        min_samples (int): Latencies of a method observed before its timeout adapts.
+    """
+
+    def __init__(self, percentile: float = 99.0, factor: float = 3.0, floor: float = 1.0,
+                 min_samples: int = 50, window: int = 512):
+        """
+        Initialize the policy.
+
+        Args:
+            percentile (float): Latency percentile the timeout is based on.
+            factor (float): Multiple of the percentile latency allowed.
+            floor (float): Shortest timeout in seconds.
+            min_samples (int): Latencies observed before a method's timeout adapts.
+            window (int): Number of recent latencies kept per method.
+        """
+        self.percentile = percentile
+        self.factor = factor
+        self.floor = floor
+        self.min_samples = min_samples
+        self.window = window
+        self.latencies = {}
+        self.counts = collections.Counter()
+        self.timeouts = {}
+
+    def record(self, name: str, latency: float) -> None:
+        """
+        Record the latency of a successful call and refresh the method's timeout.
+
+        Args:
+            name (str): Method name.
+            latency (float): Call duration in seconds.
+        """
+        window = self.latencies.get(name)
+        if window is None:
+            window = self.latencies.setdefault(name, collections.deque(maxlen=self.window))
+        window.append(latency)
+        self.counts[name] += 1
+        # Recompute periodically rather than sorting the window on every call
+        if len(window) >= self.min_samples and (self.counts[name] % 16 == 0 or name not in self.timeouts):
+            self.timeouts[name] = max(self.floor, _percentile(window, self.percentile) * self.factor)
+
+    def timeout(self, name: str, ceiling: float) -> float:
+        """
+        Return the timeout of a method.
+
+        Args:
+            name (str): Method name.
+            ceiling (float): The connection's static timeout, never exceeded.
+
+        Returns:
+            float: Seconds; the ceiling until enough latencies have been observed.
+        """
+        value = self.timeouts.get(name)
+        return ceiling if value is None or value > ceiling else value
+
+    def stats(self) -> dict:
+        """
+        Return the adapted timeouts.
+
+        Returns:
+            dict: Method name to timeout in seconds.
+        """
+        return dict(self.timeouts)
@@ -0,0 +1,223 @@
+"""
+Dispatch Module
+
+This module compiles the dispatch entries the component servers use to serve calls. An
+entry is built once per routed method when the runtime registers its route, and holds
+everything on_post needs, so serving a call costs a dictionary lookup rather than
+reflecting over the component:
+
+    - the bound method and its signature;
+    - a converter per parameter reading it from the query string;
+    - a decoder per parameter converting body arguments (see AddasuSec.TypeCodec);
+    - whether the method is a coroutine function;
+    - whether it requires authorization (decorated with role_required), in which case the
+      request is passed as its first argument;
+    - whether identical concurrent calls are coalesced (decorated with coalesce, see
+      AddasuSec.Coalescing).
+
+Classes:
+    DispatchEntry: Precompiled call information of one routed method.
+
+Functions:
+    compile_dispatch: Build the dispatch entry of a component method.
+    query_converter: Build the function reading one typed query-string parameter.
+
+Author: Paul Grace
+"""
+
+import asyncio
+import datetime
+import inspect
+import json
+import uuid
+import falcon
+from AddasuSec.TypeCodec import compile_decoder
+
+
+def _parse_query(name, param_type, parse):
+    def convert(req):
+        raw = req.get_param(name)
+        try:
+            return parse(raw)
+        except (ValueError, json.JSONDecodeError):
+            raise TypeError(f"Could not convert parameter '{name}' to type: {param_type.__name__}")
+    return convert
+
+
+def query_converter(name: str, param_type: type):
+    """
+    Build the function reading one typed parameter from a request's query string.
+
+    Args:
+        name (str): Parameter name.
+        param_type (type): Annotated type; str for unannotated parameters.
+
+    Returns:
+        callable: Takes a falcon.Request and returns the converted value. For types the
+        query string cannot carry it raises TypeError when called.
+    """
+    if param_type is str:
+        return lambda req: req.get_param(name)
+    if param_type is int:
+        return lambda req: req.get_param_as_int(name)
+    if param_type is float:
+        return lambda req: req.get_param_as_float(name)
+    if param_type is bool:
+        return lambda req: req.get_param_as_bool(name)
+    if param_type is datetime.date:
+        return _parse_query(name, param_type, datetime.date.fromisoformat)
+    if param_type is uuid.UUID:
+        return _parse_query(name, param_type, uuid.UUID)
+    if param_type is dict:
+        return _parse_query(name, param_type, json.loads)
+
+    def unsupported(req):
+        raise TypeError(f"Unsupported type: {getattr(param_type, '__name__', param_type)}")
+    return unsupported
+
+
+def _body_decoder(annotation):
+    try:
+        return compile_decoder(annotation)
+    except TypeError:
+        # Not decodable from a body; the method can still be called with query arguments
+        def unsupported(value):
+            raise TypeError(f"Unsupported argument type: {annotation}")
+        return unsupported
+
+
+class DispatchEntry:
+    """
+    Precompiled call information of one routed component method.
+
+    Attributes:
+        name (str): Method name.
+        method (callable): The bound method of the inner component.
+        signature (inspect.Signature): The method's signature.
+        is_async (bool): True if the method, or the function it decorates, is a coroutine
+            function.
+        auth_required (bool): True if the method is protected by role_required and takes
+            the request as its first argument.
+        is_generator (bool): True if the method is a generator, whose results are streamed.
+        coalesce (bool): True if the method is decorated with coalesce.
+        coalesce_by_principal (bool): True if coalesced calls are keyed by the caller.
+    """
+
+    __slots__ = ("name", "method", "signature", "is_async", "auth_required", "is_generator",
+                 "coalesce", "coalesce_by_principal", "converters", "decoders")
+
+    def __init__(self, name: str, method):
+        """
+        Compile the entry.
+
+        Args:
+            name (str): Method name.
+            method (callable): The bound method.
+        """
+        self.name = name
+        self.method = method
+        self.signature = inspect.signature(method)
+        # role_required wraps coroutine functions in a plain function returning the coroutine
+        func = inspect.unwrap(method)
+        self.is_async = inspect.iscoroutinefunction(func)
+        self.auth_required = bool(getattr(method, "_is_role_required", False))
+        self.is_generator = inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func)
+        self.coalesce = bool(getattr(method, "is_coalesced", False))
+        self.coalesce_by_principal = bool(getattr(method, "coalesce_by_principal", False))
+        self.converters = {}
+        self.decoders = []
+        for param_name, param in self.signature.parameters.items():
+            annotation = param.annotation
+            self.converters[param_name] = query_converter(
+                param_name, annotation if annotation is not inspect.Parameter.empty else str)
+            self.decoders.append((param_name, _body_decoder(annotation)))
+
+    def query_arguments(self, req: falcon.Request) -> list:
+        """
+        Read the arguments of a call from the query string.
+
+        Args:
+            req (falcon.Request): The incoming request.
+
+        Returns:
+            list: Arguments in declaration order.
+        """
+        return [convert(req) for convert in self.converters.values()]
+
+    def read_param(self, req: falcon.Request):
+        """
+        Return a reader of single query-string parameters, as AddasuSec.Blobs expects.
+
+        Args:
+            req (falcon.Request): The incoming request.
+
+        Returns:
+            callable: Takes a parameter name and annotation and returns the value.
+        """
+        converters = self.converters
+        return lambda name, annotation: converters[name](req)
+
+    def body_arguments(self, params: dict) -> list:
+        """
+        Convert arguments decoded from a request body.
+
+        Args:
+            params (dict): Parameter name to decoded wire value.
+
+        Returns:
+            list: Arguments in declaration order; missing parameters are None.
+        """
+        args = []
+        for name, decode in self.decoders:
+            value = params.get(name)
+            args.append(None if value is None else decode(value))
+        return args
+
+    def call(self, req: falcon.Request, args: list):
+        """
+        Call the method, passing the request first when it requires authorization.
+
+        Args:
+            req (falcon.Request): The incoming request.
+            args (list): Converted arguments.
+
+        Returns:
+            Any: The method's result; a coroutine for async methods.
+        """
+        if self.auth_required:
+            return self.method(req, *args)
+        return self.method(*args)
+
+    def invoke(self, req: falcon.Request, args: list):
+        """
+        Call the method and, for async methods, run the coroutine to completion on a new
+        event loop.
+
+        Args:
+            req (falcon.Request): The incoming request.
+            args (list): Converted arguments.
+
+        Returns:
+            Any: The method's result.
+        """
+        result = self.call(req, args)
+        if self.is_async:
+            return asyncio.run(result)
+        return result
+
+
+def compile_dispatch(component, name: str) -> DispatchEntry:
+    """
+    Build the dispatch entry of a component method.
+
+    Args:
+        component (object): The inner component.
+        name (str): Method name.
+
+    Returns:
+        DispatchEntry: The entry, or None if the component has no such method.
+    """
+    method = getattr(component, name, None)
+    if not callable(method):
+        return None
+    return DispatchEntry(name, method)
@@ -0,0 +1,116 @@
+"""
+Hedging Module
+
+This module implements hedged requests for idempotent interface methods. When the first
+request of a call has not answered after a delay taken from a percentile of recently
+observed latencies, a second request is sent (to another replica when the receptacle has
+several, otherwise to the same Host) and whichever reply arrives first is used. A hedging
+budget caps hedges at a fraction of the hedgeable calls, so a slow sink is never sent
+twice its normal load.
+
+Both requests of a hedged call run on the client event loop of AddasuSec.AsyncWebReceptacle,
+also for synchronous callers, which wait for the winning reply. A hedgeable call
+therefore holds no thread while in flight, and the losing request is cancelled outright.
+
+Classes:
+    HedgingPolicy: Latency window, hedge delay and budget of one connection.
+
+Author: Paul Grace
+"""
+
+import collections
+import threading
+
+# Latencies recorded between two recomputations of the hedge delay
+REFRESH_INTERVAL = 16
+
+
+def _percentile(values, percentile):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * percentile / 100.0), len(ordered) - 1)]
+
+
+class HedgingPolicy:
+    """
+    Decides when a call is hedged.
+
+    Attributes:
+        percentile (float): Latency percentile (0-100) used as the hedge delay.
+        budget (float): Maximum ratio of hedges to hedgeable calls.
+        min_samples (int): Latencies observed before any call is hedged.
+        calls (int): Hedgeable calls seen.
+        hedges (int): Hedged requests sent.
+        hedge_wins (int): Calls answered first by the hedged request.
+    """
+
+    def __init__(self, percentile: float = 95.0, budget: float = 0.05,
+                 min_samples: int = 20, window: int = 512):
+        """
+        Initialize the policy.
+
+        Args:
+            percentile (float): Latency percentile used as the hedge delay.
+            budget (float): Maximum ratio of hedges to hedgeable calls, e.g. 0.05 for 5%.
+            min_samples (int): Latencies observed before hedging starts.
+            window (int): Number of recent latencies kept.
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.latencies = collections.deque(maxlen=window)
+        self.recorded = 0
+        self.current = None
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Add the latency of a completed request to the window."""
+        with self.lock:
+            self.latencies.append(latency)
+            self.recorded += 1
+            # Recompute periodically rather than sorting the window on every call
+            if len(self.latencies) >= self.min_samples and (
+                    self.current is None or self.recorded % REFRESH_INTERVAL == 0):
+                self.current = _percentile(self.latencies, self.percentile)
+
+    def delay(self):
+        """
+        Count a hedgeable call and return how long to wait before hedging it.
+
+        Returns:
+            float: Seconds to wait, or None if too few latencies have been observed.
+        """
+        with self.lock:
+            self.calls += 1
+            return self.current
+
+    def spend(self) -> bool:
+        """
+        Take one hedge from the budget.
+
+        Returns:
+            bool: True if the hedge may be sent.
+        """
+        with self.lock:
+            if self.hedges + 1 > self.budget * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+    def won(self) -> None:
+        """Record that a hedged request answered first."""
+        with self.lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> dict:
+        """
+        Return the hedging counters.
+
+        Returns:
+            dict: calls, hedges, hedge_wins and the current delay in seconds.
+        """
+        with self.lock:
+            return {"calls": self.calls, "hedges": self.hedges,
+                    "hedge_wins": self.hedge_wins, "delay": self.current}
@@ -0,0 +1,217 @@
+"""
+InterfaceStub Module
+
+This module compiles client-side stubs for component interfaces. A stub class is
+generated once per interface (e.g. "Examples.IAdd") and cached process-wide, so every
+WebReceptacle bound to the same interface shares it. Each generated method carries a
+precomputed MethodSpec (parameter order and a typed result decoder compiled by
+AddasuSec.TypeCodec); the stub instance bound to each sink holds the endpoint URL of every
+method. A remote call therefore costs a dictionary lookup plus the HTTP request, with no
+reflection on the call path.
+
+Classes:
+    MethodSpec: Precomputed description of one interface method.
+    InterfaceStub: Base class of the generated stubs.
+
+Functions:
+    get_stub_class: Return the (cached) stub class for an interface name.
+
+Author: Paul Grace
+"""
+
+import collections.abc
+import importlib
+import inspect
+import threading
+import typing
+from AddasuSec.TypeCodec import compile_decoder, decode_result
+from AddasuSec.Blobs import blob_params, decode_blob, is_blob_type
+
+_stub_classes = {}
+_stub_lock = threading.Lock()
+
+# Return annotations whose results are streamed item by item (see AddasuSec.Streaming)
+_STREAM_ORIGINS = (collections.abc.Iterator, collections.abc.Iterable, collections.abc.Generator,
+                   collections.abc.AsyncIterator, collections.abc.AsyncIterable,
+                   collections.abc.AsyncGenerator)
+
+
+def _identity(value):
+    return value
+
+
+class MethodSpec:
+    """
+    Precomputed call information for a single interface method.
+
+    Attributes:
+        name (str): Method name, also the last segment of the endpoint URL.
+        params (list[str]): Parameter names in declaration order (excluding self).
+        return_type (type): The declared return annotation.
+        decoder (callable): Converts the JSON "result" value into the return type.
+        cacheable (bool): True if the method was marked with AddasuSec.Component.cacheable.
+        cache_ttl (float): Lifetime of cached results in seconds, or None for no expiry.
+        idempotent (bool): True if the method may be hedged; cacheable methods always are.
+        streaming (bool): True if the method returns an iterator whose items are streamed.
+        item_decoder (callable): Converts one streamed item into the iterator's item type.
+        blobs (list[str]): Parameters sent as the raw or multipart body (see AddasuSec.Blobs).
+        blob_result (bool): True if the result is returned as a raw binary body.
+    """
+
+    def __init__(self, name: str, func):
+        """
+        Build the spec from the interface's function object.
+
+        Args:
+            name (str): The method name.
+            func (function): The function defined on the interface class.
+        """
+        sig = inspect.signature(func)
+        self.name = name
+        self.params = [p for p in sig.parameters if p != "self"]
+        self.return_type = sig.return_annotation
+        origin = typing.get_origin(self.return_type) or self.return_type
+        self.streaming = origin in _STREAM_ORIGINS
+        self.blobs = blob_params(sig)
+        self.blob_result = is_blob_type(self.return_type)
+        if self.blob_result:
+            self.item_decoder = _identity
+            self.decoder = _identity
+        elif self.streaming:
+            item_args = typing.get_args(self.return_type)
+            self.item_decoder = compile_decoder(item_args[0]) if item_args else _identity
+            self.decoder = _identity
+        else:
+            self.item_decoder = _identity
+            self.decoder = compile_decoder(self.return_type)
+        self.cacheable = getattr(func, "is_cacheable", False)
+        self.cache_ttl = getattr(func, "cache_ttl", None)
+        self.idempotent = getattr(func, "is_idempotent", False) or self.cacheable
+
+    def bind(self, args: tuple, kwargs: dict) -> dict:
+        """
+        Map positional and keyword arguments onto parameter names.
+
+        Args:
+            args (tuple): Positional arguments of the call.
+            kwargs (dict): Keyword arguments of the call.
+
+        Returns:
+            dict: Parameter name to value.
+
+        Raises:
+            TypeError: If too many positional arguments are given.
+        """
+        if len(args) > len(self.params):
+            raise TypeError(f"{self.name}() takes {len(self.params)} arguments but {len(args)} were given")
+        bound = dict(zip(self.params, args))
+        bound.update(kwargs)
+        return bound
+
+    def cache_key(self, params: dict, headers: dict = None):
+        """
+        Build the result-cache key of a call.
+
+        Args:
+            params (dict): Parameter name to value.
+            headers (dict): Request headers; the Authorization value is part of the key.
+
+        Returns:
+            tuple: The key, or None if an argument is not hashable.
+        """
+        key = (self.name, tuple(params.get(p) for p in self.params),
+               headers.get("Authorization") if headers else None)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def decode(self, content: bytes, codec=None):
+        """
+        Decode a reply body into the method's return type.
+
+        Args:
+            content (bytes): Raw response body.
+            codec (Codec): Wire codec of the body; JSON when None.
+
+        Returns:
+            Any: The typed result.
+        """
+        if self.blob_result and codec is None:
+            return decode_blob(content, self.return_type)
+        return decode_result(content, self.decoder, codec.loads if codec is not None else None)
+
+
+class InterfaceStub:
+    """
+    Base class for generated interface stubs. An instance is bound to one receptacle
+    and one sink URL.
+
+    Attributes:
+        receptacle (WebReceptacle): The connection that performs the calls.
+        endpoints (dict[str, str]): Method name to full endpoint URL.
+    """
+
+    iid = None
+    specs = {}
+
+    def __init__(self, receptacle, base_url: str):
+        """
+        Bind the stub to a receptacle and a sink.
+
+        Args:
+            receptacle (WebReceptacle): Connection used to issue the calls.
+            base_url (str): Sink URL ending in "/{label}/".
+        """
+        self.receptacle = receptacle
+        self.endpoints = {name: base_url + name for name in self.specs}
+
+
+def _make_method(spec: MethodSpec):
+    def method(self, *args, **kwargs):
+        return self.receptacle.invoke(spec, spec.bind(args, kwargs))
+    method.__name__ = spec.name
+    method.__qualname__ = spec.name
+    return method
+
+
+def _load_interface(iid: str) -> type:
+    module = importlib.import_module(iid)
+    cls = getattr(module, iid.split('.')[-1], None)
+    if cls is None:
+        raise NameError(f"Class '{iid}' not found in module '{iid}'")
+    if not isinstance(cls, type):
+        raise TypeError(f"'{iid}' is not a class. Got: {type(cls)}")
+    return cls
+
+
+def get_stub_class(iid: str) -> type:
+    """
+    Return the stub class for an interface, compiling it on first use.
+
+    Args:
+        iid (str): Fully qualified interface name, e.g. "Examples.IAdd".
+
+    Returns:
+        type: A subclass of InterfaceStub with one method per interface method.
+    """
+    stub = _stub_classes.get(iid)
+    if stub is not None:
+        return stub
+    with _stub_lock:
+        stub = _stub_classes.get(iid)
+        if stub is None:
+            intf = _load_interface(iid)
+            specs = {}
+            for name, raw in intf.__dict__.items():
+                if name.startswith("_"):
+                    continue
+                func = raw.__func__ if isinstance(raw, (staticmethod, classmethod)) else raw
+                if inspect.isfunction(func):
+                    specs[name] = MethodSpec(name, func)
+            attrs = {"iid": iid, "specs": specs}
+            attrs.update({name: _make_method(spec) for name, spec in specs.items()})
+            stub = type(f"{intf.__name__}Stub", (InterfaceStub,), attrs)
+            _stub_classes[iid] = stub
+    return stub
@@ -0,0 +1,262 @@
+"""
+LocalBinding Module
+
+This module short-circuits WebReceptacle calls to sink components served by the same
+Python process. When the meta architecture shows that the sink of a connection is a
+WebComponent created in this process and still hosted at the address it serves, the
+receptacle invokes the inner component directly instead of going through HTTP, the
+component server and the wire codec. This includes components mounted on a shared
+listener (see AddasuSec.SharedHost).
+
+Security is kept: if the sink is secure or the method is protected by role_required, the
+bearer token of the call is verified exactly as JWTAuthMiddleware and role_required would
+on the HTTP path, and the caller's principal and token are bound as the request context
+for calls the sink makes in turn. Arguments and results are passed by reference.
+
+Failures surface exactly as they do over HTTP, so callers do not depend on where the sink
+was placed: an error the sink raises, or its authorization refuses, becomes the
+requests.HTTPError (aiohttp.ClientResponseError from a coroutine) carrying the status the
+component server would have replied with, and 504 becomes DeadlineExceededException.
+
+Before every call the binding checks that the sink is still registered under its label and
+that its "Host" attribute is unchanged; once the sink is deleted or moved the receptacle
+transparently falls back to HTTP. A call is also sent over HTTP whenever the component
+server would treat it differently from a direct call: while the sink's "MaxConcurrency"
+attribute limits its concurrent calls (see AddasuSec.Admission), and for methods that are
+coalesced (see AddasuSec.Coalescing). The caller's deadline still applies to direct calls,
+which are refused once it has passed and which run with it bound. Components served by
+worker processes (see AddasuSec.Prefork) are always called over HTTP, so that calls reach
+the workers.
+
+Classes:
+    LocalBinding: Direct in-process binding of a receptacle to a co-located sink.
+
+Functions:
+    local_binding: Return a LocalBinding for a sink if it is co-located.
+
+Author: Paul Grace
+"""
+
+import asyncio
+import http
+import inspect
+import aiohttp
+import requests
+from falcon import HTTPError, HTTPInternalServerError, HTTPUnauthorized
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+from Runtimes.Auth.JWTUtils import decode_token
+from AddasuSec.RequestContext import bind_request, reset_request
+from AddasuSec.Deadline import DeadlineExceededException
+
+
+def _as_http_error(error):
+    # The falcon error the component server would have replied with
+    return error if isinstance(error, HTTPError) else HTTPInternalServerError()
+
+
+class LocalBinding:
+    """
+    Direct binding to a sink component living in this process.
+
+    Attributes:
+        wrapper (WebComponent): The sink's web wrapper.
+        label (str): The sink's component label.
+        host (str): The address the sink serves, e.g. "localhost:8001".
+        meta (MetaArchitecture): The architecture model the binding is checked against.
+    """
+
+    def __init__(self, wrapper, label: str, host: str, meta):
+        self.wrapper = wrapper
+        self.label = label
+        self.host = host
+        self.meta = meta
+
+    def active(self, name: str) -> bool:
+        """
+        Return True if a call of a method is made directly: the sink is still this
+        process's component at its original Host, no concurrency limit is set and the
+        method is not coalesced.
+
+        Args:
+            name (str): The method being called.
+        """
+        if (self.meta.getComponent(self.label) is not self.wrapper
+                or self.meta.getComponentAttributeValue(self.label, "Host") != self.host):
+            return False
+        if self.wrapper.attribute("MaxConcurrency"):
+            return False
+        if name in (self.wrapper.attribute("Coalesce") or ()):
+            return False
+        return not getattr(getattr(self.wrapper.innerComponent, name, None), "is_coalesced", False)
+
+    def url(self, spec) -> str:
+        return f"http://{self.host}/{self.label}/{spec.name}"
+
+    def http_error(self, spec, error) -> Exception:
+        """
+        Return the exception a synchronous HTTP call would raise for an error of the sink.
+
+        Args:
+            spec (MethodSpec): The interface method called.
+            error (Exception): The error raised by the sink or its authorization.
+
+        Returns:
+            Exception: requests.HTTPError, or DeadlineExceededException for 504.
+        """
+        error = _as_http_error(error)
+        if error.status_code == 504:
+            return DeadlineExceededException(f"Deadline of {self.url(spec)} passed at the sink")
+        response = requests.Response()
+        response.status_code = error.status_code
+        response.reason = http.HTTPStatus(error.status_code).phrase
+        response.url = self.url(spec)
+        response.headers["Content-Type"] = "application/json"
+        response._content = error.to_json()
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            return e
+        return requests.HTTPError(response=response)
+
+    def client_error(self, spec, error) -> Exception:
+        """
+        Return the exception an asynchronous HTTP call would raise for an error of the sink.
+
+        Args:
+            spec (MethodSpec): The interface method called.
+            error (Exception): The error raised by the sink or its authorization.
+
+        Returns:
+            Exception: aiohttp.ClientResponseError, or DeadlineExceededException for 504.
+        """
+        error = _as_http_error(error)
+        if error.status_code == 504:
+            return DeadlineExceededException(f"Deadline of {self.url(spec)} passed at the sink")
+        info = aiohttp.RequestInfo(URL(self.url(spec)), "POST", CIMultiDictProxy(CIMultiDict()))
+        return aiohttp.ClientResponseError(info, (), status=error.status_code,
+                                           message=http.HTTPStatus(error.status_code).phrase)
+
+    def prepare(self, spec, params: dict, headers: dict = None):
+        """
+        Resolve the sink method, authorize the call and bind its request context.
+
+        Args:
+            spec (MethodSpec): The interface method being called.
+            params (dict): Parameter name to value.
+            headers (dict): Request headers of the call; a bearer token is taken from them.
+
+        Returns:
+            tuple: The callable, its positional arguments and the request-context handle.
+
+        Raises:
+            HTTPUnauthorized: If the sink requires a token and none or an invalid one is given.
+        """
+        method = getattr(self.wrapper.innerComponent, spec.name)
+        protected = getattr(method, "_is_role_required", False)
+        token = None
+        if headers:
+            auth_header = headers.get("Authorization", "")
+            if auth_header[:7].lower() == "bearer ":
+                token = auth_header[7:]
+        principal = None
+        if protected and not self.wrapper.secure:
+            # Without JWTAuthMiddleware the request carries no principal for role_required
+            raise HTTPUnauthorized(description="Authentication required")
+        if self.wrapper.secure:
+            if token is None:
+                raise HTTPUnauthorized(description="Missing or invalid Authorization header",
+                                       challenges=["Bearer"])
+            try:
+                payload = decode_token(token)
+            except Exception as e:
+                raise HTTPUnauthorized(description=str(e), challenges=["Bearer"])
+            principal = {"user_id": payload.get("sub"), "role": payload.get("role")}
+        args = [params.get(p) for p in spec.params]
+        if protected:
+            # role_required checks the role carried by the token
+            args.insert(0, token)
+        return method, args, bind_request(principal, token)
+
+    def invoke(self, spec, params: dict, headers: dict = None):
+        """
+        Call the sink method directly.
+
+        Args:
+            spec (MethodSpec): The interface method being called.
+            params (dict): Parameter name to value.
+            headers (dict): Request headers of the call.
+
+        Returns:
+            Any: The method's result.
+
+        Raises:
+            requests.HTTPError: If the sink, or its authorization, raised an error.
+            DeadlineExceededException: If the sink reported its deadline as passed.
+        """
+        handle = None
+        try:
+            method, args, handle = self.prepare(spec, params, headers)
+            result = method(*args)
+            if inspect.isawaitable(result):
+                # Coroutine methods, including those wrapped by role_required
+                result = asyncio.run(result)
+            return result
+        except Exception as e:
+            raise self.http_error(spec, e) from e
+        finally:
+            if handle is not None:
+                reset_request(handle)
+
+    async def invoke_async(self, spec, params: dict, headers: dict = None):
+        """
+        Call the sink method directly from a coroutine.
+
+        Args:
+            spec (MethodSpec): The interface method being called.
+            params (dict): Parameter name to value.
+            headers (dict): Request headers of the call.
+
+        Returns:
+            Any: The method's result.
+
+        Raises:
+            aiohttp.ClientResponseError: If the sink, or its authorization, raised an error.
+            DeadlineExceededException: If the sink reported its deadline as passed.
+        """
+        handle = None
+        try:
+            method, args, handle = self.prepare(spec, params, headers)
+            result = method(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except Exception as e:
+            raise self.client_error(spec, e) from e
+        finally:
+            if handle is not None:
+                reset_request(handle)
+
+
+def local_binding(meta, label: str):
+    """
+    Return a LocalBinding for a sink if it is a WebComponent served by this process.
+    Components served by worker processes (see AddasuSec.Prefork) are never bound.
+
+    Args:
+        meta (MetaArchitecture): The architecture model.
+        label (str): The sink's component label.
+
+    Returns:
+        LocalBinding: The binding, or None if the sink is remote or not yet served.
+    """
+    wrapper = meta.getComponent(label)
+    port = getattr(wrapper, "port", None)
+    if getattr(wrapper, "innerComponent", None) is None or not getattr(wrapper, "bindable", True):
+        return None
+    if port is None and getattr(wrapper, "socket_path", None) is None:
+        return None
+    host = meta.getComponentAttributeValue(label, "Host")
+    if host != (f"localhost:{port}" if port is not None else "localhost"):
+        return None
+    return LocalBinding(wrapper, label, host, meta)
@@ -0,0 +1,190 @@
+"""
+PooledSession Module
+
+This module defines the keep-alive HTTP session used by WebReceptacle connections. Each
+receptacle owns one PooledSession so that repeated remote calls reuse pooled TCP
+connections instead of paying a fresh handshake and socket teardown per call. URLs with
+the http+unix scheme are sent over Unix domain sockets (see AddasuSec.UnixSocket). Idle
+sessions are closed by a SessionReaper owned by the runtime.
+
+Classes:
+    PooledSession: A requests.Session wrapper with a bounded, configurable connection pool.
+    SessionReaper: Background thread that closes sessions whose sockets have been idle.
+
+Dependencies:
+    - requests
+
+Author: Paul Grace
+"""
+
+import threading
+import time
+import weakref
+import requests
+from requests.adapters import HTTPAdapter
+from AddasuSec.UnixSocket import UNIX_SCHEME, UnixAdapter
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+
+class PooledSession:
+    """
+    A lazily created requests.Session with a bounded connection pool.
+
+    Attributes:
+        pool_size (int): Maximum number of pooled connections kept per host.
+        idle_timeout (float): Seconds of inactivity after which the reaper closes the sockets.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initialize the pooled session.
+
+        Args:
+            pool_size (int): Maximum number of pooled connections per host.
+            idle_timeout (float): Idle period in seconds before sockets are reaped.
+        """
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.hosts = 1
+        self.session = None
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+
+    def configure(self, pool_size: int = None, idle_timeout: float = None, hosts: int = None) -> None:
+        """
+        Change the pool settings. The current session is closed and rebuilt on next use.
+
+        Args:
+            pool_size (int): New maximum number of pooled connections per host.
+            idle_timeout (float): New idle period in seconds.
+            hosts (int): Number of hosts (replicas) whose pools are kept open at once.
+        """
+        if pool_size is not None:
+            self.pool_size = int(pool_size)
+        if idle_timeout is not None:
+            self.idle_timeout = float(idle_timeout)
+        if hosts is not None:
+            self.hosts = max(int(hosts), 1)
+        self.close()
+
+    def get(self) -> requests.Session:
+        """
+        Return the underlying session, creating it if it has been closed or reaped.
+
+        Returns:
+            requests.Session: The session bound to this connection's pool.
+        """
+        with self.lock:
+            if self.session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.hosts, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.mount(f'{UNIX_SCHEME}://', UnixAdapter(self.hosts, self.pool_size))
+                self.session = session
+            self.last_used = time.monotonic()
+            return self.session
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a POST request over a pooled connection.
+
+        Args:
+            url (str): Target URL.
+            **kwargs: Arguments passed through to requests.Session.post.
+
+        Returns:
+            requests.Response: The HTTP response.
+        """
+        return self.get().post(url, **kwargs)
+
+    def open(self, url: str) -> bool:
+        """
+        Pre-open a connection to the sink so the first call does not pay the handshake.
+
+        Args:
+            url (str): Any URL on the sink host.
+
+        Returns:
+            bool: True if the host answered, False otherwise.
+        """
+        try:
+            self.get().head(url, timeout=2)
+            return True
+        except requests.RequestException:
+            return False
+
+    def reap(self) -> bool:
+        """
+        Close the session if it has been idle for longer than idle_timeout.
+
+        Returns:
+            bool: True if the session was closed.
+        """
+        with self.lock:
+            if self.session is None or time.monotonic() - self.last_used < self.idle_timeout:
+                return False
+            self.session.close()
+            self.session = None
+            return True
+
+    def close(self) -> None:
+        """Close all pooled sockets held by this session."""
+        with self.lock:
+            if self.session is not None:
+                self.session.close()
+                self.session = None
+
+
+class SessionReaper(threading.Thread):
+    """
+    Daemon thread that periodically closes idle PooledSessions registered with it.
+    """
+
+    def __init__(self, interval: float = 5.0):
+        """
+        Initialize the reaper.
+
+        Args:
+            interval (float): Seconds between sweeps.
+        """
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.sessions = weakref.WeakSet()
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+
+    def register(self, session: PooledSession) -> None:
+        """
+        Track a session and start the sweeping thread on first use.
+
+        Args:
+            session (PooledSession): The session to reap when idle.
+        """
+        with self.lock:
+            self.sessions.add(session)
+            if not self.is_alive() and not self.stopped.is_set():
+                self.start()
+
+    def unregister(self, session: PooledSession) -> None:
+        """
+        Stop tracking a session.
+
+        Args:
+            session (PooledSession): The session to forget.
+        """
+        with self.lock:
+            self.sessions.discard(session)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            with self.lock:
+                sessions = list(self.sessions)
+            for session in sessions:
+                session.reap()
+
+    def stop(self) -> None:
+        """Stop sweeping."""
+        self.stopped.set()
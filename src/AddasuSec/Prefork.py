@@ -0,0 +1,199 @@
+"""
+Prefork Module
+
+This module scales one web component across CPU cores with worker processes. The runtime
+binds the component's TCP port once, in the parent process, and forks N workers that
+inherit the listening socket; each serves the component's app with the component's
+server backend, and the kernel hands every incoming connection to one of them. The
+component keeps a single "Host" entry in the meta architecture.
+
+A supervisor thread in the parent restarts workers that die and follows the component's
+"Workers" attribute, so the worker count can be changed at runtime
+(WebRuntime.setWorkers, or by setting the attribute). Restarts are counted in the
+"WorkerRestarts" attribute.
+
+Workers are forked copies of the parent: they serve the component instance, receptacle
+bindings and attributes as they were when the worker was forked. Prefork therefore suits
+components whose calls do not depend on state changed after creation, such as CPU-bound
+calculators. It requires os.fork (POSIX).
+
+Classes:
+    PreforkServer: Listening socket, worker processes and their supervisor.
+
+Author: Paul Grace
+"""
+
+import multiprocessing
+import os
+import signal
+import socket
+import stat
+import threading
+from AddasuSec.ServerBackend import ServerBackendException, create_backend
+
+# Seconds between two checks of the workers by the supervisor
+SUPERVISE_INTERVAL = 0.5
+# Seconds a worker is given to finish its requests before it is killed
+WORKER_STOP_TIMEOUT = 10
+
+
+def _release_inherited_sockets(keep):
+    # A worker inherits every socket of the parent: listeners and connections of other
+    # components. Holding them open would keep their ports and connections alive after the
+    # parent closes them, so each is replaced by /dev/null, keeping its descriptor valid.
+    fds = (os.listdir("/proc/self/fd") if os.path.isdir("/proc/self/fd")
+           else range(3, os.sysconf("SC_OPEN_MAX")))
+    devnull = os.open(os.devnull, os.O_RDWR)
+    try:
+        for fd in map(int, fds):
+            if fd < 3 or fd in (keep, devnull):
+                continue
+            try:
+                if stat.S_ISSOCK(os.fstat(fd).st_mode):
+                    os.dup2(devnull, fd)
+            except OSError:
+                pass
+    finally:
+        os.close(devnull)
+
+
+def _serve_worker(app, sock, backend, options):
+    # Entry point of a worker process
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _release_inherited_sockets(sock.fileno())
+    server = create_backend(backend, app, sock=sock, **options)
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopped.set())
+    thread = threading.Thread(target=server.serve, name="Worker")
+    thread.start()
+    print(f"Worker {os.getpid()} serving on {server.address()} ({server.name})")
+    while thread.is_alive() and not stopped.wait(SUPERVISE_INTERVAL):
+        pass
+    server.stop()
+    thread.join()
+
+
+class PreforkServer:
+    """
+    A component's listening socket and the worker processes serving it. It has the stop()
+    and join() methods of a ServerThread, so WebComponent stops it the same way.
+
+    Attributes:
+        wrapper (WebComponent): The component served.
+        port (int): TCP port of the shared listening socket.
+        processes (list): Running worker processes.
+        restarts (int): Number of workers restarted after dying.
+    """
+
+    def __init__(self, wrapper, port, backend=None, options=None, workers=1):
+        """
+        Bind the listening socket; workers are started in start().
+
+        Args:
+            wrapper (WebComponent): The component served; its "Workers" attribute gives
+                the number of workers once bound to the meta architecture.
+            port (int): TCP port to listen on.
+            backend (str): Server backend name (see AddasuSec.ServerBackend).
+            options (dict): Backend settings such as threads and backlog.
+            workers (int): Number of workers when the attribute is not set.
+
+        Raises:
+            ServerBackendException: If fork is unavailable or the port cannot be bound.
+        """
+        if not hasattr(os, "fork"):
+            raise ServerBackendException("Worker processes require os.fork")
+        self.wrapper = wrapper
+        self.port = port
+        self.backend = backend
+        self.options = {key: value for key, value in (options or {}).items() if key != "workers"}
+        self.workers = workers
+        self.processes = []
+        self.restarts = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.context = multiprocessing.get_context("fork")
+        try:
+            self.sock = socket.create_server(("0.0.0.0", port), backlog=self.options.get("backlog") or 2048)
+        except OSError as e:
+            raise ServerBackendException(f"Server on port {port} failed to start - {e}")
+        self.supervisor = threading.Thread(target=self.supervise, name=f"Prefork-{port}", daemon=True)
+
+    def start(self):
+        """
+        Fork the workers and start supervising them. Connections are accepted into the
+        socket's backlog from now on.
+        """
+        self.reconcile()
+        self.supervisor.start()
+
+    def desired(self):
+        """
+        Return the number of workers to run, from the "Workers" attribute.
+
+        Returns:
+            int: Worker count, at least 1.
+        """
+        value = self.wrapper.attribute("Workers")
+        return max(1, int(value if value is not None else self.workers))
+
+    def fork(self):
+        process = self.context.Process(target=_serve_worker, name=f"Worker-{self.port}",
+                                       args=(self.wrapper.app, self.sock, self.backend, self.options))
+        process.daemon = True
+        process.start()
+        return process
+
+    def reconcile(self):
+        """
+        Replace workers that died and start or stop workers to match the desired count.
+        """
+        with self.lock:
+            if self.stopped.is_set():
+                return
+            alive = []
+            for process in self.processes:
+                if process.is_alive():
+                    alive.append(process)
+                else:
+                    process.join()
+            died = len(self.processes) - len(alive)
+            self.restarts += died
+            self.processes = alive
+            desired = self.desired()
+            while len(self.processes) < desired:
+                self.processes.append(self.fork())
+            surplus = self.processes[desired:]
+            self.processes = self.processes[:desired]
+        for process in surplus:
+            self.retire(process)
+        if died and self.wrapper.meta is not None:
+            self.wrapper.meta.setComponentAttributeValue(self.wrapper.label, "WorkerRestarts", self.restarts)
+
+    def retire(self, process):
+        # SIGTERM lets the worker finish its requests in progress
+        process.terminate()
+        process.join(WORKER_STOP_TIMEOUT)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    def supervise(self):
+        try:
+            while not self.stopped.wait(SUPERVISE_INTERVAL):
+                self.reconcile()
+        finally:
+            with self.lock:
+                processes, self.processes = self.processes, []
+            for process in processes:
+                self.retire(process)
+            self.sock.close()
+
+    def stop(self):
+        """
+        Stop the workers and close the listening socket; join() waits for completion.
+        """
+        print("Shutting down workers...")
+        self.stopped.set()
+
+    def join(self):
+        self.supervisor.join()
@@ -0,0 +1,198 @@
+"""
+ReplicaSet Module
+
+This module spreads the calls of one WebReceptacle across several replicas of the same
+component. Every connected receptacle holds a ReplicaSet; with a single sink it simply
+returns that sink, and as replicas are added calls are balanced by least-outstanding-
+requests or power-of-two-choices. Replicas whose error rate or latency degrade are ejected
+for a back-off period and re-admitted afterwards.
+
+Classes:
+    Replica: One sink of a receptacle with its endpoint URLs and health statistics.
+    ReplicaSet: The replicas bound to a receptacle and the balancing policy.
+
+Author: Paul Grace
+"""
+
+import random
+import threading
+import time
+
+LEAST_OUTSTANDING = "least_outstanding"
+POWER_OF_TWO = "p2c"
+
+
+class Replica:
+    """
+    One sink bound to a receptacle.
+
+    Attributes:
+        label (str): Component label of the sink in the meta architecture.
+        url (str): Base URL of the sink ("http://host/label/").
+        endpoints (dict[str, str]): Method name to endpoint URL.
+        outstanding (int): Calls currently in flight.
+        latency (float): Exponentially weighted average latency in seconds.
+        error_rate (float): Exponentially weighted failure ratio.
+        ejected_until (float): Monotonic time until which the replica is ejected.
+    """
+
+    def __init__(self, label: str, url: str, endpoints: dict):
+        """
+        Initialize the replica.
+
+        Args:
+            label (str): Component label of the sink.
+            url (str): Base URL of the sink.
+            endpoints (dict[str, str]): Method name to endpoint URL.
+        """
+        self.label = label
+        self.url = url
+        self.endpoints = endpoints
+        self.outstanding = 0
+        self.calls = 0
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.ejected_until = 0.0
+        self.ejections = 0
+
+    def readmit(self) -> None:
+        """Return the replica to rotation with fresh statistics."""
+        self.ejected_until = 0.0
+        self.calls = 0
+        self.error_rate = 0.0
+        self.latency = 0.0
+
+
+class ReplicaSet:
+    """
+    The replicas of a receptacle with least-outstanding or power-of-two-choices balancing
+    and outlier ejection.
+
+    Attributes:
+        policy (str): "least_outstanding" or "p2c".
+        error_threshold (float): Error rate above which a replica is ejected.
+        latency_threshold (float): Average latency in seconds above which a replica is
+            ejected, or None to disable latency ejection.
+        ejection_time (float): Base ejection period in seconds; doubles on each repeat.
+        min_calls (int): Calls observed before a replica can be ejected.
+    """
+
+    def __init__(self, policy: str = LEAST_OUTSTANDING, error_threshold: float = 0.5,
+                 latency_threshold: float = None, ejection_time: float = 10.0, min_calls: int = 5):
+        """
+        Initialize an empty replica set.
+
+        Args:
+            policy (str): "least_outstanding" or "p2c".
+            error_threshold (float): Error rate above which a replica is ejected.
+            latency_threshold (float): Latency in seconds above which a replica is ejected.
+            ejection_time (float): Base ejection period in seconds.
+            min_calls (int): Calls observed before a replica can be ejected.
+        """
+        self.policy = policy
+        self.error_threshold = error_threshold
+        self.latency_threshold = latency_threshold
+        self.ejection_time = ejection_time
+        self.min_calls = min_calls
+        self.replicas = []
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.replicas)
+
+    def add(self, replica: Replica) -> None:
+        """Add a replica, replacing any replica with the same label."""
+        with self.lock:
+            self.replicas = [r for r in self.replicas if r.label != replica.label] + [replica]
+
+    def remove(self, label: str) -> bool:
+        """
+        Remove a replica.
+
+        Args:
+            label (str): Component label of the replica.
+
+        Returns:
+            bool: True if a replica was removed.
+        """
+        with self.lock:
+            before = len(self.replicas)
+            self.replicas = [r for r in self.replicas if r.label != label]
+            return len(self.replicas) != before
+
+    def clear(self) -> None:
+        """Remove all replicas."""
+        with self.lock:
+            self.replicas = []
+
+    def labels(self) -> list:
+        """Return the labels of all replicas."""
+        return [r.label for r in self.replicas]
+
+    def primary(self) -> Replica:
+        """Return the first bound replica, or None."""
+        replicas = self.replicas
+        return replicas[0] if replicas else None
+
+    def choose(self) -> Replica:
+        """
+        Pick the replica for the next call and count it as outstanding.
+
+        Returns:
+            Replica: The chosen replica.
+
+        Raises:
+            LookupError: If no replica is bound.
+        """
+        with self.lock:
+            replicas = self.replicas
+            if not replicas:
+                raise LookupError("No replica is connected")
+            if len(replicas) == 1:
+                chosen = replicas[0]
+            else:
+                now = time.monotonic()
+                for r in replicas:
+                    if r.ejected_until and r.ejected_until <= now:
+                        r.readmit()
+                healthy = [r for r in replicas if not r.ejected_until] or replicas
+                if self.policy == POWER_OF_TWO and len(healthy) > 2:
+                    healthy = random.sample(healthy, 2)
+                chosen = min(healthy, key=lambda r: (r.outstanding, r.latency))
+            chosen.outstanding += 1
+            return chosen
+
+    def finish(self, replica: Replica, latency: float, ok: bool) -> None:
+        """
+        Record the outcome of a call and eject the replica if it has become an outlier.
+
+        Args:
+            replica (Replica): The replica that served the call.
+            latency (float): Call duration in seconds.
+            ok (bool): False if the call failed.
+        """
+        with self.lock:
+            replica.outstanding -= 1
+            replica.calls += 1
+            replica.latency = latency if replica.calls == 1 else 0.8 * replica.latency + 0.2 * latency
+            replica.error_rate = 0.9 * replica.error_rate + (0.0 if ok else 0.1)
+            if replica.calls < self.min_calls or replica.ejected_until or len(self.replicas) < 2:
+                return
+            unhealthy = replica.error_rate > self.error_threshold or (
+                self.latency_threshold is not None and replica.latency > self.latency_threshold)
+            in_rotation = [r for r in self.replicas if not r.ejected_until]
+            if unhealthy and len(in_rotation) > 1:
+                replica.ejected_until = time.monotonic() + self.ejection_time * (2 ** min(replica.ejections, 5))
+                replica.ejections += 1
+
+    def stats(self) -> dict:
+        """
+        Return the health statistics of every replica.
+
+        Returns:
+            dict: Label to outstanding calls, latency, error rate and ejection state.
+        """
+        with self.lock:
+            return {r.label: {"outstanding": r.outstanding, "latency": r.latency,
+                              "error_rate": r.error_rate, "ejected": bool(r.ejected_until)}
+                    for r in self.replicas}
@@ -0,0 +1,143 @@
+"""
+RequestContext Module
+
+This module holds the request-scoped context used to propagate the caller's identity to
+downstream secure calls. WebComponent and WebServerComponent bind a RequestContext with
+the authenticated principal and bearer token while a component method runs, and the
+role_required decorator does the same for calls made with a raw JWT token. The
+receptacle_with_token methods of Component, runtime and WebReceptacle read it back in
+constant time instead of searching the caller's stack frames for a `req` variable.
+
+The context lives in a contextvars.ContextVar, so it follows the call into asyncio tasks
+automatically; use propagate() to carry it into functions run on other threads.
+
+Classes:
+    RequestContext: Principal and bearer token of the request being served.
+
+Functions:
+    current_request: Return the active RequestContext, or None.
+    request_token: Return the bearer token of the active request, or None.
+    bind_request: Make a RequestContext active.
+    reset_request: Restore the context that was active before bind_request.
+    bearer_token: Extract the bearer token from a falcon request.
+    capture_request: Build a context in which a RequestContext is active.
+    propagate: Wrap a function so it runs in the caller's context on another thread.
+
+Author: Paul Grace
+"""
+
+import contextvars
+
+_request = contextvars.ContextVar("addasusec_request", default=None)
+
+
+class RequestContext:
+    """
+    The identity of the request being served.
+
+    Attributes:
+        principal (dict): Authenticated user or decoded JWT claims, or None.
+        token (str): Bearer token to forward on downstream calls, or None.
+    """
+
+    __slots__ = ("principal", "token")
+
+    def __init__(self, principal=None, token=None):
+        self.principal = principal
+        self.token = token
+
+
+def current_request() -> RequestContext:
+    """
+    Return the context of the request being served.
+
+    Returns:
+        RequestContext: The active context, or None outside a request.
+    """
+    return _request.get()
+
+
+def request_token() -> str:
+    """
+    Return the bearer token of the request being served.
+
+    Returns:
+        str: The token, or None if there is no active request or it carried no token.
+    """
+    ctx = _request.get()
+    return ctx.token if ctx is not None else None
+
+
+def bind_request(principal=None, token=None) -> contextvars.Token:
+    """
+    Make a new RequestContext active for the current thread or task.
+
+    Args:
+        principal (dict): Authenticated user or decoded JWT claims.
+        token (str): Bearer token to forward on downstream calls.
+
+    Returns:
+        contextvars.Token: Handle to pass to reset_request.
+    """
+    return _request.set(RequestContext(principal, token))
+
+
+def reset_request(handle: contextvars.Token) -> None:
+    """
+    Restore the context that was active before the matching bind_request.
+
+    Args:
+        handle (contextvars.Token): The value returned by bind_request.
+    """
+    _request.reset(handle)
+
+
+def bearer_token(req) -> str:
+    """
+    Extract the bearer token from the Authorization header of a falcon request.
+
+    Args:
+        req (falcon.Request): The incoming request.
+
+    Returns:
+        str: The token, or None if the request does not carry one.
+    """
+    auth_header = req.get_header("Authorization", default=None)
+    if auth_header and auth_header[:7].lower() == "bearer ":
+        return auth_header[7:]
+    return None
+
+
+def capture_request(principal=None, token=None) -> contextvars.Context:
+    """
+    Return a copy of the current context with a new RequestContext active, e.g. to run
+    the body of a streamed generator after the request handler has returned.
+
+    Args:
+        principal (dict): Authenticated user or decoded JWT claims.
+        token (str): Bearer token to forward on downstream calls.
+
+    Returns:
+        contextvars.Context: Context to run the deferred work in.
+    """
+    ctx = contextvars.copy_context()
+    ctx.run(_request.set, RequestContext(principal, token))
+    return ctx
+
+
+def propagate(func):
+    """
+    Wrap a function so that it runs in a copy of the caller's context, e.g. when it is
+    submitted to a thread pool.
+
+    Args:
+        func (callable): The function to wrap.
+
+    Returns:
+        callable: A function with the same signature running in the captured context.
+    """
+    ctx = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return ctx.run(func, *args, **kwargs)
+    return run
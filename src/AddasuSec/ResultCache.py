@@ -0,0 +1,109 @@
+"""
+ResultCache Module
+
+This module defines the bounded, in-process LRU cache used by WebReceptacle to serve
+repeated calls to pure interface methods (see AddasuSec.Component.cacheable) without a
+remote round trip. Entries are keyed by method and arguments and expire after the TTL
+declared on the interface method.
+
+Classes:
+    ResultCache: Thread-safe LRU cache with per-entry expiry and hit/miss counters.
+
+Author: Paul Grace
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of remote call results.
+
+    Attributes:
+        max_size (int): Maximum number of cached results.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that required a remote call.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of cached results.
+        """
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> tuple:
+        """
+        Look up a result.
+
+        Args:
+            key (tuple): Method name and arguments.
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss or expired entry.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self.entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value, ttl: float = None) -> None:
+        """
+        Store a result, evicting the least recently used entry when full.
+
+        Args:
+            key (tuple): Method name and arguments.
+            value (Any): The result to cache.
+            ttl (float): Seconds the result stays valid, or None for no expiry.
+        """
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self.lock:
+            self.entries[key] = (expires, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def resize(self, max_size: int) -> None:
+        """
+        Change the size limit, evicting entries if necessary.
+
+        Args:
+            max_size (int): New maximum number of cached results.
+        """
+        with self.lock:
+            self.max_size = max_size
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: Hits, misses, current size and size limit.
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self.entries), "max_size": self.max_size}
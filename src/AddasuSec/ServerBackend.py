@@ -0,0 +1,362 @@
+"""
+ServerBackend Module
+
+This module defines the WSGI servers that host component apps and the API servers. A
+backend is chosen by name, globally for a runtime or per component:
+
+    - "waitress" (default): a pool of worker threads serving requests concurrently, so a
+      slow call no longer stalls the other callers of the component. Connections are kept
+      alive (HTTP/1.1) until idle for "keep_alive" seconds, and at most
+      "connection_limit" connections are accepted at once.
+    - "wsgiref": the standard library server, serving one HTTP/1.0 request at a time.
+    - "asgi": uvicorn serving an ASGI app (see AddasuSec.AsgiWebComponent). Every ASGI
+      server of the process runs on one shared event loop, so async component methods
+      run concurrently; "threads" sizes the pool that runs the synchronous methods.
+
+All serve either a TCP port, a Unix domain socket (see AddasuSec.UnixSocket) or an
+already listening socket handed to them, as worker processes do (see AddasuSec.Prefork). A
+server's "ready" event is set once its socket is bound and listening, so callers can
+wait for it instead of sleeping, and stop() shuts the server down cleanly: the listener
+and open connections are closed and the requests in progress are finished.
+
+Classes:
+    ServerBackendException: Raised for an unknown backend name.
+    WSGIRefBackend: Single-threaded wsgiref server.
+    WaitressBackend: Multi-threaded waitress server.
+    AsgiBackend: uvicorn server on the shared ASGI event loop.
+
+Functions:
+    create_backend: Create a server for an app by backend name.
+    backend_settings: Effective settings of a backend.
+    server_loop: Return the event loop shared by the ASGI servers.
+
+Dependencies:
+    - waitress
+    - uvicorn (imported when an ASGI server starts)
+
+Author: Paul Grace
+"""
+
+import asyncio
+import os
+import socket
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+from AddasuSec.UnixSocket import make_unix_server
+
+DEFAULT_BACKEND = "waitress"
+DEFAULT_THREADS = 8
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_KEEP_ALIVE = 30
+DEFAULT_ASGI_THREADS = 32
+DEFAULT_ASGI_CONNECTION_LIMIT = 10000
+# Seconds to wait for a server to be bound and listening
+DEFAULT_READY_TIMEOUT = 10
+
+# Component attributes the runtimes publish the effective settings of a server under
+SETTING_ATTRIBUTES = {"threads": "ServerThreads", "connection_limit": "ConnectionLimit", "keep_alive": "KeepAlive"}
+
+_server_loop = None
+_server_lock = threading.Lock()
+
+
+# Exception raised when an unknown server backend is requested.
+class ServerBackendException(Exception):
+    pass
+
+
+def _reset_server_loop():
+    # The loop's thread does not survive a fork; a forked worker starts its own loop
+    global _server_loop, _server_lock
+    _server_loop = None
+    _server_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_server_loop)
+
+
+def server_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the background event loop that runs every ASGI server of the process.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running server loop.
+    """
+    global _server_loop
+    with _server_lock:
+        if _server_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="AsgiServerLoop", daemon=True).start()
+            _server_loop = loop
+    return _server_loop
+
+
+class WSGIRefBackend:
+    """
+    wsgiref server handling one request at a time.
+
+    Attributes:
+        app (callable): The WSGI application.
+        host (str): Interface to listen on; all interfaces when "".
+        port (int): TCP port, or None when serving a Unix domain socket.
+        path (str): Unix domain socket path, or None.
+        sock (socket.socket): Listening socket to serve instead of binding one, or None.
+        ready (threading.Event): Set once the server is bound and listening.
+    """
+
+    name = "wsgiref"
+    defaults = {}
+
+    @classmethod
+    def settings(cls, options: dict) -> dict:
+        """
+        Return the effective settings of the backend for a set of options.
+
+        Args:
+            options (dict): Options given for the backend.
+
+        Returns:
+            dict: threads, connection_limit and keep_alive, where the backend uses them.
+        """
+        return {key: options.get(key) or default for key, default in cls.defaults.items()}
+
+    def __init__(self, app, port: int = None, path: str = None, host: str = "", sock: socket.socket = None,
+                 **options):
+        """
+        Prepare the server; it starts listening in serve().
+
+        Args:
+            app (callable): The WSGI application.
+            port (int): TCP port to listen on.
+            path (str): Unix domain socket to listen on instead of a port.
+            host (str): Interface to listen on.
+            sock (socket.socket): Listening TCP socket to serve instead of binding one.
+            **options: Backend settings; the threads, connection_limit and keep_alive
+                settings of other backends are ignored.
+        """
+        self.app = app
+        self.host = host
+        self.port = sock.getsockname()[1] if sock is not None else port
+        self.path = path
+        self.sock = sock
+        self.options = options
+        self.httpd = None
+        self.ready = threading.Event()
+
+    def address(self) -> str:
+        """Return the URL the server listens on, for logging."""
+        if self.path is not None:
+            return f"unix:{self.path}"
+        return f"http://{self.host or '127.0.0.1'}:{self.port}"
+
+    def serve(self) -> None:
+        """Listen and serve requests until stop() is called."""
+        if self.sock is not None:
+            httpd = WSGIServer(self.sock.getsockname(), WSGIRequestHandler, bind_and_activate=False)
+            httpd.socket.close()
+            httpd.socket = self.sock
+            httpd.server_name = socket.getfqdn(self.host)
+            httpd.server_port = self.port
+            httpd.setup_environ()
+            httpd.set_app(self.app)
+        elif self.path is not None:
+            httpd = make_unix_server(self.path, self.app)
+        else:
+            httpd = make_server(self.host, self.port, self.app)
+        with httpd:
+            self.httpd = httpd
+            self.ready.set()
+            httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the listener; returns once serve() has finished."""
+        if self.httpd is not None:
+            self.httpd.shutdown()
+
+
+class WaitressBackend(WSGIRefBackend):
+    """
+    waitress server dispatching requests to a pool of worker threads.
+
+    Options:
+        threads (int): Number of worker threads.
+        connection_limit (int): Maximum number of connections accepted at once.
+        keep_alive (int): Seconds an idle keep-alive connection is held open.
+        backlog (int): Listen backlog of the socket.
+    """
+
+    name = "waitress"
+    defaults = {"threads": DEFAULT_THREADS, "connection_limit": DEFAULT_CONNECTION_LIMIT,
+                "keep_alive": DEFAULT_KEEP_ALIVE}
+
+    def __init__(self, app, port: int = None, path: str = None, host: str = "", sock: socket.socket = None,
+                 **options):
+        super().__init__(app, port, path, host, sock, **options)
+        self.server = None
+        self.stopped = threading.Event()
+
+    def serve(self) -> None:
+        from waitress import wasyncore
+        from waitress.server import create_server
+        effective = self.settings(self.options)
+        settings = {
+            "threads": effective["threads"],
+            "connection_limit": effective["connection_limit"],
+            "channel_timeout": effective["keep_alive"],
+            "ident": "AddasuSec",
+        }
+        if self.options.get("backlog"):
+            settings["backlog"] = self.options["backlog"]
+        if self.sock is not None:
+            settings["sockets"] = [self.sock]
+        elif self.path is not None:
+            settings.update(unix_socket=self.path, unix_socket_perms="600")
+        else:
+            settings.update(host=self.host or "0.0.0.0", port=self.port)
+        server = create_server(self.app, **settings)
+        self.server = server
+        self.ready.set()
+        # Run the event loop one poll at a time so stop() can end it from another thread
+        try:
+            while not self.stopped.is_set() and server._map:
+                wasyncore.loop(timeout=server.adj.asyncore_loop_timeout, map=server._map,
+                               use_poll=server.adj.asyncore_use_poll, count=1)
+        finally:
+            server.task_dispatcher.shutdown()
+            wasyncore.close_all(server._map)
+            # waitress leaves its Unix socket file behind when closed
+            if self.path is not None and os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.server is not None:
+            self.server.pull_trigger()
+
+
+class AsgiBackend(WSGIRefBackend):
+    """
+    uvicorn server for an ASGI app, run on the shared server loop. serve() blocks the
+    calling thread until the server has shut down.
+
+    Options:
+        threads (int): Worker threads of the component's pool for synchronous methods
+            (used by AsgiWebComponent).
+        connection_limit (int): Maximum number of concurrent connections and requests;
+            further requests are answered with 503.
+        keep_alive (int): Seconds an idle keep-alive connection is held open.
+        backlog (int): Listen backlog of the socket.
+    """
+
+    name = "asgi"
+    defaults = {"threads": DEFAULT_ASGI_THREADS, "connection_limit": DEFAULT_ASGI_CONNECTION_LIMIT,
+                "keep_alive": DEFAULT_KEEP_ALIVE}
+
+    def __init__(self, app, port: int = None, path: str = None, host: str = "", sock: socket.socket = None,
+                 **options):
+        super().__init__(app, port, path, host, sock, **options)
+        self.server = None
+        self.stopped = False
+
+    def serve(self) -> None:
+        import uvicorn
+        effective = self.settings(self.options)
+        settings = {
+            "limit_concurrency": effective["connection_limit"],
+            "timeout_keep_alive": effective["keep_alive"],
+            "timeout_graceful_shutdown": 5,
+            "lifespan": "off",
+            # Leave the process's logging configuration alone; only warnings are logged
+            "log_config": None,
+            "log_level": "warning",
+            "access_log": False,
+        }
+        self.server = uvicorn.Server(uvicorn.Config(self.app, **settings))
+        # Bind here rather than in uvicorn, so a bind failure is raised to the caller
+        # instead of exiting the shared loop
+        sock = self.listen()
+        self.ready.set()
+        try:
+            if not self.stopped:
+                asyncio.run_coroutine_threadsafe(self.server.serve(sockets=[sock]), server_loop()).result()
+        finally:
+            sock.close()
+            if self.path is not None and os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def listen(self) -> socket.socket:
+        """Bind the listening socket of the server."""
+        if self.sock is not None:
+            return self.sock
+        backlog = self.options.get("backlog") or 2048
+        if self.path is None:
+            return socket.create_server((self.host or "0.0.0.0", self.port), backlog=backlog)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(self.path)
+            os.chmod(self.path, 0o600)
+            sock.listen(backlog)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def stop(self) -> None:
+        self.stopped = True
+        if self.server is not None:
+            self.server.should_exit = True
+
+
+BACKENDS = {
+    WSGIRefBackend.name: WSGIRefBackend,
+    WaitressBackend.name: WaitressBackend,
+    AsgiBackend.name: AsgiBackend,
+}
+
+
+def create_backend(name: str, app, port: int = None, path: str = None, host: str = "",
+                   sock: socket.socket = None, **options):
+    """
+    Create a server for an application.
+
+    Args:
+        name (str): Backend name, "waitress", "wsgiref" or "asgi"; the default when None.
+        app (callable): The WSGI application, or the ASGI application for "asgi".
+        port (int): TCP port to listen on.
+        path (str): Unix domain socket to listen on instead of a port.
+        host (str): Interface to listen on; all interfaces when "".
+        sock (socket.socket): Listening TCP socket to serve instead of binding one.
+        **options: Backend settings such as threads, connection_limit and keep_alive.
+
+    Returns:
+        WSGIRefBackend | WaitressBackend | AsgiBackend: The server; call serve() to run it.
+
+    Raises:
+        ServerBackendException: If the backend name is unknown.
+    """
+    backend = BACKENDS.get(name or DEFAULT_BACKEND)
+    if backend is None:
+        raise ServerBackendException(f"Unknown server backend {name}")
+    return backend(app, port, path, host, sock, **options)
+
+
+def backend_settings(name: str, options: dict) -> dict:
+    """
+    Return the effective settings of a backend, as published in the meta architecture.
+
+    Args:
+        name (str): Backend name; the default when None.
+        options (dict): Options given for the backend.
+
+    Returns:
+        dict: threads, connection_limit and keep_alive, where the backend uses them.
+
+    Raises:
+        ServerBackendException: If the backend name is unknown.
+    """
+    backend = BACKENDS.get(name or DEFAULT_BACKEND)
+    if backend is None:
+        raise ServerBackendException(f"Unknown server backend {name}")
+    return backend.settings(options)
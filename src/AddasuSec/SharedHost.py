@@ -0,0 +1,156 @@
+"""
+SharedHost Module
+
+This module multiplexes many components behind one listener. A WebRuntime in multiplexed
+mode (WebRuntime.multiplexHost) starts one SharedHost per server backend, instead of one
+server per component. Each component keeps its own falcon app, so its middleware,
+security and routes are unchanged, and is mounted on the host under its label; the host
+dispatches "/{label}/{method}" requests to the app mounted for the label.
+
+Mounting and unmounting a component is a dictionary update: no server is started or
+restarted, no thread is added, and the component's "Host" attribute names the shared
+listener, so receptacles resolve it as before. Receptacles in the same process still
+call a mounted component directly (see AddasuSec.LocalBinding). The listener's threads
+and connections are shared by all the mounted components and scale with traffic rather
+than with the number of components.
+
+Classes:
+    SharedHost: WSGI application dispatching requests to mounted component apps.
+    AsgiSharedHost: ASGI variant for components served by the "asgi" backend.
+
+Author: Paul Grace
+"""
+
+import json
+import threading
+from AddasuSec.ServerBackend import ServerBackendException
+from AddasuSec.WebComponent import ServerThread
+
+_NOT_FOUND = json.dumps({"title": "404 Not Found",
+                         "description": "No component is mounted at this path."}).encode()
+
+
+class SharedHost:
+    """
+    One listener serving the component apps mounted on it, as a WSGI application.
+
+    Attributes:
+        apps (dict): Label to the mounted component's app.
+        backend (str): Server backend name (see AddasuSec.ServerBackend).
+        options (dict): Backend settings.
+        port (int): TCP port, or None when serving the socket only.
+        path (str): Unix domain socket path, or None.
+    """
+
+    def __init__(self, backend, options=None, port=None, path=None):
+        """
+        Prepare the host; it starts listening in start().
+
+        Args:
+            backend (str): Server backend name.
+            options (dict): Backend settings such as threads, connection_limit and keep_alive.
+            port (int): TCP port to listen on, or None.
+            path (str): Unix domain socket to listen on as well, or None.
+        """
+        self.apps = {}
+        self.backend = backend
+        self.options = options or {}
+        self.port = port
+        self.path = path
+        self.servers = []
+        self.lock = threading.Lock()
+
+    def mount(self, label, app):
+        """
+        Serve a component's app under "/{label}/", starting the listener on first use.
+
+        Args:
+            label (str): The component's label.
+            app (callable): The component's falcon app.
+        """
+        with self.lock:
+            if not self.servers:
+                self.start()
+            self.apps[label] = app
+
+    def unmount(self, label):
+        """
+        Stop serving a component; its requests are answered with 404 from now on.
+
+        Args:
+            label (str): The component's label.
+        """
+        self.apps.pop(label, None)
+
+    def start(self):
+        """
+        Start the listener threads and return once they are listening.
+
+        Raises:
+            ServerBackendException: If a listener failed to start; the others are stopped.
+        """
+        if self.port is not None:
+            self.servers.append(ServerThread(self, self.port, None, self.backend, self.options))
+        if self.path is not None:
+            self.servers.append(ServerThread(self, None, self.path, self.backend, self.options))
+        for server in self.servers:
+            server.daemon = True
+            server.start()
+        try:
+            for server in self.servers:
+                server.wait_ready()
+        except ServerBackendException:
+            for server in self.servers:
+                server.stop()
+                server.join()
+            self.servers = []
+            raise
+
+    def stop(self):
+        """
+        Stop the listener and join its threads.
+        """
+        with self.lock:
+            for server in self.servers:
+                server.stop()
+                server.join()
+            self.servers = []
+
+    def lookup(self, path):
+        """
+        Return the app mounted for a request path.
+
+        Args:
+            path (str): Request path, "/{label}/{method}".
+
+        Returns:
+            callable: The component's app, or None if no component is mounted there.
+        """
+        parts = path.split('/', 2)
+        return self.apps.get(parts[1]) if len(parts) == 3 else None
+
+    def __call__(self, environ, start_response):
+        app = self.lookup(environ.get("PATH_INFO", ""))
+        if app is None:
+            start_response("404 Not Found", [("Content-Type", "application/json"),
+                                             ("Content-Length", str(len(_NOT_FOUND)))])
+            return [_NOT_FOUND]
+        return app(environ, start_response)
+
+
+class AsgiSharedHost(SharedHost):
+    """
+    SharedHost for AsgiWebComponent apps, as an ASGI application.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        app = self.lookup(scope["path"])
+        if app is None:
+            await send({"type": "http.response.start", "status": 404,
+                        "headers": [(b"content-type", b"application/json"),
+                                    (b"content-length", str(len(_NOT_FOUND)).encode())]})
+            await send({"type": "http.response.body", "body": _NOT_FOUND})
+            return
+        await app(scope, receive, send)
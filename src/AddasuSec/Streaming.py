@@ -0,0 +1,371 @@
+"""
+Streaming Module
+
+This module streams the results of generator and async-generator component methods.
+Instead of building the whole collection before replying, the component server sends one
+record per item as it is produced: newline-delimited JSON when the negotiated codec is
+JSON, or length-prefixed frames (4-byte big-endian length, then the encoded record) for
+the binary codecs of AddasuSec.WireCodec. Every item record is {"item": value}; a final
+{"cursor": n, "done": bool} record closes the stream.
+
+On the client the stub method of an interface method annotated as returning an Iterator,
+Iterable, Generator or their async counterparts returns a ResultStream. It is a lazy
+iterator that reads one record at a time from the socket, so a slow consumer stops the
+producer through TCP flow control. The number of items consumed is the stream's cursor:
+a broken stream is reopened from the cursor, and a stream can be opened at any cursor
+with a page-size limit to page through results.
+
+Request headers:
+    X-Stream-Cursor: Number of leading items to skip.
+    X-Stream-Limit: Maximum number of items to send.
+
+Classes:
+    ResultStream: Client-side lazy iterator over a streamed result.
+    AsyncResultStream: Async iterator over a ResultStream.
+
+Functions:
+    is_stream: Return True if a method result is to be streamed.
+    stream_content_type: Content type of a stream encoded with a codec.
+    stream_codec: Codec of a stream content type.
+    stream_result: Set a falcon response to stream a generator result.
+    stream_result_async: Set a falcon.asgi response to stream a generator result.
+
+Author: Paul Grace
+"""
+
+import asyncio
+import inspect
+import itertools
+import struct
+import requests
+import urllib3
+from AddasuSec import WireCodec
+
+CURSOR_HEADER = "X-Stream-Cursor"
+LIMIT_HEADER = "X-Stream-Limit"
+MEDIA_NDJSON = "application/x-ndjson"
+
+_frame_length = struct.Struct(">I")
+_END = object()
+
+
+def is_stream(result) -> bool:
+    """
+    Return True if a method result is a generator or async generator to be streamed.
+    """
+    return inspect.isgenerator(result) or inspect.isasyncgen(result)
+
+
+def stream_content_type(codec) -> str:
+    """
+    Return the content type of a stream encoded with a codec.
+
+    Args:
+        codec (Codec): The negotiated codec.
+
+    Returns:
+        str: "application/x-ndjson" for JSON, else "application/x-{name}-stream".
+    """
+    return MEDIA_NDJSON if codec.name == "json" else f"application/x-{codec.name}-stream"
+
+
+def stream_codec(content_type: str):
+    """
+    Return the codec of a stream content type.
+
+    Args:
+        content_type (str): The Content-Type of a reply.
+
+    Returns:
+        Codec: The codec, or None if the reply is not a stream.
+    """
+    if not content_type:
+        return None
+    media = content_type.split(";", 1)[0].strip().lower()
+    if media == MEDIA_NDJSON:
+        return WireCodec.get_codec("json")
+    if media.startswith("application/x-") and media.endswith("-stream"):
+        return WireCodec.get_codec(media[len("application/x-"):-len("-stream")])
+    return None
+
+
+def _iterate_async(agen):
+    # Drive an async generator from the synchronous WSGI server thread
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.close()
+
+
+def _encoder(codec):
+    if codec.name == "json":
+        def encode(record):
+            return codec.dumps(record) + b"\n"
+    else:
+        def encode(record):
+            payload = codec.dumps(record)
+            return _frame_length.pack(len(payload)) + payload
+    return encode
+
+
+def _frames(items, codec, cursor, limit, context):
+    encode = _encoder(codec)
+    iterator = iter(items)
+    sent = 0
+    while limit is None or sent < limit:
+        try:
+            item = context.run(next, iterator)
+        except StopIteration:
+            yield encode({"cursor": cursor + sent, "done": True})
+            return
+        sent += 1
+        yield encode({"item": item})
+    yield encode({"cursor": cursor + sent, "done": False})
+
+
+async def _async_frames(result, codec, cursor, limit, context, executor):
+    # Async generators run on the server loop in the request context; generators run in
+    # the executor so a slow producer never blocks the loop
+    encode = _encoder(codec)
+    loop = asyncio.get_running_loop()
+    if inspect.isasyncgen(result):
+        def produce():
+            return loop.create_task(result.__anext__(), context=context)
+    else:
+        def produce():
+            return loop.run_in_executor(executor, context.run, next, result, _END)
+    skip = cursor
+    sent = 0
+    try:
+        while limit is None or sent < limit:
+            try:
+                item = await produce()
+            except StopAsyncIteration:
+                item = _END
+            if item is _END:
+                yield encode({"cursor": cursor + sent, "done": True})
+                return
+            if skip:
+                skip -= 1
+                continue
+            sent += 1
+            yield encode({"item": item})
+        yield encode({"cursor": cursor + sent, "done": False})
+    finally:
+        if inspect.isasyncgen(result):
+            await result.aclose()
+        else:
+            result.close()
+
+
+def _stream_window(req):
+    cursor = int(req.get_header(CURSOR_HEADER) or 0)
+    limit = req.get_header(LIMIT_HEADER)
+    return cursor, int(limit) if limit is not None else None
+
+
+def stream_result(req, resp, result, codec, context) -> None:
+    """
+    Set a falcon response to stream the items of a generator result.
+
+    Args:
+        req (falcon.Request): The call request; its cursor and limit headers are honoured.
+        resp (falcon.Response): The response to stream into.
+        result (generator | async_generator): The method's result.
+        codec (Codec): The codec negotiated with the client.
+        context (contextvars.Context): Request context the generator body runs in.
+    """
+    cursor, limit = _stream_window(req)
+    items = _iterate_async(result) if inspect.isasyncgen(result) else result
+    if cursor:
+        items = itertools.islice(items, cursor, None)
+    resp.content_type = stream_content_type(codec)
+    resp.set_header(CURSOR_HEADER, str(cursor))
+    resp.stream = _frames(items, codec, cursor, limit, context)
+
+
+def stream_result_async(req, resp, result, codec, context, executor=None) -> None:
+    """
+    Set a falcon.asgi response to stream the items of a generator result. Async
+    generators are driven on the server's event loop, plain generators in an executor.
+
+    Args:
+        req (falcon.asgi.Request): The call request; its cursor and limit headers are
+            honoured.
+        resp (falcon.asgi.Response): The response to stream into.
+        result (generator | async_generator): The method's result.
+        codec (Codec): The codec negotiated with the client.
+        context (contextvars.Context): Request context the generator body runs in.
+        executor (concurrent.futures.Executor): Runs plain generators; the loop's default
+            executor when None.
+    """
+    cursor, limit = _stream_window(req)
+    resp.content_type = stream_content_type(codec)
+    resp.set_header(CURSOR_HEADER, str(cursor))
+    resp.stream = _async_frames(result, codec, cursor, limit, context, executor)
+
+
+class ResultStream:
+    """
+    Lazy iterator over the streamed result of a remote call.
+
+    Attributes:
+        cursor (int): Number of items consumed, counted from the start of the result.
+        done (bool): True once the producer reported the end of the result.
+        limit (int): Maximum number of items to read, or None.
+    """
+
+    def __init__(self, receptacle, spec, params: dict, headers: dict = None,
+                 cursor: int = 0, limit: int = None, retries: int = 2):
+        """
+        Prepare the stream; the request is sent on the first iteration.
+
+        Args:
+            receptacle (WebReceptacle): The connection to read from.
+            spec (MethodSpec): The streaming interface method.
+            params (dict): Parameter name to value.
+            headers (dict): Extra request headers; basic auth is used when None.
+            cursor (int): Number of leading items to skip.
+            limit (int): Maximum number of items to read, or None for all.
+            retries (int): Times a broken stream is reopened at its cursor.
+        """
+        self.receptacle = receptacle
+        self.spec = spec
+        self.params = params
+        self.headers = headers
+        self.cursor = cursor
+        self.limit = limit
+        self.retries = retries
+        self.done = False
+        self.read = 0
+        self.records = None
+        self.response = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            if self.done or (self.limit is not None and self.read >= self.limit):
+                self.close()
+                raise StopIteration
+            if self.records is None:
+                self.open()
+            try:
+                record = next(self.records)
+            except (requests.RequestException, urllib3.exceptions.HTTPError,
+                    ConnectionError, StopIteration) as e:
+                # Stream broken before its closing record: reopen at the cursor
+                self.close()
+                if self.retries <= 0:
+                    if isinstance(e, StopIteration):
+                        raise ConnectionError("Result stream ended without its closing record")
+                    raise
+                self.retries -= 1
+                continue
+            if "item" in record:
+                self.cursor += 1
+                self.read += 1
+                return self.spec.item_decoder(record["item"])
+            self.done = record.get("done", True)
+            self.close()
+            if not self.done:
+                # The producer stopped at our limit or its own page size
+                raise StopIteration
+
+    def open(self) -> None:
+        """Send the request for the remaining items and start reading records."""
+        headers = dict(self.headers or {})
+        headers[CURSOR_HEADER] = str(self.cursor)
+        if self.limit is not None:
+            headers[LIMIT_HEADER] = str(self.limit - self.read)
+        receptacle = self.receptacle
+        timeout = receptacle.callTimeout(self.spec.name)
+        replica = receptacle.acquire()
+        ok = False
+        try:
+            response = receptacle.post(replica.endpoints[self.spec.name], self.params, headers,
+                                       stream=True, blobs=self.spec.blobs, timeout=timeout)
+            ok = response.status_code < 500
+        finally:
+            receptacle.release(replica, 0.0, ok)
+        response.raise_for_status()
+        codec = stream_codec(response.headers.get("Content-Type"))
+        if codec is None:
+            # The sink returned the whole result at once
+            items = self.spec.decode(response.content,
+                                     WireCodec.get_codec(response.headers.get("Content-Type"))) or []
+            self.records = iter([{"item": item} for item in items] + [{"done": True}])
+            return
+        self.response = response
+        self.records = self._records(response, codec)
+
+    def _records(self, response, codec):
+        # Decode records as soon as their bytes arrive rather than waiting for full reads
+        raw = response.raw
+        read = getattr(raw, "read1", raw.read)
+        buffer = b""
+        while True:
+            chunk = read(65536)
+            if not chunk:
+                break
+            buffer += chunk
+            start = 0
+            if codec.name == "json":
+                end = buffer.find(b"\n")
+                while end >= 0:
+                    if end > start:
+                        yield codec.loads(buffer[start:end])
+                    start = end + 1
+                    end = buffer.find(b"\n", start)
+            else:
+                while len(buffer) - start >= _frame_length.size:
+                    size = _frame_length.unpack_from(buffer, start)[0]
+                    end = start + _frame_length.size + size
+                    if end > len(buffer):
+                        break
+                    yield codec.loads(buffer[start + _frame_length.size:end])
+                    start = end
+            buffer = buffer[start:]
+        if buffer.strip():
+            raise ConnectionError("Result stream truncated")
+
+    def close(self) -> None:
+        """Release the connection of the current request."""
+        if self.response is not None:
+            self.response.close()
+            self.response = None
+        self.records = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class AsyncResultStream:
+    """
+    Async iterator over a ResultStream; each item is read in a worker thread so the event
+    loop is never blocked on the socket.
+    """
+
+    def __init__(self, stream: ResultStream):
+        self.stream = stream
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await asyncio.to_thread(next, self.stream, _END)
+        if item is _END:
+            raise StopAsyncIteration
+        return item
+
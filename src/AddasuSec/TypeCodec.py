@@ -0,0 +1,162 @@
+"""
+TypeCodec Module
+
+This module compiles typed decoders for the results of remote component calls. A decoder
+is built once from an interface method's return annotation and turns the JSON "result"
+field straight into the declared type. Types that JSON already carries natively (str, int,
+float, bool, and containers of them) pass through untouched, so large list or dict results
+are not rescanned; dataclasses, datetime.date, datetime.datetime and uuid.UUID, the types
+supported by WebComponent.get_typed_param, are rebuilt field by field.
+
+The module also provides wire_default, the json.dumps hook used by the component servers
+to encode those same types in replies.
+
+Functions:
+    compile_decoder: Build the decoder for a type annotation.
+    decode_result: Decode the "result" field of a reply body.
+    wire_default: json.dumps "default" hook for non-native result types.
+
+Author: Paul Grace
+"""
+
+import dataclasses
+import datetime
+import functools
+import inspect
+import json
+import types
+import typing
+import uuid
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
+_NATIVE = (str, int, float, bool, type(None))
+
+
+def _identity(value):
+    return value
+
+
+def _is_native(annotation) -> bool:
+    """Return True when JSON decoding already yields values of this annotation."""
+    if annotation in _NATIVE or annotation in (list, dict, typing.Any, inspect.Signature.empty):
+        return True
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is dict and args and args[0] not in (str, typing.Any):
+        return False
+    if origin in (list, dict, typing.Union, types.UnionType):
+        return all(_is_native(arg) for arg in args)
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def compile_decoder(annotation):
+    """
+    Build a function converting a decoded JSON value into the annotated type.
+
+    Args:
+        annotation: A type annotation such as int, list[int], dict[str, Item] or a dataclass.
+
+    Returns:
+        callable: A single-argument decoder.
+
+    Raises:
+        TypeError: If the annotation is not supported.
+    """
+    if _is_native(annotation):
+        return _identity
+    if annotation is datetime.date:
+        return _typed(datetime.date, datetime.date.fromisoformat)
+    if annotation is datetime.datetime:
+        return _typed(datetime.datetime, datetime.datetime.fromisoformat)
+    if annotation is uuid.UUID:
+        return _typed(uuid.UUID, uuid.UUID)
+    if annotation in (tuple, set, frozenset):
+        return annotation
+    if dataclasses.is_dataclass(annotation):
+        return _dataclass_decoder(annotation)
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (list, tuple, set, frozenset):
+        if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+            args = args[:1]
+        if origin is tuple and len(args) > 1:
+            decoders = [compile_decoder(arg) for arg in args]
+            return lambda value: tuple(d(v) for d, v in zip(decoders, value))
+        item = compile_decoder(args[0]) if args else _identity
+        return lambda value: origin(item(v) for v in value)
+    if origin is dict:
+        # JSON object keys are always strings, so numeric key types are converted back.
+        key = args[0] if args and args[0] in (int, float) else compile_decoder(args[0]) if args else _identity
+        item = compile_decoder(args[1]) if args else _identity
+        return lambda value: {key(k): item(v) for k, v in value.items()}
+    if origin in (typing.Union, types.UnionType):
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) == 1:
+            inner = compile_decoder(options[0])
+            return lambda value: None if value is None else inner(value)
+        return _identity
+    raise TypeError(f"Unsupported return type: {annotation}")
+
+
+def _typed(cls, parse):
+    # Binary codecs such as CBOR may already deliver the value as an instance of cls
+    return lambda value: value if isinstance(value, cls) else parse(value)
+
+
+def _dataclass_decoder(cls):
+    hints = typing.get_type_hints(cls)
+    fields = [(f.name, compile_decoder(hints.get(f.name, typing.Any)))
+              for f in dataclasses.fields(cls) if f.init]
+
+    def decode(value):
+        if value is None:
+            return None
+        return cls(**{name: dec(value[name]) for name, dec in fields if name in value})
+    return decode
+
+
+def decode_result(content: bytes, decoder, body_loads=None):
+    """
+    Decode a component reply body and return its typed "result" field.
+
+    Args:
+        content (bytes): Raw response body.
+        decoder (callable): Decoder compiled for the method's return type.
+        body_loads (callable): Decodes the body; JSON when None (see AddasuSec.WireCodec).
+
+    Returns:
+        Any: The decoded result, or None when the reply carries no result.
+    """
+    value = (body_loads or loads)(content).get("result")
+    return None if value is None else decoder(value)
+
+
+def wire_default(value):
+    """
+    json.dumps hook encoding the non-native types understood by compile_decoder.
+
+    Args:
+        value (Any): Object the JSON encoder could not serialise.
+
+    Returns:
+        Any: A JSON-serialisable representation.
+
+    Raises:
+        TypeError: If the object is not of a supported type.
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,196 @@
+"""
+UnixSocket Module
+
+This module carries component calls over Unix domain sockets. When a WebRuntime is told
+to serve components on sockets (WebRuntime.serveUnixSockets), each WebComponent also
+listens on "<directory>/<label>.sock" and the path is published as the component's
+"Socket" meta attribute. A WebReceptacle whose sink has a "Socket" attribute and a local
+"Host" (localhost, a loopback address or this machine's name) sends its calls to the
+socket instead of TCP; the sink's URLs then use the http+unix scheme with the
+percent-encoded socket path as the host, e.g.
+
+    http+unix://%2Ftmp%2Faddasusec%2FAdder1.sock/Adder1/add
+
+Same-host calls thereby skip the TCP/IP stack and use no ephemeral ports. A receptacle
+can be kept on TCP by setting its "UnixSocket" receptacle attribute to False.
+
+Classes:
+    UnixWSGIServer: wsgiref server listening on a Unix domain socket.
+    UnixAdapter: requests transport adapter for http+unix URLs.
+
+Functions:
+    make_unix_server: Create a UnixWSGIServer for a WSGI application.
+    is_local_host: Return True if a Host attribute names this machine.
+    unix_url: URL of a component served on a socket.
+    socket_path: Socket path of an http+unix URL.
+
+Author: Paul Grace
+"""
+
+import os
+import socket
+import socketserver
+import threading
+from urllib.parse import quote, unquote, urlsplit
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+import urllib3
+from requests.adapters import HTTPAdapter
+
+UNIX_SCHEME = "http+unix"
+
+_LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1", "[::1]"}
+
+
+class _UnixRequestHandler(WSGIRequestHandler):
+    # Unix sockets have no peer address; present the caller as the loopback host
+    def setup(self):
+        self.client_address = ("127.0.0.1", 0)
+        super().setup()
+
+
+class UnixWSGIServer(socketserver.UnixStreamServer, WSGIServer):
+    """
+    wsgiref WSGIServer listening on a Unix domain socket. A stale socket file left at the
+    path is replaced, and the file is removed when the server is closed.
+    """
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+        self.setup_environ()
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+
+def make_unix_server(path: str, app) -> UnixWSGIServer:
+    """
+    Create a server for a WSGI application on a Unix domain socket.
+
+    Args:
+        path (str): Filesystem path of the socket.
+        app (callable): The WSGI application.
+
+    Returns:
+        UnixWSGIServer: The bound server; call serve_forever() to run it.
+    """
+    server = UnixWSGIServer(path, _UnixRequestHandler)
+    server.set_app(app)
+    return server
+
+
+def is_local_host(host: str) -> bool:
+    """
+    Return True if a "Host" attribute names this machine.
+
+    Args:
+        host (str): "name" or "name:port".
+
+    Returns:
+        bool: True for localhost, loopback addresses and this machine's host name.
+    """
+    if not host:
+        return False
+    name = host.rsplit(":", 1)[0] if host.count(":") == 1 or host.startswith("[") else host
+    return name.lower() in _LOCAL_HOSTS or name == socket.gethostname()
+
+
+def unix_url(path: str, label: str) -> str:
+    """
+    Return the base URL of a component served on a Unix domain socket.
+
+    Args:
+        path (str): Filesystem path of the socket.
+        label (str): The component's label.
+
+    Returns:
+        str: "http+unix://<encoded path>/<label>/".
+    """
+    return f"{UNIX_SCHEME}://{quote(path, safe='')}/{label}/"
+
+
+def socket_path(url: str) -> str:
+    """
+    Return the socket path of an http+unix URL.
+
+    Args:
+        url (str): The URL.
+
+    Returns:
+        str: The decoded socket path, or None if the URL is not an http+unix URL.
+    """
+    parts = urlsplit(url)
+    if parts.scheme != UNIX_SCHEME:
+        return None
+    return unquote(parts.netloc)
+
+
+class _UnixConnection(urllib3.connection.HTTPConnection):
+    def __init__(self, path, **kwargs):
+        super().__init__("localhost", **kwargs)
+        self.socket_path = path
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise urllib3.exceptions.NewConnectionError(self, f"Failed to connect to {self.socket_path}: {e}")
+        return sock
+
+
+class _UnixConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
+    def __init__(self, path, **kwargs):
+        super().__init__("localhost", **kwargs)
+        self.socket_path = path
+
+    def _new_conn(self):
+        self.num_connections += 1
+        return _UnixConnection(self.socket_path, timeout=self.timeout.connect_timeout, **self.conn_kw)
+
+
+class UnixAdapter(HTTPAdapter):
+    """
+    requests transport adapter sending http+unix URLs over Unix domain sockets. It keeps
+    one keep-alive connection pool per socket path.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10):
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.pools_by_path = {}
+        self.pools_lock = threading.Lock()
+
+    def _pool(self, url):
+        path = socket_path(url)
+        with self.pools_lock:
+            pool = self.pools_by_path.get(path)
+            if pool is None:
+                pool = _UnixConnectionPool(path, maxsize=self._pool_maxsize, block=self._pool_block)
+                self.pools_by_path[path] = pool
+            return pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool(request.url)
+
+    def get_connection(self, url, proxies=None):
+        return self._pool(url)
+
+    def request_url(self, request, proxies):
+        return request.path_url
+
+    def close(self):
+        super().close()
+        with self.pools_lock:
+            for pool in self.pools_by_path.values():
+                pool.close()
+            self.pools_by_path.clear()
@@ -99,7 +99,43 @@ class WebClientComponent:
             bool: True if connected successfully, False otherwise.
         """
         try:
-            return self.innerComponent.receptacles.get(intf).connect(component, intf, rt)
+            receptacle = self.innerComponent.receptacles.get(intf)
+            receptacle.owner = rt.meta.getLabel(self)
+            return receptacle.connect(component, intf, rt)
+        except ValueError:
+            return False
+
+    def addReplica(self, component, intf, rt):
+        """
+        Bind a further replica of the sink to a connected receptacle.
+
+        Args:
+            component (object): The replica component.
+            intf (str): Interface name.
+            rt (clientRuntime): The runtime holding the meta architecture.
+
+        Returns:
+            bool: True if the replica was bound, False otherwise.
+        """
+        try:
+            return self.innerComponent.receptacles.get(intf).addReplica(component, rt)
+        except ValueError:
+            return False
+
+    def removeReplica(self, component, intf, rt):
+        """
+        Unbind one replica of the sink from a connected receptacle.
+
+        Args:
+            component (object): The replica component.
+            intf (str): Interface name.
+            rt (clientRuntime): The runtime holding the meta architecture.
+
+        Returns:
+            bool: True if the replica was removed, False otherwise.
+        """
+        try:
+            return self.innerComponent.receptacles.get(intf).removeReplica(component, rt)
         except ValueError:
             return False
 
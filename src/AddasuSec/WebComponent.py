@@ -13,42 +13,65 @@ Author: Paul Grace
 """
 
 import falcon
-import inspect
-import asyncio
 import datetime
 import uuid
 import json
 from AddasuSec import WebReceptacle
+from AddasuSec.Batch import invoke_batch
+from AddasuSec.Dispatch import compile_dispatch
+from AddasuSec import WireCodec
+from AddasuSec.RequestContext import bearer_token, bind_request, capture_request, reset_request
+from AddasuSec.Streaming import is_stream, stream_result
+from AddasuSec.Compression import CompressionMiddleware
+from AddasuSec.Deadline import bind_deadline, request_deadline, reset_deadline
+from AddasuSec.Admission import AdmissionController
+from AddasuSec.Coalescing import SingleFlight
+from AddasuSec.Blobs import DEFAULT_MAX_BODY_SIZE, blob_arguments, is_blob_request, is_blob_result, send_blob
+from AddasuSec.Prefork import PreforkServer
+from AddasuSec.ServerBackend import DEFAULT_READY_TIMEOUT, ServerBackendException, create_backend
 from Runtimes.Auth.JWTMiddleware import JWTAuthMiddleware
 import threading
-from waitress import serve
-from wsgiref.simple_server import make_server
-import requests
-import time
 
 class ServerThread(threading.Thread):
     """
-    Threaded server for hosting a Falcon application.
+    Thread hosting a Falcon application on a TCP port, or on a Unix domain socket when a
+    path is given, with a server backend from AddasuSec.ServerBackend.
     """
-    def __init__(self, app, port):
+    def __init__(self, app, port, path=None, backend=None, options=None):
         super().__init__()
         self.app = app
         self.port = port
-        self.httpd = None
+        self.path = path
+        self.error = None
+        self.server = create_backend(backend, app, port, path, **(options or {}))
 
     def run(self):
-        print(f"Serving on http://127.0.0.1:{self.port}")
-        with make_server('', self.port, self.app) as self.httpd:
-            self.httpd.serve_forever()
+        print(f"Serving on {self.server.address()} ({self.server.name})")
+        try:
+            self.server.serve()
+        except Exception as e:
+            # Reported to the thread waiting in wait_ready()
+            self.error = e
+            self.server.ready.set()
+
+    def wait_ready(self, timeout=DEFAULT_READY_TIMEOUT):
+        """
+        Block until the server is bound and listening.
+
+        Args:
+            timeout (float): Seconds to wait.
+
+        Raises:
+            ServerBackendException: If the server failed to start or is not ready in time.
+        """
+        if not self.server.ready.wait(timeout):
+            raise ServerBackendException(f"Server on {self.server.address()} not ready after {timeout}s")
+        if self.error is not None:
+            raise ServerBackendException(f"Server on {self.server.address()} failed to start - {self.error}")
 
     def stop(self):
-        if self.httpd:
-            print("Shutting down server...")
-            self.httpd.shutdown()
-            try:
-                requests.get(f'http://localhost:{self.port}/__shutdown__')
-            except Exception:
-                pass
+        print("Shutting down server...")
+        self.server.stop()
 
 class WebComponent:
     """
@@ -58,6 +81,17 @@ class WebComponent:
 
     innerComponent = None
     receptacles = {}
+    meta = None
+    label = None
+    # falcon application class; AsgiWebComponent serves a falcon.asgi.App
+    app_class = falcon.App
+    server = None
+    unix_server = None
+    # SharedHost the component is mounted on, when multiplexed (see AddasuSec.SharedHost)
+    shared_host = None
+    # False when other processes serve the component, so co-located receptacles must not
+    # call this instance directly (see AddasuSec.LocalBinding)
+    bindable = True
 
     def __init__(self, component, secure):
         """
@@ -68,23 +102,42 @@ class WebComponent:
             secure (bool): Enable JWT authentication if True.
         """
         self.innerComponent = component
+        self.secure = secure
         for item in component.receptacles:
             rcp = WebReceptacle.WebReceptacle(item)
             self.innerComponent.receptacles[item] = rcp
 
         self.dynamic_routes = {}
-        self.app = falcon.App(middleware=[JWTAuthMiddleware()] if secure else [])
-
-    def add_route(self, path, resource):
+        self.exposed_methods = set()
+        self.dispatch = {}
+        self.admission = AdmissionController(self)
+        self.coalescing = SingleFlight(self)
+        middleware = [CompressionMiddleware(self)]
+        if secure:
+            middleware.append(JWTAuthMiddleware())
+        self.app = self.app_class(middleware=middleware)
+        WireCodec.install(self.app)
+
+    def add_route(self, path, resource, suffix=None):
         """
-        Add a new Falcon route.
+        Add a new Falcon route. A method route also gets its dispatch entry compiled, so
+        calls are served without reflecting over the component (see AddasuSec.Dispatch).
 
         Args:
             path (str): Route path.
             resource (object): Falcon resource instance.
+            suffix (str): Responder suffix, e.g. "batch" to route to on_post_batch.
         """
         self.dynamic_routes[path] = resource
-        self.app.add_route(path, resource)
+        if suffix is None:
+            name = path.rpartition('/')[-1]
+            entry = compile_dispatch(self.innerComponent, name)
+            if entry is not None:
+                self.dispatch[name] = entry
+            self.exposed_methods.add(name)
+            self.app.add_route(path, resource)
+        else:
+            self.app.add_route(path, resource, suffix=suffix)
 
     def remove_route(self, path):
         """
@@ -94,6 +147,43 @@ class WebComponent:
             path (str): Route path to remove.
         """
         self.dynamic_routes.pop(path, None)
+        self.exposed_methods.discard(path.rpartition('/')[-1])
+        self.dispatch.pop(path.rpartition('/')[-1], None)
+
+    def bindMeta(self, meta, label):
+        """
+        Give the wrapper access to its component attributes in the meta architecture.
+
+        Args:
+            meta (MetaArchitecture): The architecture model.
+            label (str): The component's label.
+        """
+        self.meta = meta
+        self.label = label
+
+    def attribute(self, name):
+        """
+        Return one of the component's attributes in the meta architecture.
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Any: The value, or None if it is not set or the wrapper is not bound yet.
+        """
+        if self.meta is None:
+            return None
+        return self.meta.getComponentAttributeValue(self.label, name)
+
+    def maxBodySize(self):
+        """
+        Return the largest request body accepted, from the "MaxBodySize" attribute.
+
+        Returns:
+            int: Size limit in bytes.
+        """
+        value = self.attribute("MaxBodySize")
+        return DEFAULT_MAX_BODY_SIZE if value is None else int(value)
 
     def call_and_serialize(self, method, *args, **kwargs):
         """
@@ -108,57 +198,119 @@ class WebComponent:
         result = method(*args, **kwargs)
         return json.dumps(result)
 
-    def startThreadedServer(self, port):
+    def startThreadedServer(self, port, socket_path=None, backend=None, options=None):
         """
-        Start the Falcon app on a new thread.
+        Start the Falcon app on a new thread and return once it is listening.
 
         Args:
-            port (int): Port number to run the server on.
+            port (int): Port number to run the server on, or None to serve on the socket only.
+            socket_path (str): Unix domain socket to serve on as well, or None.
+            backend (str): Server backend name (see AddasuSec.ServerBackend); the default
+                when None.
+            options (dict): Backend settings such as threads, connection_limit and keep_alive.
+
+        Raises:
+            ServerBackendException: If a server failed to start; the others are stopped.
         """
         self.port = port
-        self.server = ServerThread(self.app, port)
+        self.socket_path = socket_path
+        self.server = ServerThread(self.app, port, None, backend, options) if port is not None else None
+        self.unix_server = (ServerThread(self.app, None, socket_path, backend, options)
+                            if socket_path is not None else None)
+        for server in (self.server, self.unix_server):
+            if server is not None:
+                server.start()
+        try:
+            for server in (self.server, self.unix_server):
+                if server is not None:
+                    server.wait_ready()
+        except ServerBackendException:
+            self.stopThreadedServer()
+            raise
+
+    def startWorkers(self, port, backend=None, options=None):
+        """
+        Serve the component from worker processes sharing one listening socket (see
+        AddasuSec.Prefork).
+
+        Args:
+            port (int): Port number the workers serve.
+            backend (str): Server backend name of the workers.
+            options (dict): Backend settings; "workers" is the initial number of workers.
+
+        Raises:
+            ServerBackendException: If the port cannot be bound or fork is unavailable.
+        """
+        self.port = port
+        self.socket_path = None
+        # Calls must reach the workers, not the parent's copy of the component
+        self.bindable = False
+        self.server = PreforkServer(self, port, backend, options, (options or {}).get("workers", 1))
         self.server.start()
-        time.sleep(2)
+
+    def mountOnHost(self, host):
+        """
+        Serve the component's routes on a shared listener instead of its own servers.
+
+        Args:
+            host (SharedHost): The shared host; the component is mounted under its label.
+        """
+        # The component is reached at the shared listener's address, also by co-located
+        # receptacles binding to it directly (see AddasuSec.LocalBinding)
+        self.port = host.port
+        self.socket_path = host.path
+        self.shared_host = host
+        host.mount(self.label, self.app)
 
     def stopThreadedServer(self):
         """
-        Stop the running server and join the thread.
+        Stop the running servers and join their threads, or unmount the component from
+        its shared host.
         """
-        self.server.stop()
-        self.server.join()
+        if self.shared_host is not None:
+            self.shared_host.unmount(self.label)
+        for server in (self.server, self.unix_server):
+            if server is not None:
+                server.stop()
+                server.join()
         print("Done.")
 
     def on_post(self, req, resp):
         """
-        Handle POST request to dynamically invoke component methods.
-        Automatically resolves arguments from query parameters.
+        Handle POST request to invoke a component method through its dispatch entry.
+        Arguments are read from the query string, a codec-encoded body or a blob body.
         """
-        print("USER FROM CONTEXT:", getattr(req.context, "user", None))
+        # Reject calls whose deadline passed while they were queued
+        expires = request_deadline(req)
         nm = req.path.rpartition('/')[-1]
-        methods = [attr for attr in dir(self.innerComponent)
-                   if callable(getattr(self.innerComponent, attr)) and not attr.startswith("__")]
-        print("Available methods:", methods)
-
-        if nm in methods:
-            method = getattr(self.innerComponent, nm)
-            sig = inspect.signature(method)
-            args = []
-
-            for name, param in sig.parameters.items():
-                annotation = param.annotation
-                annotation_str = annotation if annotation != inspect._empty else str
-                print(f"  {name}: {annotation_str}")
-                args.append(self.get_typed_param(req, name, annotation_str))
-
-            if inspect.iscoroutinefunction(method):
-                result = asyncio.run(method(req, *args))
+        entry = self.dispatch.get(nm)
+
+        if entry is not None:
+            if is_blob_request(req):
+                # Binary arguments in a raw or multipart body (see AddasuSec.Blobs)
+                args = blob_arguments(req, entry.signature, entry.read_param(req), self.maxBodySize())
+            elif req.content_length:
+                # Arguments encoded in the body with a negotiated codec
+                args = entry.body_arguments(req.get_media() or {})
             else:
-                try:
-                    result = method(req, *args)
-                except Exception:
-                    result = method(*args)
-
-            print(f"Result of calling {nm}: {result}")
+                args = entry.query_arguments(req)
+
+            result = self.call_method(entry, req, args, expires)
+
+            if is_stream(result):
+                # Generators are streamed item by item (see AddasuSec.Streaming)
+                stream_result(req, resp, result, WireCodec.negotiate(req.accept),
+                              capture_request(getattr(req.context, "user", None), bearer_token(req)))
+                resp.set_header('Powered-By', 'Falcon')
+                resp.status = falcon.HTTP_200
+                return
+            if is_blob_result(entry.signature.return_annotation, result):
+                send_blob(resp, result)
+                resp.set_header('Powered-By', 'Falcon')
+                resp.status = falcon.HTTP_200
+                return
+
+            resp.content_type = WireCodec.negotiate(req.accept).content_type
             resp.media = {"result": result}
             resp.set_header('Powered-By', 'Falcon')
             resp.status = falcon.HTTP_200
@@ -170,6 +322,64 @@ class WebComponent:
                 retry_after=30
             )
 
+    def on_post_batch(self, req, resp):
+        """
+        Handle POST request carrying a batch of method invocations.
+        Results are returned in order, with errors reported per item.
+        """
+        expires = request_deadline(req)
+        calls = req.get_media().get("calls", [])
+        resp.media = {"results": invoke_batch(self, req, calls, expires)}
+        resp.set_header('Powered-By', 'Falcon')
+        resp.status = falcon.HTTP_200
+
+    def call_method(self, entry, req, args, expires=None):
+        """
+        Invoke a component method through its dispatch entry, passing the request first
+        when the method requires authorization. The request's principal and bearer token
+        are bound as the request context, and its deadline as the active deadline, for the
+        duration of the call (see AddasuSec.RequestContext and AddasuSec.Deadline). The call
+        first waits for a slot under the component's concurrency limit (see
+        AddasuSec.Admission). A coalesced call arriving while an identical one runs
+        shares its result instead (see AddasuSec.Coalescing).
+
+        Args:
+            entry (DispatchEntry): The method's precompiled dispatch entry.
+            req (falcon.Request): The incoming request.
+            args (list): Converted method arguments.
+            expires (float): The call's deadline from request_deadline, or None.
+
+        Returns:
+            Any: The method's result.
+        """
+        key = self.coalescing.key(entry, req, args)
+        if key is not None:
+            return self.coalescing.run(key, lambda: self.run_method(entry, req, args, expires), expires)
+        return self.run_method(entry, req, args, expires)
+
+    def run_method(self, entry, req, args, expires):
+        """
+        Invoke a component method once the admission controller grants a slot, with the
+        request context and deadline bound.
+
+        Args:
+            entry (DispatchEntry): The method's precompiled dispatch entry.
+            req (falcon.Request): The incoming request.
+            args (list): Converted method arguments.
+            expires (float): The call's deadline, or None.
+
+        Returns:
+            Any: The method's result.
+        """
+        with self.admission.admit(expires):
+            deadline = bind_deadline(expires)
+            handle = bind_request(getattr(req.context, "user", None), bearer_token(req))
+            try:
+                return entry.invoke(req, args)
+            finally:
+                reset_request(handle)
+                reset_deadline(deadline)
+
     def get_typed_param(self, req: falcon.Request, name: str, param_type: type):
         """
         Retrieve a typed parameter from a Falcon request.
@@ -212,7 +422,27 @@ class WebComponent:
         Connect the internal component to another component via a receptacle.
         """
         try:
-            return self.innerComponent.receptacles.get(intf).connect(component, intf, rt)
+            receptacle = self.innerComponent.receptacles.get(intf)
+            receptacle.owner = rt.meta.getLabel(self)
+            return receptacle.connect(component, intf, rt)
+        except ValueError:
+            return False
+
+    def addReplica(self, component, intf, rt):
+        """
+        Bind a further replica of the sink to a connected receptacle.
+        """
+        try:
+            return self.innerComponent.receptacles.get(intf).addReplica(component, rt)
+        except ValueError:
+            return False
+
+    def removeReplica(self, component, intf, rt):
+        """
+        Unbind one replica of the sink from a connected receptacle.
+        """
+        try:
+            return self.innerComponent.receptacles.get(intf).removeReplica(component, rt)
         except ValueError:
             return False
 
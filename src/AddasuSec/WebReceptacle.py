@@ -2,25 +2,72 @@
 WebReceptacle Module
 
 This module defines the WebReceptacle class, which simulates a networked component connector.
-It supports dynamic method calling over HTTP using method introspection and signature reflection.
-Designed to simulate a remote procedure call pattern by encoding method parameters into a URL.
+Remote methods are served by a stub compiled once per interface (see AddasuSec.InterfaceStub)
+and bound to the sink at connect time, so a call is an HTTP POST to a precomputed endpoint
+URL. The arguments travel in the request body, encoded with the most compact codec
+available (MessagePack, CBOR or JSON, see AddasuSec.WireCodec), or as query-string
+arguments when the "Codec" receptacle attribute is "query" or the sink rejects the codec.
+A connection to a single sink served by the same process calls it directly (see
+AddasuSec.LocalBinding) unless the "ShortCircuit" receptacle attribute is False.
+Methods annotated as returning an iterator return a lazy ResultStream that reads the
+items as the sink produces them (see AddasuSec.Streaming); openStream() pages through
+such a result from a cursor. Arguments annotated as bytes, memoryview or binary files
+are sent as the raw request body, or as multipart parts when there are several (see
+AddasuSec.Blobs); such calls are neither batched nor hedged. A sink on this host that is
+served on a Unix domain socket is called over the socket unless the "UnixSocket"
+receptacle attribute is False (see AddasuSec.UnixSocket).
 
 Classes:
     WebReceptacle: Represents a remote or proxy receptacle for interacting with web services.
 
+Each connection owns a PooledSession, so calls reuse keep-alive sockets rather than
+opening a new TCP connection per call. asyncProxy() returns an awaitable view of the same
+connection (see AddasuSec.AsyncWebReceptacle). Calls can be batched into a single request,
+either explicitly with batch() or by gathering concurrent calls with enableBatching().
+Results of methods marked cacheable on the interface are kept in a per-connection LRU
+cache that is cleared whenever the receptacle is connected or disconnected. A receptacle
+can be bound to several replicas of a component; calls are then balanced across them by
+its ReplicaSet. Idempotent methods can be hedged (enableHedging) to cut tail latency.
+Every request has a timeout and passes through the connection's
+CircuitBreaker, whose state is published as the "CircuitState" receptacle attribute.
+Each method's timeout adapts to the latencies observed on the connection, and every
+request carries a deadline that the sink enforces and propagates to its own calls (see
+AddasuSec.Deadline). Requests advertise gzip and deflate, so large replies arrive
+compressed (see AddasuSec.Compression). Calls shed by an overloaded sink are retried after
+its Retry-After with jittered backoff (see AddasuSec.Admission).
+
 Dependencies:
     - requests
-    - json
     - requests.auth.HTTPBasicAuth
     - inspect
     - importlib
 """
 
-import requests
-import json
 from requests.auth import HTTPBasicAuth
 import inspect
 import importlib
+import os
+import time
+from AddasuSec.PooledSession import PooledSession
+from AddasuSec.AsyncWebReceptacle import AsyncPooledSession, AsyncReceptacleProxy, hedge, run_blocking, send_request
+from AddasuSec.InterfaceStub import get_stub_class
+from AddasuSec.Batch import CallBatcher, ExplicitBatch
+from AddasuSec.ResultCache import ResultCache
+from AddasuSec.ReplicaSet import Replica, ReplicaSet
+from AddasuSec.CircuitBreaker import CircuitBreaker
+from AddasuSec.RequestContext import request_token
+from AddasuSec.WireCodec import get_codec, preferred_codec
+from AddasuSec.LocalBinding import local_binding
+from AddasuSec.UnixSocket import is_local_host, unix_url
+from AddasuSec.Hedging import HedgingPolicy
+from AddasuSec.Streaming import ResultStream
+from AddasuSec.Blobs import MEDIA_OCTET, encode_blobs
+from AddasuSec.Deadline import DEADLINE_HEADER, AdaptiveTimeout, DeadlineExceededException, remaining
+from AddasuSec.Admission import DEFAULT_OVERLOAD_RETRIES, OverloadedException, backoff_delay, overload_delay
+
+DEFAULT_TIMEOUT = 30.0
+# Reply encodings the component servers can apply (see AddasuSec.Compression)
+ACCEPT_ENCODING = 'gzip, deflate'
 
 class WebReceptacle:
     def __init__(self, iden):
@@ -29,50 +76,306 @@ class WebReceptacle:
         self.m_connID = -1
         self.meta_Data = {}
         self.url = 'http://'
+        self.owner = None
+        self.stub = None
+        self.batcher = None
+        self.hedging = None
+        self.cache = ResultCache()
+        self.replicas = ReplicaSet()
+        self.breaker = CircuitBreaker()
+        self.timeout = DEFAULT_TIMEOUT
+        self.overload_retries = DEFAULT_OVERLOAD_RETRIES
+        self.adaptive = AdaptiveTimeout()
+        self.codec = preferred_codec()
+        self.local = None
+        self.short_circuit = True
+        self.unix_socket = True
+        self.session = PooledSession()
+        self.async_session = AsyncPooledSession(self.session.pool_size)
+        self.auth = HTTPBasicAuth('user', 'pass')
 
     def __getattr__(self, nameA):
-        def method(*args, **kwargs):
-            print(f"Called method: {nameA}")
-            print(f"  Positional args: {args}")
-            print(f"  Keyword args: {kwargs}")
-            self.url += nameA
-
-            sig = self.get_method_signature_from_class_name(self.iid, nameA)
-            return_annotation = sig.return_annotation
-            print("Return type from signature:", return_annotation)
-
-            if sig.parameters:
-                self.url += '?'
-
-            i = 0
-            for name, param in sig.parameters.items():
-                if name != "self":
-                    annotation = param.annotation
-                    annotation_str = annotation if annotation != inspect._empty else "No type annotation"
-                    print(f"  {name}: {annotation_str}")
-                    self.url += f"{name}={args[i]}&"
-                    i += 1
-
-            if i > 0:
-                self.url = self.url[:-1]
-
-            basic = HTTPBasicAuth('user', 'pass')
-            response = requests.post(self.url, auth=basic)
-            y = json.loads(response.text)
-
-            extracted_value = None
-            for key, value in y.items():
-                if isinstance(value, return_annotation):
-                    extracted_value = value
-                    print(f"Matched key: {key}, Value: {value}")
-                    break
-
-            if extracted_value is None:
-                print("No matching value found.")
-
-            return extracted_value
-
-        return method
+        """Resolve interface methods on the stub bound at connect time."""
+        stub = self.__dict__.get('stub')
+        if stub is None or nameA.startswith('__'):
+            raise AttributeError(f"'{nameA}' is not available: receptacle '{self.__dict__.get('iid')}' is not connected")
+        return getattr(stub, nameA)
+
+    def invoke(self, spec, params, headers=None):
+        """
+        Perform one remote call. Called by the stub methods.
+
+        Args:
+            spec (MethodSpec): Precomputed description of the method.
+            params (dict): Parameter name to value.
+            headers (dict): Extra request headers; basic auth is used when None.
+
+        Returns:
+            Any: The decoded result.
+        """
+        if spec.cacheable and not spec.streaming:
+            key = spec.cache_key(params, headers)
+            if key is not None:
+                found, value = self.cache.get(key)
+                if not found:
+                    # Failed calls raise; a reply without a result is not cached either
+                    value = self.call(spec, params, headers)
+                    if value is not None:
+                        self.cache.put(key, value, spec.cache_ttl)
+                return value
+        return self.call(spec, params, headers)
+
+    def call(self, spec, params, headers=None):
+        """
+        Send one remote call to a replica of the sink, bypassing the result cache.
+
+        Args:
+            spec (MethodSpec): Precomputed description of the method.
+            params (dict): Parameter name to value.
+            headers (dict): Extra request headers; basic auth is used when None.
+
+        Returns:
+            Any: The decoded result.
+
+        Raises:
+            DeadlineExceededException: If the active deadline has passed.
+        """
+        left = remaining()
+        if left is not None and left <= 0:
+            raise DeadlineExceededException(f"Deadline passed before calling {spec.name}")
+        local = self.local
+        if local is not None and local.active(spec.name):
+            return local.invoke(spec, params, headers)
+        if spec.streaming:
+            return ResultStream(self, spec, params, headers)
+        if spec.blobs:
+            return self.send(spec, params, headers)
+        if self.batcher is not None:
+            return self.batcher.call(spec, params, headers)
+        if self.hedging is not None and spec.idempotent:
+            return self.hedged(spec, params, headers)
+        return self.send(spec, params, headers)
+
+    def send(self, spec, params, headers=None):
+        """
+        Send one request to the replica chosen by the balancing policy, retrying after a
+        jittered backoff while the sink rejects it as overloaded.
+
+        Args:
+            spec (MethodSpec): Precomputed description of the method.
+            params (dict): Parameter name to value.
+            headers (dict): Extra request headers; basic auth is used when None.
+
+        Returns:
+            Any: The decoded result.
+
+        Raises:
+            OverloadedException: If the sink still sheds the call after the retries.
+            requests.HTTPError: If the sink replied with an error status.
+        """
+        timeout = self.callTimeout(spec.name)
+        # Retries are budgeted apart from the adaptive timeout of one attempt
+        end = time.monotonic() + self.retryBudget()
+        attempt = 0
+        while True:
+            replica = self.acquire()
+            start = time.monotonic()
+            ok = False
+            retry_after = None
+            try:
+                response = self.post(replica.endpoints[spec.name], params, headers, blobs=spec.blobs,
+                                     timeout=min(timeout, end - start))
+                retry_after = overload_delay(response.status_code, response.headers)
+                # A call the sink shed is retried below; it is not a failure of the sink
+                ok = response.status_code < 500 or retry_after is not None
+            finally:
+                latency = time.monotonic() - start
+                self.release(replica, latency, ok)
+                if ok and retry_after is None and self.adaptive is not None:
+                    self.adaptive.record(spec.name, latency)
+                if ok and retry_after is None and self.hedging is not None:
+                    self.hedging.record(latency)
+            if retry_after is None:
+                break
+            # The sink shed the call (see AddasuSec.Admission); blob bodies cannot be replayed
+            delay = backoff_delay(retry_after, attempt)
+            response.close()
+            if spec.blobs or attempt >= self.overload_retries or time.monotonic() + delay >= end:
+                raise OverloadedException(f"{spec.name} rejected by an overloaded sink, retry after {retry_after:.3g}s")
+            time.sleep(delay)
+            attempt += 1
+        if response.status_code == 504:
+            raise DeadlineExceededException(f"Deadline of {spec.name} passed at the sink")
+        # Error replies carry no result: surface them rather than decoding them to None
+        response.raise_for_status()
+        return spec.decode(response.content, get_codec(response.headers.get('Content-Type')))
+
+    def post(self, url, params, headers=None, stream=False, blobs=None, timeout=None):
+        """
+        POST the arguments of a call, in the body with the connection's codec or, when no
+        codec is set, as query-string parameters. Blob arguments are sent as the body and
+        the others in the query string.
+
+        Args:
+            url (str): Endpoint URL of the method.
+            params (dict): Parameter name to value.
+            headers (dict): Extra request headers; basic auth is used unless they carry
+                an Authorization header.
+            stream (bool): Leave the response body unread, for streamed results.
+            blobs (list[str]): Names of the parameters sent as the raw or multipart body.
+            timeout (float): Seconds to wait for the sink, also sent as the call's deadline;
+                the receptacle's timeout when None.
+
+        Returns:
+            requests.Response: The HTTP response.
+        """
+        codec = self.codec
+        auth = None if headers and 'Authorization' in headers else self.auth
+        if timeout is None:
+            timeout = self.timeout
+        request_headers = {DEADLINE_HEADER: f"{time.time() + timeout:.3f}",
+                           'Accept-Encoding': ACCEPT_ENCODING}
+        if blobs:
+            data, files = encode_blobs({name: params.get(name) for name in blobs})
+            query = {name: value for name, value in params.items() if name not in blobs}
+            if files is None:
+                request_headers['Content-Type'] = MEDIA_OCTET
+            if headers:
+                request_headers.update(headers)
+            return self.session.post(url, params=query, data=data, files=files, headers=request_headers,
+                                     auth=auth, timeout=timeout, stream=stream)
+        if codec is not None:
+            request_headers['Content-Type'] = codec.content_type
+            request_headers['Accept'] = codec.content_type
+            if headers:
+                request_headers.update(headers)
+            response = self.session.post(url, data=codec.dumps(params), headers=request_headers,
+                                         auth=auth, timeout=timeout, stream=stream)
+            if response.status_code != 415:
+                return response
+            # The sink cannot decode this codec: fall back to query-string arguments
+            response.close()
+            self.codec = None
+            del request_headers['Content-Type'], request_headers['Accept']
+        elif headers:
+            request_headers.update(headers)
+        return self.session.post(url, params=params, headers=request_headers, auth=auth,
+                                 timeout=timeout, stream=stream)
+
+    def callTimeout(self, name, deadlines=None):
+        """
+        Return the timeout of the next call to a method: its adaptive timeout, shortened
+        to the time left before the active deadline.
+
+        Args:
+            name (str): Method name.
+            deadlines (list): Deadlines of the callers a batch request serves, in seconds
+                since the epoch, None for a caller without one; the request may run until
+                the last of them. The active deadline is used when omitted.
+
+        Returns:
+            float: Seconds.
+
+        Raises:
+            DeadlineExceededException: If the deadline has passed.
+        """
+        timeout = self.adaptive.timeout(name, self.timeout) if self.adaptive is not None else self.timeout
+        if deadlines is None:
+            left = remaining()
+        else:
+            left = None if None in deadlines else max(deadlines) - time.time()
+        if left is not None:
+            if left <= 0:
+                raise DeadlineExceededException(f"Deadline passed before calling {name}")
+            if left < timeout:
+                timeout = left
+        return timeout
+
+    def retryBudget(self):
+        """
+        Return the time a call may spend on the attempts and backoff delays of its
+        overload retries: the static "Timeout", cut at the active deadline.
+
+        Returns:
+            float: Seconds.
+        """
+        left = remaining()
+        return self.timeout if left is None or left > self.timeout else left
+
+    def hedged(self, spec, params, headers=None):
+        """
+        Send a call and, if it is slower than the hedging delay, a second identical request;
+        the first successful reply wins and the other request is cancelled. Both requests
+        run on the client event loop (see AddasuSec.AsyncWebReceptacle.hedge), so the
+        calling thread only waits for the winning reply.
+
+        Args:
+            spec (MethodSpec): Precomputed description of an idempotent method.
+            params (dict): Parameter name to value.
+            headers (dict): Extra request headers; basic auth is used when None.
+
+        Returns:
+            Any: The decoded result.
+        """
+        delay = self.hedging.delay()
+        if delay is None:
+            return self.send(spec, params, headers)
+        timeout, budget = self.callTimeout(spec.name), self.retryBudget()
+        content, content_type = run_blocking(
+            hedge(self.hedging, lambda: send_request(self, spec, params, headers, timeout, budget), delay),
+            budget)
+        return spec.decode(content, get_codec(content_type))
+
+    def acquire(self):
+        """
+        Admit a request through the circuit breaker and pick the replica to send it to.
+
+        Returns:
+            Replica: The chosen replica; pass it to release() once the request completes.
+
+        Raises:
+            CircuitOpenException: If the breaker is open.
+            LookupError: If no replica is bound.
+        """
+        self.breaker.allow()
+        try:
+            return self.replicas.choose()
+        except Exception:
+            # Release a half-open trial that will never be recorded
+            self.breaker.cancel()
+            raise
+
+    def release(self, replica, latency, ok):
+        """
+        Record the outcome of a request started with acquire().
+
+        Args:
+            replica (Replica): The replica returned by acquire().
+            latency (float): Request duration in seconds.
+            ok (bool): False if the request failed or timed out.
+        """
+        self.replicas.finish(replica, latency, ok)
+        self.breaker.record(latency, ok)
+
+    def openStream(self, name, *args, cursor=0, limit=None, headers=None, **kwargs):
+        """
+        Open the streamed result of an iterator method at a cursor, e.g. to fetch one page.
+
+        Args:
+            name (str): Name of a method annotated as returning an iterator.
+            *args: Arguments of the call.
+            cursor (int): Number of leading items to skip.
+            limit (int): Maximum number of items to read, or None for the rest.
+            headers (dict): Extra request headers; basic auth is used when None.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            ResultStream: Lazy iterator whose cursor can open the next page.
+        """
+        spec = self.stub.specs[name]
+        if not spec.streaming:
+            raise TypeError(f"{name}() does not return an iterator")
+        return ResultStream(self, spec, spec.bind(args, kwargs), headers, cursor, limit)
 
     def dynamic_call(self, name: str, *args, **kwargs):
         """Dynamically calls a method named 'get_<name>' if available."""
@@ -100,22 +403,295 @@ class WebReceptacle:
         return inspect.signature(func)
 
     def connect(self, pIUnkSink, riid, rt):
-        """Connects to another component via the provided receptacle interface."""
+        """
+        Connects to another component via the provided receptacle interface.
+
+        pIUnkSink may be a single component or a list of replicas of the same component,
+        in which case calls are balanced across them. The pool settings, result cache size,
+        balancing policy, hedging and wire codec are taken from the "PoolSize",
+        "IdleTimeout", "CacheSize", "Balancing", "HedgePercentile", "HedgeBudget" and
+        "Codec" receptacle attributes of the owning component when set, the session is
+        registered with the runtime's reaper and a connection to each sink is opened ahead
+        of the first call. Cached results of any previous binding are dropped.
+        """
         if riid != self.iid:
             return False
 
+        sinks = pIUnkSink if isinstance(pIUnkSink, (list, tuple)) else [pIUnkSink]
+        self.stub = None
+        self.replicas.clear()
+        if self.owner is not None:
+            self.session.configure(
+                rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "PoolSize"),
+                rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "IdleTimeout"),
+                len(sinks))
+            rt.meta.setReceptacleAttributeValue(self.owner, self.iid, "PoolSize", self.session.pool_size)
+            rt.meta.setReceptacleAttributeValue(self.owner, self.iid, "IdleTimeout", self.session.idle_timeout)
+            cache_size = rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "CacheSize")
+            if cache_size is not None:
+                self.cache.resize(int(cache_size))
+            rt.meta.setReceptacleAttributeValue(self.owner, self.iid, "CacheSize", self.cache.max_size)
+            balancing = rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "Balancing")
+            if balancing is not None:
+                self.replicas.policy = balancing
+            rt.meta.setReceptacleAttributeValue(self.owner, self.iid, "Balancing", self.replicas.policy)
+            self.configureBreaker(rt)
+            codec = rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "Codec")
+            if codec is not None:
+                self.codec = get_codec(codec)
+            rt.meta.setReceptacleAttributeValue(self.owner, self.iid, "Codec",
+                                                self.codec.name if self.codec is not None else "query")
+            short_circuit = rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "ShortCircuit")
+            if short_circuit is not None:
+                self.short_circuit = bool(short_circuit)
+            rt.meta.setReceptacleAttributeValue(self.owner, self.iid, "ShortCircuit", self.short_circuit)
+            unix_socket = rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "UnixSocket")
+            if unix_socket is not None:
+                self.unix_socket = bool(unix_socket)
+            rt.meta.setReceptacleAttributeValue(self.owner, self.iid, "UnixSocket", self.unix_socket)
+            percentile = rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "HedgePercentile")
+            budget = rt.meta.getReceptacleAttributeValue(self.owner, self.iid, "HedgeBudget")
+            if percentile is not None or budget is not None:
+                self.enableHedging(percentile if percentile is not None else 95.0,
+                                   budget if budget is not None else 0.05)
+        else:
+            self.session.configure(hosts=len(sinks))
+        self.cache.clear()
+        self.breaker.reset()
+        self.async_session.close()
+        self.async_session.pool_size = self.session.pool_size
+        rt.reaper.register(self.session)
+
+        for sink in sinks:
+            self.addReplica(sink, rt)
         self._Comp = self
+        return True
+
+    def addReplica(self, pIUnkSink, rt):
+        """
+        Add a replica of the sink component to this connection.
+
+        Args:
+            pIUnkSink (object): The replica component or its label.
+            rt (WebRuntime | clientRuntime): Runtime holding the meta architecture.
+
+        Returns:
+            bool: True once the replica is bound.
+        """
+        compName = rt.meta.getLabel(pIUnkSink)
+        host = rt.meta.getComponentAttributeValue(compName, "Host")
+        path = rt.meta.getComponentAttributeValue(compName, "Socket")
+        if self.unix_socket and path is not None and is_local_host(host) and os.path.exists(path):
+            url = unix_url(path, compName)
+        else:
+            url = 'http://' + host + f"/{compName}/"
+        stub = get_stub_class(self.iid)(self, url)
+        self.replicas.add(Replica(compName, url, stub.endpoints))
+        if self.stub is None:
+            self.stub = stub
+            self.url = url
+        if len(self.replicas) > self.session.hosts:
+            self.session.configure(hosts=len(self.replicas))
+        self.updateReplicaMeta(rt)
+        self.session.open(url)
+        return True
+
+    def removeReplica(self, pIUnkSink, rt):
+        """
+        Remove a replica from this connection. The last replica cannot be removed; use
+        disconnect instead.
+
+        Args:
+            pIUnkSink (object): The replica component or its label.
+            rt (WebRuntime | clientRuntime): Runtime holding the meta architecture.
+
+        Returns:
+            bool: True if the replica was removed.
+        """
         compName = rt.meta.getLabel(pIUnkSink)
-        self.url += rt.meta.getComponentAttributeValue(compName, "Host") + f"/{compName}/"
+        if len(self.replicas) < 2 or not self.replicas.remove(compName):
+            return False
+        self.url = self.replicas.primary().url
+        self.updateReplicaMeta(rt)
         return True
 
+    def configureBreaker(self, rt):
+        """
+        Apply the "Timeout", "AdaptiveTimeout", "TimeoutPercentile", "TimeoutFactor",
+        "FailureThreshold", "LatencyThreshold", "ResetTimeout" and "OverloadRetries"
+        receptacle attributes of the owning component, write the effective values back and
+        publish breaker transitions to the "CircuitState" attribute. "Timeout" caps the
+        adaptive timeouts.
+
+        Args:
+            rt (WebRuntime | clientRuntime): Runtime holding the meta architecture.
+        """
+        meta, owner, iid = rt.meta, self.owner, self.iid
+        timeout = meta.getReceptacleAttributeValue(owner, iid, "Timeout")
+        if timeout is not None:
+            self.timeout = float(timeout)
+        adaptive = meta.getReceptacleAttributeValue(owner, iid, "AdaptiveTimeout")
+        percentile = meta.getReceptacleAttributeValue(owner, iid, "TimeoutPercentile")
+        factor = meta.getReceptacleAttributeValue(owner, iid, "TimeoutFactor")
+        if adaptive is not None and not adaptive:
+            self.adaptive = None
+        else:
+            self.adaptive = AdaptiveTimeout(float(percentile) if percentile is not None else 99.0,
+                                            float(factor) if factor is not None else 3.0)
+        retries = meta.getReceptacleAttributeValue(owner, iid, "OverloadRetries")
+        if retries is not None:
+            self.overload_retries = max(int(retries), 0)
+        self.breaker.configure(
+            meta.getReceptacleAttributeValue(owner, iid, "FailureThreshold"),
+            meta.getReceptacleAttributeValue(owner, iid, "LatencyThreshold"),
+            meta.getReceptacleAttributeValue(owner, iid, "ResetTimeout"))
+        meta.setReceptacleAttributeValue(owner, iid, "Timeout", self.timeout)
+        meta.setReceptacleAttributeValue(owner, iid, "AdaptiveTimeout", self.adaptive is not None)
+        if self.adaptive is not None:
+            meta.setReceptacleAttributeValue(owner, iid, "TimeoutPercentile", self.adaptive.percentile)
+            meta.setReceptacleAttributeValue(owner, iid, "TimeoutFactor", self.adaptive.factor)
+        meta.setReceptacleAttributeValue(owner, iid, "FailureThreshold", self.breaker.failure_threshold)
+        meta.setReceptacleAttributeValue(owner, iid, "LatencyThreshold", self.breaker.latency_threshold)
+        meta.setReceptacleAttributeValue(owner, iid, "ResetTimeout", self.breaker.reset_timeout)
+        meta.setReceptacleAttributeValue(owner, iid, "OverloadRetries", self.overload_retries)
+        meta.setReceptacleAttributeValue(owner, iid, "CircuitState", self.breaker.state)
+        self.breaker.listener = lambda state: meta.setReceptacleAttributeValue(owner, iid, "CircuitState", state)
+
+    def updateReplicaMeta(self, rt):
+        """
+        Record the labels of the bound replicas as the "Replicas" receptacle attribute and
+        bind a single co-located sink directly.
+        """
+        self.local = None
+        if self.short_circuit and len(self.replicas) == 1:
+            self.local = local_binding(rt.meta, self.replicas.primary().label)
+        if self.owner is not None:
+            rt.meta.setReceptacleAttributeValue(self.owner, self.iid, "Replicas", self.replicas.labels())
+
     def disconnect(self, iden):
-        """Disconnects a component based on its identity."""
+        """Disconnects a component based on its identity and releases its pooled sockets."""
         if iden != self.iid:
             return False
         self._Comp = None
+        self.stub = None
+        self.local = None
+        self.replicas.clear()
+        self.cache.clear()
+        self.session.close()
+        self.async_session.close()
         return True
 
+    def configurePool(self, pool_size=None, idle_timeout=None):
+        """
+        Change the connection pool settings of this connection.
+
+        Args:
+            pool_size (int): Maximum number of pooled connections to the sink.
+            idle_timeout (float): Seconds before idle sockets are closed.
+        """
+        self.session.configure(pool_size, idle_timeout)
+        self.async_session.close()
+        self.async_session.pool_size = self.session.pool_size
+
+    def batch(self, headers=None):
+        """
+        Start an explicit batch. Methods called on the returned object are sent together
+        in one request when the with-block exits.
+
+        Args:
+            headers (dict): Extra request headers, e.g. {'Authorization': 'Bearer ...'}.
+
+        Returns:
+            ExplicitBatch: Context manager whose interface methods return BatchCall objects.
+        """
+        return ExplicitBatch(self, headers)
+
+    def enableBatching(self, window=0.002, max_size=64):
+        """
+        Gather calls issued concurrently on this connection into batch requests.
+
+        Args:
+            window (float): Seconds the first call of a batch waits for further calls.
+            max_size (int): Number of queued calls that sends the batch immediately.
+        """
+        self.batcher = CallBatcher(self, window, max_size)
+
+    def disableBatching(self):
+        """Send every call in its own request again."""
+        self.batcher = None
+
+    def enableHedging(self, percentile=95.0, budget=0.05, min_samples=20):
+        """
+        Hedge calls to idempotent methods that take longer than the given latency percentile.
+
+        Args:
+            percentile (float): Latency percentile (0-100) after which a hedge is sent.
+            budget (float): Maximum ratio of hedged requests to hedgeable calls.
+            min_samples (int): Calls observed before hedging starts.
+        """
+        self.hedging = HedgingPolicy(float(percentile), float(budget), int(min_samples))
+
+    def disableHedging(self):
+        """Stop hedging calls."""
+        self.hedging = None
+
+    def hedgeStats(self):
+        """
+        Return the hedging counters of this connection.
+
+        Returns:
+            dict: calls, hedges, hedge_wins and delay, or None if hedging is disabled.
+        """
+        return self.hedging.stats() if self.hedging is not None else None
+
+    def timeoutStats(self):
+        """
+        Return the timeouts adapted to the latencies of each method.
+
+        Returns:
+            dict: Method name to timeout in seconds; empty if adaptive timeouts are off.
+        """
+        return self.adaptive.stats() if self.adaptive is not None else {}
+
+    def circuitState(self):
+        """
+        Return the state of the connection's circuit breaker.
+
+        Returns:
+            str: "closed", "open" or "half_open".
+        """
+        return self.breaker.state
+
+    def replicaStats(self):
+        """
+        Return the balancing statistics of the bound replicas.
+
+        Returns:
+            dict: Replica label to outstanding calls, latency, error rate and ejection state.
+        """
+        return self.replicas.stats()
+
+    def cacheStats(self):
+        """
+        Return the result cache counters of this connection.
+
+        Returns:
+            dict: Hits, misses, current size and size limit.
+        """
+        return self.cache.stats()
+
+    def asyncProxy(self, timeout=None):
+        """
+        Return an awaitable view of this connection.
+
+        Args:
+            timeout (float): Per-call timeout in seconds, or None for the receptacle's.
+
+        Returns:
+            AsyncReceptacleProxy: Proxy whose interface methods are coroutines.
+        """
+        return AsyncReceptacleProxy(self, timeout)
+
     def putData(self, name, value):
         """Store metadata key-value pair."""
         self.meta_Data.update([name, value])
@@ -129,56 +705,10 @@ class WebReceptacle:
         return self.meta_Data.keys
 
     def receptacle_with_token(self, func, *args, **kwargs):
-        """Performs a token-authenticated method call using context from a previous frame."""
-        stack = inspect.stack()
-        previous_frame = stack[2].frame
-        prev_args = previous_frame.f_locals
-        print("Previous call's arguments:", prev_args)
-
-        req = prev_args['req']
-        token = None
-        if hasattr(req, "get_header") and callable(req.get_header):
-            auth_header = req.get_header("Authorization", default=None)
-            if auth_header and auth_header.lower().startswith("bearer "):
-                token = auth_header[7:]
-        else:
-            token = req
-
-        nameA = inspect.stack()[1].function
-        self.url += nameA
-
-        sig = self.get_method_signature_from_class_name(self.iid, nameA)
-        return_annotation = sig.return_annotation
-        print("Return type from signature:", return_annotation)
-
-        if sig.parameters:
-            self.url += '?'
-        i = 0
-        for name, param in sig.parameters.items():
-            if name != "self":
-                annotation = param.annotation
-                annotation_str = annotation if annotation != inspect._empty else "No type annotation"
-                print(f"  {name}: {annotation_str}")
-                self.url += f"{name}={args[i]}&"
-                i += 1
-
-        if i > 0:
-            self.url = self.url[:-1]
-
+        """Performs a remote call carrying the bearer token of the request being served."""
+        token = request_token()
+        spec = self.stub.specs[func.__name__]
         headers = {
             'Authorization': f'Bearer {token}'
         }
-        response = requests.post(self.url, headers=headers)
-        y = json.loads(response.text)
-
-        extracted_value = None
-        for key, value in y.items():
-            if isinstance(value, return_annotation):
-                extracted_value = value
-                print(f"Matched key: {key}, Value: {value}")
-                break
-
-        if extracted_value is None:
-            print("No matching value found.")
-
-        return extracted_value
+        return self.invoke(spec, spec.bind(args, kwargs), headers)
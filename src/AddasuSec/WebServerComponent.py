@@ -10,14 +10,20 @@ Classes:
 Author: Paul Grace
 """
 
-from wsgiref.simple_server import make_server
 import falcon
-import inspect
-import asyncio
 import datetime
 import uuid
 import json
 from AddasuSec.Receptacle import Receptacle
+from AddasuSec.Batch import invoke_batch
+from AddasuSec.Dispatch import compile_dispatch
+from AddasuSec import WireCodec
+from AddasuSec.RequestContext import bearer_token, bind_request, capture_request, reset_request
+from AddasuSec.Streaming import is_stream, stream_result
+from AddasuSec.Deadline import bind_deadline, request_deadline, reset_deadline
+from AddasuSec.Admission import AdmissionController
+from AddasuSec.Coalescing import SingleFlight
+from AddasuSec.Blobs import DEFAULT_MAX_BODY_SIZE, blob_arguments, is_blob_request, is_blob_result, send_blob
 
 
 class WebServerComponent:
@@ -28,11 +34,19 @@ class WebServerComponent:
         innerComponent (Any): The wrapped component exposing methods over HTTP.
         receptacles (dict): Dictionary of receptacles.
         secure (bool): Indicates if the component is operating in secure mode.
+        exposed_methods (set[str]): Names of the methods routed over HTTP.
+        dispatch (dict[str, DispatchEntry]): Precompiled call information per routed method.
+        server (WSGIRefBackend | WaitressBackend): The server hosting the component's app.
+        admission (AdmissionController): Concurrency limit and queue of the component's calls.
+        coalescing (SingleFlight): Identical calls in flight (see AddasuSec.Coalescing).
     """
 
     innerComponent = None
     receptacles = {}
     secure = False
+    meta = None
+    label = None
+    server = None
 
     def __init__(self, component):
         """
@@ -43,6 +57,58 @@ class WebServerComponent:
         """
         self.innerComponent = component
         self.receptacles = component.receptacles
+        self.exposed_methods = set()
+        self.dispatch = {}
+        self.admission = AdmissionController(self)
+        self.coalescing = SingleFlight(self)
+
+    def add_method(self, name: str) -> None:
+        """
+        Expose a method of the inner component and compile its dispatch entry, so calls
+        are served without reflecting over the component (see AddasuSec.Dispatch).
+
+        Args:
+            name (str): Method name; its route is "/<label>/<name>".
+        """
+        entry = compile_dispatch(self.innerComponent, name)
+        if entry is not None:
+            self.dispatch[name] = entry
+        self.exposed_methods.add(name)
+
+    def bindMeta(self, meta, label) -> None:
+        """
+        Give the wrapper access to its component attributes in the meta architecture.
+
+        Args:
+            meta (MetaArchitecture): The architecture model.
+            label (str): The component's label.
+        """
+        self.meta = meta
+        self.label = label
+
+    def attribute(self, name: str):
+        """
+        Return one of the component's attributes in the meta architecture.
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Any: The value, or None if it is not set or the wrapper is not bound yet.
+        """
+        if self.meta is None:
+            return None
+        return self.meta.getComponentAttributeValue(self.label, name)
+
+    def maxBodySize(self) -> int:
+        """
+        Return the largest request body accepted, from the "MaxBodySize" attribute.
+
+        Returns:
+            int: Size limit in bytes.
+        """
+        value = self.attribute("MaxBodySize")
+        return DEFAULT_MAX_BODY_SIZE if value is None else int(value)
 
     def on_post(self, req: falcon.Request, resp: falcon.Response) -> None:
         """
@@ -55,35 +121,36 @@ class WebServerComponent:
         Raises:
             falcon.HTTPServiceUnavailable: If the method requested is not found.
         """
-        print("USER FROM CONTEXT:", getattr(req.context, "user", None))
+        # Reject calls whose deadline passed while they were queued
+        expires = request_deadline(req)
         method_name = req.path.rpartition('/')[-1]
+        entry = self.dispatch.get(method_name)
+
+        if entry is not None:
+            if is_blob_request(req):
+                # Binary arguments in a raw or multipart body (see AddasuSec.Blobs)
+                args = blob_arguments(req, entry.signature, entry.read_param(req), self.maxBodySize())
+            elif req.content_length:
+                # Arguments encoded in the body with a negotiated codec
+                args = entry.body_arguments(req.get_media() or {})
+            else:
+                args = entry.query_arguments(req)
+
+            result = self.call_method(entry, req, args, expires)
+
+            if is_stream(result):
+                # Generators are streamed item by item (see AddasuSec.Streaming)
+                stream_result(req, resp, result, WireCodec.negotiate(req.accept),
+                              capture_request(getattr(req.context, "user", None), bearer_token(req)))
+                resp.set_header('Powered-By', 'Falcon')
+                resp.status = falcon.HTTP_200
+                return
+            if is_blob_result(entry.signature.return_annotation, result):
+                send_blob(resp, result)
+                resp.set_header('Powered-By', 'Falcon')
+                resp.status = falcon.HTTP_200
+                return
 
-        methods = [
-            attr for attr in dir(self.innerComponent)
-            if callable(getattr(self.innerComponent, attr)) and not attr.startswith("__")
-        ]
-        print("Available methods:", methods)
-
-        if method_name in methods:
-            method = getattr(self.innerComponent, method_name)
-            sig = inspect.signature(method)
-            args = []
-
-            for name, param in sig.parameters.items():
-                annotation = param.annotation
-                annotation_str = annotation if annotation != inspect._empty else "No type annotation"
-                print(f"  {name}: {annotation_str}")
-                args.append(self.get_typed_param(req, name, annotation_str))
-
-            try:
-                if inspect.iscoroutinefunction(method):
-                    result = asyncio.run(method(req, *args))
-                else:
-                    result = method(req, *args)
-            except Exception:
-                result = method(*args)
-
-            print(f"Result of calling {method_name}: {result}")
         else:
             print(f"Method '{method_name}' not found.")
             raise falcon.HTTPServiceUnavailable(
@@ -92,10 +159,70 @@ class WebServerComponent:
                 retry_after=30
             )
 
+        resp.content_type = WireCodec.negotiate(req.accept).content_type
         resp.media = {'result': result}
         resp.set_header('Powered-By', 'Falcon')
         resp.status = falcon.HTTP_200
 
+    def on_post_batch(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """
+        Handle POST requests carrying a batch of method invocations.
+
+        Args:
+            req (falcon.Request): The incoming request with a {"calls": [...]} body.
+            resp (falcon.Response): The outgoing response with results in call order.
+        """
+        expires = request_deadline(req)
+        calls = req.get_media().get("calls", [])
+        resp.media = {'results': invoke_batch(self, req, calls, expires)}
+        resp.set_header('Powered-By', 'Falcon')
+        resp.status = falcon.HTTP_200
+
+    def call_method(self, entry, req: falcon.Request, args: list, expires: float = None):
+        """
+        Invoke an inner component method through its dispatch entry, passing the request
+        first when the method requires authorization. The request's principal and bearer
+        token are bound as the request context, and its deadline as the active deadline,
+        for the duration of the call, once the admission controller grants it a slot. A
+        coalesced call arriving while an identical one runs shares its result instead.
+
+        Args:
+            entry (DispatchEntry): The method's precompiled dispatch entry.
+            req (falcon.Request): The incoming request.
+            args (list): Converted method arguments.
+            expires (float): The call's deadline from request_deadline, or None.
+
+        Returns:
+            Any: The method's result.
+        """
+        key = self.coalescing.key(entry, req, args)
+        if key is not None:
+            return self.coalescing.run(key, lambda: self.run_method(entry, req, args, expires), expires)
+        return self.run_method(entry, req, args, expires)
+
+    def run_method(self, entry, req, args, expires):
+        """
+        Invoke a component method once the admission controller grants a slot, with the
+        request context and deadline bound.
+
+        Args:
+            entry (DispatchEntry): The method's precompiled dispatch entry.
+            req (falcon.Request): The incoming request.
+            args (list): Converted method arguments.
+            expires (float): The call's deadline, or None.
+
+        Returns:
+            Any: The method's result.
+        """
+        with self.admission.admit(expires):
+            deadline = bind_deadline(expires)
+            handle = bind_request(getattr(req.context, "user", None), bearer_token(req))
+            try:
+                return entry.invoke(req, args)
+            finally:
+                reset_request(handle)
+                reset_deadline(deadline)
+
     def get_typed_param(self, req: falcon.Request, name: str, param_type: type):
         """
         Retrieve and convert a typed parameter from a Falcon request.
@@ -0,0 +1,180 @@
+"""
+WireCodec Module
+
+This module defines the binary wire codecs negotiated between WebReceptacle and the
+component servers (WebComponent, WebServerComponent). A receptacle sends the arguments of
+a call in the request body, encoded with its codec and labelled by Content-Type, and asks
+for the reply in the same codec with Accept. The server decodes the body with the falcon
+media handler registered for that content type, converts each argument with the typed
+decoders of AddasuSec.TypeCodec and encodes {"result": ...} with the codec the client
+prefers. Requests without a body are still served from the query string.
+
+MessagePack and CBOR are used when their packages are installed; JSON (through orjson when
+available) is always present. Non-native values (dates, UUIDs, dataclasses, sets) are
+encoded with TypeCodec.wire_default by every codec.
+
+Classes:
+    Codec: Encoder/decoder pair for one content type.
+    CodecHandler: falcon media handler backed by a Codec.
+
+Functions:
+    get_codec: Return the codec for a content type or short name.
+    preferred_codec: Return the most compact available codec.
+    negotiate: Pick the reply codec from an Accept header.
+    install: Register every available codec on a falcon App.
+
+Dependencies:
+    - msgpack (optional)
+    - cbor2 (optional)
+    - orjson (optional)
+
+Author: Paul Grace
+"""
+
+import datetime
+import json
+import falcon
+from AddasuSec.TypeCodec import loads as json_loads, wire_default
+
+MEDIA_JSON = "application/json"
+MEDIA_MSGPACK = "application/msgpack"
+MEDIA_CBOR = "application/cbor"
+
+
+class Codec:
+    """
+    Serialisation functions for one content type.
+
+    Attributes:
+        name (str): Short name, e.g. "msgpack".
+        content_type (str): The media type sent in Content-Type and Accept.
+        dumps (callable): Encodes a value to bytes.
+        loads (callable): Decodes bytes to a value.
+    """
+
+    def __init__(self, name: str, content_type: str, dumps, loads):
+        self.name = name
+        self.content_type = content_type
+        self.dumps = dumps
+        self.loads = loads
+
+
+class CodecHandler(falcon.media.BaseHandler):
+    """falcon media handler that reads and writes request and response bodies with a Codec."""
+
+    def __init__(self, codec: Codec):
+        super().__init__()
+        self.codec = codec
+
+    def deserialize(self, stream, content_type, content_length):
+        data = stream.read()
+        if not data:
+            raise falcon.MediaNotFoundError(self.codec.name)
+        try:
+            return self.codec.loads(data)
+        except Exception as e:
+            raise falcon.MediaMalformedError(self.codec.name) from e
+
+    def serialize(self, media, content_type):
+        return self.codec.dumps(media)
+
+
+def _json_codec() -> Codec:
+    try:
+        import orjson
+
+        def dumps(value):
+            return orjson.dumps(value, default=wire_default, option=orjson.OPT_NON_STR_KEYS)
+    except ImportError:
+        def dumps(value):
+            return json.dumps(value, default=wire_default).encode()
+    return Codec("json", MEDIA_JSON, dumps, json_loads)
+
+
+def _msgpack_codec() -> Codec:
+    import msgpack
+
+    def dumps(value):
+        return msgpack.packb(value, default=wire_default, use_bin_type=True)
+
+    def loads(data):
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    return Codec("msgpack", MEDIA_MSGPACK, dumps, loads)
+
+
+def _cbor_codec() -> Codec:
+    import cbor2
+
+    def default(encoder, value):
+        encoder.encode(wire_default(value))
+
+    def dumps(value):
+        return cbor2.dumps(value, default=default, timezone=datetime.timezone.utc)
+    return Codec("cbor", MEDIA_CBOR, dumps, cbor2.loads)
+
+
+# Available codecs, most compact first
+_codecs = []
+for _factory in (_msgpack_codec, _cbor_codec):
+    try:
+        _codecs.append(_factory())
+    except ImportError:
+        pass
+_codecs.append(_json_codec())
+_by_key = {key: codec for codec in _codecs for key in (codec.name, codec.content_type)}
+
+
+def get_codec(key: str) -> Codec:
+    """
+    Return the codec for a content type or short name.
+
+    Args:
+        key (str): e.g. "application/msgpack" or "msgpack"; parameters are ignored.
+
+    Returns:
+        Codec: The codec, or None if it is not available.
+    """
+    if not key:
+        return None
+    return _by_key.get(key.split(";", 1)[0].strip().lower())
+
+
+def preferred_codec() -> Codec:
+    """
+    Return the most compact codec installed in this process.
+
+    Returns:
+        Codec: MessagePack, else CBOR, else JSON.
+    """
+    return _codecs[0]
+
+
+def negotiate(accept: str) -> Codec:
+    """
+    Pick the codec for a reply from the client's Accept header.
+
+    Args:
+        accept (str): The Accept header, or None.
+
+    Returns:
+        Codec: The first available codec listed by the client, else JSON.
+    """
+    if accept:
+        for item in accept.split(","):
+            codec = get_codec(item)
+            if codec is not None:
+                return codec
+    return _by_key[MEDIA_JSON]
+
+
+def install(app: falcon.App) -> None:
+    """
+    Register every available codec as a request and response media handler of an App.
+
+    Args:
+        app (falcon.App): The application serving component calls.
+    """
+    for codec in _codecs:
+        handler = CodecHandler(codec)
+        app.req_options.media_handlers[codec.content_type] = handler
+        app.resp_options.media_handlers[codec.content_type] = handler
@@ -0,0 +1,19 @@
+from AddasuSec.Component import Component
+from Examples.ICalculate import ICalculate
+
+class CalculatorAsync(Component, ICalculate):
+
+    receptacle1_type = "Examples.IAdd"
+    receptacle2_type = "Examples.ISub"
+
+    def __init__(self, name):
+        super().__init__({self.receptacle1_type, self.receptacle2_type})
+
+    async def add(self, a: int, b: int) -> int:
+        adder = self.getReceptacle(self.receptacle1_type, asynchronous=True)
+        return await adder.add(a, b)
+
+    async def sub(self, a: int, b: int) -> int:
+        subber = self.getReceptacle(self.receptacle2_type, asynchronous=True)
+        return await subber.sub(a, b)
+
@@ -0,0 +1,9 @@
+from AddasuSec.Component import Component
+
+class Client(Component):
+
+    receptacle1_type = "Examples.INumbers"
+    receptacle2_type = "Examples.IFiles"
+
+    def __init__(self, name):
+        super().__init__({self.receptacle1_type, self.receptacle2_type})
@@ -0,0 +1,30 @@
+from AddasuSec.Component import Component
+from Examples.IFiles import IFiles
+from typing import BinaryIO
+import hashlib
+
+class Files(Component, IFiles):
+
+    def __init__(self, name):
+        super().__init__({})
+
+    def size(self, data: bytes) -> int:
+        return len(data)
+
+    def view(self, data: memoryview) -> str:
+        return f"{type(data).__name__}:{data.nbytes}"
+
+    def upload(self, name: str, data: BinaryIO) -> str:
+        digest = hashlib.sha256()
+        while chunk := data.read(65536):
+            digest.update(chunk)
+        return f"{name}:{digest.hexdigest()}"
+
+    def pair(self, a: bytes, b: memoryview, tag: str) -> str:
+        return f"{tag}:{len(a)}:{b.nbytes}"
+
+    def fetch(self, n: int) -> bytes:
+        return bytes(i % 256 for i in range(n))
+
+    def file(self, path: str) -> BinaryIO:
+        return open(path, "rb")
@@ -0,0 +1,15 @@
+from AddasuSec.Component import Component
+from Examples.IWork import IWork
+
+class Foreman(Component, IWork):
+
+    receptacle_type = "Examples.IWork"
+
+    def __init__(self, name):
+        super().__init__({self.receptacle_type})
+
+    def work(self, seconds: float, key: str) -> str:
+        return self.getReceptacle(self.receptacle_type).work(seconds, key)
+
+    def pid(self) -> int:
+        return self.getReceptacle(self.receptacle_type).pid()
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+class IFiles(ABC):
+
+    @abstractmethod
+    def size(self, data: bytes) -> int:
+        pass
+
+    @abstractmethod
+    def view(self, data: memoryview) -> str:
+        pass
+
+    @abstractmethod
+    def upload(self, name: str, data: BinaryIO) -> str:
+        pass
+
+    @abstractmethod
+    def pair(self, a: bytes, b: memoryview, tag: str) -> str:
+        pass
+
+    @abstractmethod
+    def fetch(self, n: int) -> bytes:
+        pass
+
+    @abstractmethod
+    def file(self, path: str) -> BinaryIO:
+        pass
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterator
+from AddasuSec.Component import cacheable, idempotent
+import datetime
+
+class INumbers(ABC):
+
+    @abstractmethod
+    def count(self, n: int) -> Iterator[int]:
+        pass
+
+    @abstractmethod
+    def acount(self, n: int) -> AsyncIterator[int]:
+        pass
+
+    @abstractmethod
+    async def wait(self, seconds: float) -> float:
+        pass
+
+    @abstractmethod
+    def shift(self, d: datetime.date, days: int) -> datetime.date:
+        pass
+
+    @abstractmethod
+    def table(self, rows: int, width: int) -> dict[int, list[str]]:
+        pass
+
+    @cacheable(ttl=0.5)
+    @abstractmethod
+    def lookup(self, key: str) -> str:
+        pass
+
+    @idempotent
+    @abstractmethod
+    def sample(self, i: int) -> int:
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+class IWork(ABC):
+
+    @abstractmethod
+    def work(self, seconds: float, key: str) -> str:
+        pass
+
+    @abstractmethod
+    def pid(self) -> int:
+        pass
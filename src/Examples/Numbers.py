@@ -0,0 +1,54 @@
+from AddasuSec.Component import Component
+from Examples.INumbers import INumbers
+import asyncio
+import datetime
+import threading
+import time
+
+
+class Numbers(Component, INumbers):
+
+    def __init__(self, name):
+        super().__init__({})
+        self.delay = 0
+        self.lookups = 0
+        self.sampled = set()
+        self.lock = threading.Lock()
+
+    def count(self, n: int):
+        for i in range(n):
+            time.sleep(0.01)
+            yield i
+
+    async def acount(self, n: int):
+        for i in range(n):
+            await asyncio.sleep(0.01)
+            yield i * 10
+
+    async def wait(self, seconds: float) -> float:
+        await asyncio.sleep(seconds)
+        return seconds
+
+    def shift(self, d: datetime.date, days: int) -> datetime.date:
+        return d + datetime.timedelta(days=days)
+
+    def table(self, rows: int, width: int) -> dict[int, list[str]]:
+        return {i: ["x" * width] for i in range(rows)}
+
+    def lookup(self, key: str) -> str:
+        # Counts the lookups that reach the component; "" finds nothing and "bad" fails
+        with self.lock:
+            self.lookups += 1
+            run = self.lookups
+        if key == "bad":
+            raise KeyError(key)
+        return f"{key}#{run}" if key else None
+
+    def sample(self, i: int) -> int:
+        # The first request for a value waits for delay seconds, a repeated one does not
+        with self.lock:
+            first = i not in self.sampled
+            self.sampled.add(i)
+        if first:
+            time.sleep(self.delay)
+        return i
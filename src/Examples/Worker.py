@@ -0,0 +1,27 @@
+from AddasuSec.Component import Component
+from Examples.IWork import IWork
+import os
+import threading
+import time
+
+
+class Worker(Component, IWork):
+
+    def __init__(self, name):
+        super().__init__({})
+        self.failing = False
+        self.runs = 0
+        self.lock = threading.Lock()
+
+    def work(self, seconds: float, key: str) -> str:
+        # Takes the given time and returns the key numbered with the run that produced it
+        if self.failing:
+            raise RuntimeError("Worker is failing")
+        with self.lock:
+            self.runs += 1
+            run = self.runs
+        time.sleep(seconds)
+        return f"{key}#{run}"
+
+    def pid(self) -> int:
+        return os.getpid()
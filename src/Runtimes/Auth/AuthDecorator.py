@@ -24,6 +24,7 @@ import falcon
 from functools import wraps
 from falcon import HTTPUnauthorized, HTTPForbidden
 from Runtimes.Auth.JWTUtils import decode_token
+from AddasuSec.RequestContext import bind_request, reset_request
 
 def require_role(*allowed_roles):
     """
@@ -85,8 +86,14 @@ def role_required(required_role):
                     raise HTTPUnauthorized(description=str(e), challenges=["Bearer"])
                 if payload.get("role") != required_role:
                     raise HTTPForbidden(description=f"{required_role} role required")
-                return func(self, *args, **kwargs)
+                # Make the token available to downstream calls made by func
+                handle = bind_request(payload, req)
+                try:
+                    return func(self, *args, **kwargs)
+                finally:
+                    reset_request(handle)
 
+        wrapper._is_role_required = True
         return wrapper
     return decorator
 
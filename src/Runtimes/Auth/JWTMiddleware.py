@@ -24,4 +24,8 @@ class JWTAuthMiddleware:
             "user_id": payload["sub"],
             "role": payload["role"]
         }
-        print(req.context.user)
\ No newline at end of file
+        print(req.context.user)
+
+    async def process_request_async(self, req, resp):
+        # falcon.asgi apps call the async hook; the token check itself does not block
+        self.process_request(req, resp)
@@ -11,8 +11,22 @@ if str(PROJECT_SRC) not in sys.path:
 
 import importlib
 import inspect
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import get_type_hints
 from AddasuSec import WebComponent
+from AddasuSec.AsgiWebComponent import AsgiWebComponent
+from AddasuSec.PooledSession import SessionReaper
+from AddasuSec.SharedHost import AsgiSharedHost, SharedHost
+from AddasuSec.Prefork import PreforkServer
+from AddasuSec.Batch import BATCH_ROUTE
+from AddasuSec.Blobs import DEFAULT_MAX_BODY_SIZE
+from AddasuSec.Compression import DEFAULT_COMPRESSION_LEVEL, DEFAULT_COMPRESSION_THRESHOLD
+from AddasuSec.Admission import DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_QUEUE
+from AddasuSec.ServerBackend import (BACKENDS, DEFAULT_BACKEND, SETTING_ATTRIBUTES, AsgiBackend,
+                                     ServerBackendException, backend_settings)
 import random
 
 # Exception raised during connection and disconnection of components.
@@ -28,6 +42,111 @@ class WebRuntime():
     def __init__(self, meta):
         self.meta = meta
         self.port = 8000
+        self.reaper = SessionReaper()
+        self.socket_dir = None
+        self.tcp = True
+        self.server_backend = (DEFAULT_BACKEND, {})
+        self.component_backends = {}
+        self.multiplexed = False
+        self.shared_hosts = {}
+        # Guards label registration and port allocation when components are created concurrently
+        self.lock = threading.Lock()
+
+    def setServerBackend(self, backend, component=None, **options):
+        """
+        Choose the server backend of components created from now on (see
+        AddasuSec.ServerBackend). The effective settings are published as the
+        "ServerBackend", "ServerThreads", "ConnectionLimit" and "KeepAlive" attributes of
+        each component.
+
+        Args:
+            backend (str): "waitress", "wsgiref" or "asgi"; "asgi" hosts the components
+                with AsgiWebComponent.
+            component (str): Label of the one component to configure; all when None.
+            **options: threads, connection_limit, keep_alive (idle seconds) and backlog;
+                workers serves the component from that many processes (see
+                AddasuSec.Prefork), on a TCP port only.
+        """
+        if backend not in BACKENDS:
+            raise ServerBackendException(f"Unknown server backend {backend}")
+        if component is None:
+            self.server_backend = (backend, options)
+        else:
+            self.component_backends[component] = (backend, options)
+
+    def serveUnixSockets(self, directory=None, tcp=True):
+        """
+        Serve components created from now on at "<directory>/<label>.sock" and publish the
+        path as their "Socket" attribute; receptacles on this host then call them over the
+        socket (see AddasuSec.UnixSocket).
+
+        Args:
+            directory (str): Directory of the sockets; a new temporary directory if None.
+            tcp (bool): Keep serving each component on its TCP port as well, for callers on
+                other hosts. Without TCP the "Host" attribute is "localhost".
+
+        Returns:
+            str: The socket directory.
+        """
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="addasusec-")
+        os.makedirs(directory, exist_ok=True)
+        self.socket_dir = directory
+        self.tcp = tcp
+        return directory
+
+    def setWorkers(self, component, count):
+        """
+        Change the number of worker processes of a component created with the "workers"
+        option; the supervisor starts or stops workers to match.
+
+        Args:
+            component (str): The component's label.
+            count (int): Number of workers.
+        """
+        comp = self.meta.getComponent(component)
+        if comp is None or not isinstance(comp.server, PreforkServer):
+            raise WebComponentException(f"Component {component} is not served by worker processes")
+        self.meta.setComponentAttributeValue(component, "Workers", count)
+        comp.server.reconcile()
+
+    def multiplexHost(self, enabled=True):
+        """
+        Serve components created from now on behind one shared listener per server
+        backend instead of a server each (see AddasuSec.SharedHost). Their "Host" (and
+        "Socket") attributes name the shared listener. A component given its own backend
+        with setServerBackend(component=...) keeps a dedicated server.
+
+        Args:
+            enabled (bool): Multiplex new components if True.
+        """
+        self.multiplexed = enabled
+
+    def sharedHost(self, component, backend, options):
+        """
+        Return the shared host a new component is mounted on, starting one for the
+        backend if needed.
+
+        Args:
+            component (str): The component's label.
+            backend (str): Its server backend.
+            options (dict): The backend settings.
+
+        Returns:
+            SharedHost: The host, or None if the component gets its own server.
+        """
+        if not self.multiplexed or component in self.component_backends:
+            return None
+        host = self.shared_hosts.get(backend)
+        if host is None:
+            path = os.path.join(self.socket_dir, f"shared-{backend}.sock") if self.socket_dir else None
+            port = self.port if self.tcp or path is None else None
+            host_class = AsgiSharedHost if backend == AsgiBackend.name else SharedHost
+            host = host_class(backend, options, port, path)
+            self.shared_hosts[backend] = host
+            if port is not None:
+                self.port += 1
+        return host
         
     def authenticate(self, user, password):
         # Check if the user exists and the password match.
@@ -60,9 +179,11 @@ class WebRuntime():
             return False
 
     def connect(self, component_src, component_intf, intf_type):
+        # component_intf may be a list of replicas of the same sink component
         src_label = self.meta.getLabel(component_src);
-        sink_label = self.meta.getLabel(component_intf);
-        self.meta.addEdge(src_label, sink_label, intf_type)
+        sinks = component_intf if isinstance(component_intf, (list, tuple)) else [component_intf]
+        for sink in sinks:
+            self.meta.addEdge(src_label, self.meta.getLabel(sink), intf_type)
         try:
             if isinstance(component_src, str):
                 component_src = self.meta.getComponent(component_src)
@@ -73,8 +194,9 @@ class WebRuntime():
     
     def disconnect(self, component_src, component_intf, intf_type):
         src_label = self.meta.getLabel(component_src);
-        sink_label = self.meta.getLabel(component_intf);
-        self.meta.removeEdge(src_label, sink_label, intf_type)
+        # Drop the edges to every replica bound to the receptacle
+        for sink_label in self.meta.connectionsFromRecp(src_label, intf_type):
+            self.meta.removeEdge(src_label, sink_label, intf_type)
         try:
             if isinstance(component_src, str):
                 component_src = self.meta.getComponent(component_src)
@@ -82,6 +204,32 @@ class WebRuntime():
             return component_src.disconnect(component_intf, intf_type, self)
         except Exception as e:
             raise WebConnectionException(f"Receptable-Interface connection failed - {e}")
+
+    def addReplica(self, component_src, component_intf, intf_type):
+        src_label = self.meta.getLabel(component_src);
+        sink_label = self.meta.getLabel(component_intf);
+        self.meta.addEdge(src_label, sink_label, intf_type)
+        try:
+            if isinstance(component_src, str):
+                component_src = self.meta.getComponent(component_src)
+
+            return component_src.addReplica(component_intf, intf_type, self)
+        except Exception as e:
+            raise WebConnectionException(f"Replica connection failed - {e}")
+
+    def removeReplica(self, component_src, component_intf, intf_type):
+        src_label = self.meta.getLabel(component_src);
+        sink_label = self.meta.getLabel(component_intf);
+        try:
+            if isinstance(component_src, str):
+                component_src = self.meta.getComponent(component_src)
+
+            removed = component_src.removeReplica(component_intf, intf_type, self)
+        except Exception as e:
+            raise WebConnectionException(f"Replica disconnection failed - {e}")
+        if removed:
+            self.meta.removeEdge(src_label, sink_label, intf_type)
+        return removed
     
     
     def removeE(self, all_interfaces, toRemove):
@@ -118,8 +266,14 @@ class WebRuntime():
             module2 =  importlib.import_module(module)
             class_ = getattr(module2, module.rsplit('.', 1)[-1])
             instance = class_(component)
-            distributedComponent = WebComponent.WebComponent(instance, secure)
-            if not self.meta.addNode(component, distributedComponent):
+            backend, options = self.component_backends.get(component, self.server_backend)
+            if backend == AsgiBackend.name:
+                distributedComponent = AsgiWebComponent(instance, secure, options.get("threads"))
+            else:
+                distributedComponent = WebComponent.WebComponent(instance, secure)
+            with self.lock:
+                added = self.meta.addNode(component, distributedComponent)
+            if not added:
                 raise WebComponentException("Component id already in use")
             
             all_interfaces = list((inspect.getmro(class_)))
@@ -147,19 +301,83 @@ class WebRuntime():
                     distributedComponent.add_route(path, distributedComponent)
                     #self.route_table[path] = distributedComponent
                     #app.add_route(route, distributedComponent)
+            label = self.meta.getLabel(distributedComponent)
+            distributedComponent.add_route(f'/{label}/{BATCH_ROUTE}', distributedComponent, suffix='batch')
         except Exception as e:
             raise WebComponentException(f"Component creation {component} failed - {e}")
         
         
-        self.meta.setComponentAttributeValue(component, "Host",  f"localhost:{self.port}")
+        with self.lock:
+            host = self.sharedHost(component, backend, options)
+            if host is not None:
+                port, socket_path, options = host.port, host.path, host.options
+            else:
+                # Worker processes share a TCP listener only
+                socket_path = (os.path.join(self.socket_dir, f"{component}.sock")
+                               if self.socket_dir and not options.get("workers") else None)
+                port = self.port if self.tcp or socket_path is None else None
+                if port is not None:
+                    self.port+=1
+        self.meta.setComponentAttributeValue(component, "Host",  f"localhost:{port}" if port else "localhost")
+        if socket_path is not None:
+            self.meta.setComponentAttributeValue(component, "Socket", socket_path)
         self.meta.setComponentAttributeValue(component, "Interfaces", all_interfaces)
         self.meta.setComponentAttributeValue(component, "Receptacles", instance.receptacles)
+        self.meta.setComponentAttributeValue(component, "MaxBodySize", DEFAULT_MAX_BODY_SIZE)
+        self.meta.setComponentAttributeValue(component, "CompressionLevel", DEFAULT_COMPRESSION_LEVEL)
+        self.meta.setComponentAttributeValue(component, "CompressionThreshold", DEFAULT_COMPRESSION_THRESHOLD)
+        self.meta.setComponentAttributeValue(component, "MaxConcurrency", DEFAULT_MAX_CONCURRENCY)
+        self.meta.setComponentAttributeValue(component, "MaxQueue", DEFAULT_MAX_QUEUE)
+        self.meta.setComponentAttributeValue(component, "ShedRequests", 0)
+        self.meta.setComponentAttributeValue(component, "Coalesce", [])
+        self.meta.setComponentAttributeValue(component, "CoalescedCalls", 0)
+        self.meta.setComponentAttributeValue(component, "ServerBackend", backend)
+        for key, value in backend_settings(backend, options).items():
+            self.meta.setComponentAttributeValue(component, SETTING_ATTRIBUTES[key], value)
+        if options.get("workers"):
+            self.meta.setComponentAttributeValue(component, "Workers", options["workers"])
+            self.meta.setComponentAttributeValue(component, "WorkerRestarts", 0)
+        distributedComponent.bindMeta(self.meta, component)
         
-        distributedComponent.startThreadedServer(self.port)
-        self.port+=1
+        try:
+            if host is not None:
+                distributedComponent.mountOnHost(host)
+            elif options.get("workers"):
+                distributedComponent.startWorkers(port, backend, options)
+            else:
+                distributedComponent.startThreadedServer(port, socket_path, backend, options)
+        except ServerBackendException as e:
+            self.meta.removeNode(component)
+            raise WebComponentException(f"Component creation {component} failed - {e}")
         
         return distributedComponent
 
+    def createAll(self, components, workers=None):
+        """
+        Create many components concurrently and return once all of them are listening.
+
+        Args:
+            components (list): (module, label, secure) tuples.
+            workers (int): Number of components created at once; up to 32 when None.
+
+        Returns:
+            tuple: (created, errors) - label to the WebComponent of each component created,
+            and label to the exception of each one that failed.
+        """
+        components = list(components)
+        created, errors = {}, {}
+        if not components:
+            return created, errors
+        with ThreadPoolExecutor(max_workers=workers or min(32, len(components))) as pool:
+            futures = [(label, pool.submit(self.create, module, label, secure))
+                       for module, label, secure in components]
+        for label, future in futures:
+            try:
+                created[label] = future.result()
+            except Exception as e:
+                errors[label] = e
+        return created, errors
+
     def delete(self, component_id):
         try:
             comp = self.meta.getComponent(component_id)
@@ -5,6 +5,7 @@ from typing import get_type_hints
 from MetaArchitecture.MetaArchitecture import MetaArchitecture
 from MetaInterface.IMetaInterface import IMetaInterface
 from AddasuSec import WebClientComponent
+from AddasuSec.PooledSession import SessionReaper
 
 import threading
 
@@ -12,15 +13,32 @@ class clientRuntime():
 
     def __init__(self, meta):
         self.meta = meta
+        self.reaper = SessionReaper()
 
     def connect(self, component_src, component_intf, intf_type):
+        # component_intf may be a list of replicas of the same sink component
         src_label = self.meta.getLabel(component_src.getWrapper());
-        sink_label = self.meta.getLabel(component_intf);
-        self.meta.addEdge(src_label, sink_label, intf_type)
+        sinks = component_intf if isinstance(component_intf, (list, tuple)) else [component_intf]
+        for sink in sinks:
+            self.meta.addEdge(src_label, self.meta.getLabel(sink), intf_type)
         
         # Get the outer component body
         comp_src_outer = component_src.getWrapper()
         return comp_src_outer.connect(component_intf, intf_type, self)
+
+    def addReplica(self, component_src, component_intf, intf_type):
+        src_label = self.meta.getLabel(component_src.getWrapper());
+        sink_label = self.meta.getLabel(component_intf);
+        self.meta.addEdge(src_label, sink_label, intf_type)
+        return component_src.getWrapper().addReplica(component_intf, intf_type, self)
+
+    def removeReplica(self, component_src, component_intf, intf_type):
+        src_label = self.meta.getLabel(component_src.getWrapper());
+        sink_label = self.meta.getLabel(component_intf);
+        removed = component_src.getWrapper().removeReplica(component_intf, intf_type, self)
+        if removed:
+            self.meta.removeEdge(src_label, sink_label, intf_type)
+        return removed
     
     def removeE(self, all_interfaces, toRemove):
         for index in all_interfaces:
@@ -76,8 +94,8 @@ class clientRuntime():
     # DISCONNECT - Two Component in same address space
     def disconnect(self, component_src, component_intf, intf_type):
         src_label = self.meta.getLabel(component_src.getWrapper());
-        sink_label = self.meta.getLabel(component_intf);
-        self.meta.removeEdge(src_label, sink_label, intf_type)
+        for sink_label in self.meta.connectionsFromRecp(src_label, intf_type):
+            self.meta.removeEdge(src_label, sink_label, intf_type)
         try:
             if isinstance(component_src, str):
                 component_src = self.meta.getComponent(component_src)
@@ -4,10 +4,14 @@ from Runtimes.WebRuntime import WebRuntime
 from Runtimes.clientRuntime import clientRuntime
 from Runtimes.serverRuntime import serverRuntime
 from AddasuSec import Component
+from AddasuSec.RequestContext import request_token
 import requests
 import importlib
 import inspect
 import json
+# Seconds to wait for a remote runtime to answer a lifecycle request.
+REMOTE_TIMEOUT = 30.0
+
 # Exception raised during creation and deletion of components.
 class ComponentException(Exception):
     pass
@@ -24,15 +28,11 @@ class runtime():
         self.webRuntime = WebRuntime(meta)
         self.clientRuntime = clientRuntime(meta)
         self.serverRuntime = serverRuntime(meta)
+        self.remote_timeout = REMOTE_TIMEOUT
     
     def receptacle_with_token(self, func, *args, **kwargs):
-        stack = inspect.stack()
-        previous_frame = stack[2].frame
-        # Get local variables (including parameters) from that frame
-        prev_args = previous_frame.f_locals
-        print("Previous call's arguments:", prev_args)
-    
-        return func(prev_args['req'], *args, **kwargs)
+        # Forward the bearer token of the request being served (see AddasuSec.RequestContext)
+        return func(request_token(), *args, **kwargs)
     
     def start(self, type, component):
         match type:
@@ -54,7 +54,7 @@ class runtime():
         resp = requests.post(f"{url}/start", json={
             "type": type_,
             "component_id": component_id
-        })
+        }, timeout=self.remote_timeout)
         print(resp.json())
         reply = json.loads(resp.text)
         return reply["result"]
@@ -85,6 +85,26 @@ class runtime():
                 raise ConnectionException("Incorrect runtimeType set, must be {plain, web, web_client, or web_server") 
 
     
+    # REPLICAS - Bind or unbind further replicas of the sink of a web receptacle.
+    # Calls on the receptacle are balanced across all bound replicas.
+    def addReplica(self, type, component_src, component_intf, intf_type):
+        match type:
+            case 'web':
+                return self.webRuntime.addReplica(component_src, component_intf, intf_type)
+            case 'web_client':
+                return self.clientRuntime.addReplica(component_src, component_intf, intf_type)
+            case _:
+                raise ConnectionException("Replicas are only supported by the web and web_client runtimes")
+
+    def removeReplica(self, type, component_src, component_intf, intf_type):
+        match type:
+            case 'web':
+                return self.webRuntime.removeReplica(component_src, component_intf, intf_type)
+            case 'web_client':
+                return self.clientRuntime.removeReplica(component_src, component_intf, intf_type)
+            case _:
+                raise ConnectionException("Replicas are only supported by the web and web_client runtimes")
+
     # DISCONNECT - Two Component in same address space
     def disconnect(self, type, component_src, component_intf, intf_type):
         match type:
@@ -120,7 +140,7 @@ class runtime():
             "component_src": src,
             "component_intf": intf,
             "intf_type": intf_type
-        })
+        }, timeout=self.remote_timeout)
         print(resp.json())
         reply = json.loads(resp.text)
         return reply["result"]
@@ -145,6 +165,31 @@ class runtime():
             case _:
                 raise ComponentException("Incorrect runtimeType set, must be {plain, web, web_client, or web_server") 
 
+    def createAll(self, runtimeType: str, components: list, workers: int = None) -> tuple:
+        """
+        Create many web components concurrently (see WebRuntime.createAll).
+
+        Args:
+            runtimeType (str): Must be "web".
+            components (list): (moduleType, componentName, secure) tuples.
+            workers (int): Number of components created at once.
+
+        Returns:
+            tuple: (created, errors) - component name to the created component, and
+            component name to the exception of each one that failed.
+        """
+        if runtimeType != 'web':
+            raise ComponentException("Bulk creation is only supported for web components")
+        valid, errors = [], {}
+        for spec in components:
+            if spec[1].isalnum():
+                valid.append(spec)
+            else:
+                errors[spec[1]] = ComponentException("Component name is not alphanumeric")
+        created, failed = self.webRuntime.createAll(valid, workers)
+        errors.update(failed)
+        return created, errors
+
     # CREATE - Plain Component in the address space
     def remoteCreate(self, url, runtimeType:str, moduleType: str, componentName: str, secure: bool) -> Component:
         if not componentName.isalnum():
@@ -203,7 +248,7 @@ class runtime():
             "module": module,
             "component": Component,
             "secure": secure
-        })
+        }, timeout=self.remote_timeout)
         reply = json.loads(resp.text)
         url = reply["result"]
         self.meta.setComponentAttributeValue(Component, "Host",  f"{url}")
@@ -213,7 +258,7 @@ class runtime():
         resp = requests.post(f"{url}/delete", json={
             "type": type_,
             "component_id": component_id
-        })
+        }, timeout=self.remote_timeout)
         print(resp.json())
         reply = json.loads(resp.text)
         return reply["result"]
@@ -224,7 +269,7 @@ class runtime():
             "component_src": src,
             "component_intf": intf,
             "intf_type": intf_type
-        })
+        }, timeout=self.remote_timeout)
         print(resp.json())
 
 
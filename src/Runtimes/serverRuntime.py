@@ -4,9 +4,16 @@ from typing import get_type_hints
 from MetaArchitecture.MetaArchitecture import MetaArchitecture
 from MetaInterface.IMetaInterface import IMetaInterface
 from AddasuSec import WebServerComponent
-from wsgiref.simple_server import make_server
+from AddasuSec.ServerBackend import (BACKENDS, DEFAULT_BACKEND, DEFAULT_READY_TIMEOUT, SETTING_ATTRIBUTES,
+                                     ServerBackendException, backend_settings, create_backend)
 import falcon
 from Runtimes.Auth.JWTMiddleware import JWTAuthMiddleware
+from AddasuSec import WireCodec
+from AddasuSec.Batch import BATCH_ROUTE
+from AddasuSec.Blobs import DEFAULT_MAX_BODY_SIZE
+from AddasuSec.Admission import DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_QUEUE
+from AddasuSec.Compression import (CompressionMiddleware, DEFAULT_COMPRESSION_LEVEL,
+                                   DEFAULT_COMPRESSION_THRESHOLD)
 
 import random
 import threading
@@ -16,6 +23,8 @@ class serverRuntime():
     def __init__(self, meta):
         self.meta = meta
         self.port = 8000
+        self.server_backend = (DEFAULT_BACKEND, {})
+        self.component_backends = {}
         #user_loader = lambda username, password: { 'username': username }
         #auth_backend = BasicAuthBackend(user_loader)
         #auth_middleware = FalconAuthMiddleware(auth_backend,
@@ -23,12 +32,29 @@ class serverRuntime():
         #self.app = falcon.App(middleware=[auth_middleware])
         
         
-    def threaded_function(self, app, port):
-        with make_server('', port, app) as httpd:
-            print(f"Serving on port {port}...")
+    def threaded_function(self, server):
+        print(f"Serving on {server.address()} ({server.name})...")
 
-            # Serve until process is killed
-            httpd.serve_forever()
+        # Serve until the component is deleted or the process is killed
+        server.serve()
+
+    def setServerBackend(self, backend, component=None, **options):
+        """
+        Choose the server backend of components created from now on (see
+        AddasuSec.ServerBackend).
+
+        Args:
+            backend (str): "waitress" or "wsgiref".
+            component (str): Label of the one component to configure; all when None.
+            **options: threads, connection_limit, keep_alive (idle seconds) and backlog.
+        """
+        # WebServerComponent is a WSGI resource; ASGI hosting is provided by WebRuntime
+        if backend not in BACKENDS or backend == "asgi":
+            raise ServerBackendException(f"Unsupported server backend {backend}")
+        if component is None:
+            self.server_backend = (backend, options)
+        else:
+            self.component_backends[component] = (backend, options)
         
     def authenticate(self, user, password):
         # Check if the user exists and the password match.
@@ -127,14 +153,19 @@ class serverRuntime():
         self.removeE(all_interfaces, "ABC")
         self.removeE(all_interfaces, "object")
         
+        middleware = [CompressionMiddleware(distributedComponent)]
         if secure:
             jwt_middleware = JWTAuthMiddleware()
-            app = falcon.App(middleware=[jwt_middleware])
-        else:
-            app = falcon.App()
+            middleware.append(jwt_middleware)
+        app = falcon.App(middleware=middleware)
+        WireCodec.install(app)
         print(f"API is {app}")
-        thread = threading.Thread(target = self.threaded_function, args = (app, self.port,  ))
+        backend, options = self.component_backends.get(component, self.server_backend)
+        distributedComponent.server = create_backend(backend, app, self.port, **options)
+        thread = threading.Thread(target = self.threaded_function, args = (distributedComponent.server,  ))
         thread.start()
+        # Return once the server is listening
+        distributedComponent.server.ready.wait(DEFAULT_READY_TIMEOUT)
         
         for intf in all_interfaces:
             methods = [attr for attr in dir(intf) if callable(getattr(intf, attr)) and not attr.startswith("__")]
@@ -143,14 +174,33 @@ class serverRuntime():
                 route = f'/{path}/{meth}'
                 print(route)
                 app.add_route(route, distributedComponent)
+                distributedComponent.add_method(meth)
+        app.add_route(f'/{component}/{BATCH_ROUTE}', distributedComponent, suffix='batch')
         
         self.meta.setComponentAttributeValue(component, "Host",  f"localhost:{self.port}")
 
         self.meta.setComponentAttributeValue(component, "Interfaces", all_interfaces)
         self.meta.setComponentAttributeValue(component, "Receptacles", instance.receptacles)
+        self.meta.setComponentAttributeValue(component, "MaxBodySize", DEFAULT_MAX_BODY_SIZE)
+        self.meta.setComponentAttributeValue(component, "CompressionLevel", DEFAULT_COMPRESSION_LEVEL)
+        self.meta.setComponentAttributeValue(component, "CompressionThreshold", DEFAULT_COMPRESSION_THRESHOLD)
+        self.meta.setComponentAttributeValue(component, "MaxConcurrency", DEFAULT_MAX_CONCURRENCY)
+        self.meta.setComponentAttributeValue(component, "MaxQueue", DEFAULT_MAX_QUEUE)
+        self.meta.setComponentAttributeValue(component, "ShedRequests", 0)
+        self.meta.setComponentAttributeValue(component, "Coalesce", [])
+        self.meta.setComponentAttributeValue(component, "CoalescedCalls", 0)
+        self.meta.setComponentAttributeValue(component, "ServerBackend", backend)
+        for key, value in backend_settings(backend, options).items():
+            self.meta.setComponentAttributeValue(component, SETTING_ATTRIBUTES[key], value)
+        distributedComponent.bindMeta(self.meta, component)
 
         self.port+=1
         return distributedComponent
 
     def delete(self, component_id):
+      comp = self.meta.getComponent(component_id)
       self.meta.removeNode(component_id)
+      # Shut the component's server down cleanly
+      server = getattr(comp, "server", None)
+      if server is not None:
+          server.stop()
@@ -0,0 +1,73 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import aiohttp
+import asyncio
+import requests
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Host the numbers service and the async calculator on the ASGI server, running
+# synchronous methods on four threads
+opencom.webRuntime.setServerBackend("asgi", component="Numbers1", threads=4)
+opencom.webRuntime.setServerBackend("asgi", component="Calculator1")
+
+# Create components; calls go over HTTP rather than in-process so they reach the server
+client = opencom.create("web", "Examples.Client", "Client1", False)
+numbers = opencom.create("web", "Examples.Numbers", "Numbers1", False)
+calc1 = opencom.create("web", "Examples.CalculatorAsync", "Calculator1", False)
+add1 = opencom.create("web", "Examples.Adder", "Adder1", False)
+meta.setReceptacleAttributeValue("Client1", "Examples.INumbers", "ShortCircuit", False)
+meta.setReceptacleAttributeValue("Calculator1", "Examples.IAdd", "ShortCircuit", False)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", client, numbers, "Examples.INumbers"))
+print(opencom.connect("web", calc1, add1, "Examples.IAdd"))
+
+nums = client.innerComponent.getReceptacle("Examples.INumbers")
+
+print("\n🧪 Testing the ASGI backend:")
+settings = [meta.getComponentAttributeValue("Numbers1", name) for name in ("ServerBackend", "ServerThreads")]
+print(f"✅ Numbers1 served by {type(numbers).__name__} with {settings}")
+assert settings == ["asgi", 4]
+
+async def call_concurrently(method, count, **params):
+    """Make concurrent calls directly to the numbers service and return how long they took."""
+    url = f"http://{meta.getComponentAttributeValue('Numbers1', 'Host')}/Numbers1/{method}"
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0)) as session:
+        async def call(i):
+            async with session.post(url, params={name: value(i) for name, value in params.items()}) as response:
+                response.raise_for_status()
+                return (await response.json())["result"]
+        start = time.monotonic()
+        results = await asyncio.gather(*[call(i) for i in range(count)])
+        return results, time.monotonic() - start
+
+# Async methods run on the event loop, so many slow calls wait together
+results, elapsed = asyncio.run(call_concurrently("wait", 200, seconds=lambda i: 0.5))
+print(f"✅ 200 concurrent async calls of 0.5s in {elapsed:.2f}s")
+assert results == [0.5] * 200 and elapsed < 2.0
+
+# Synchronous methods run on the thread pool: eight slow calls on four threads take two rounds
+numbers.innerComponent.delay = 0.3
+results, elapsed = asyncio.run(call_concurrently("sample", 8, i=lambda i: 1000 + i))
+print(f"✅ 8 concurrent sync calls of 0.3s on 4 threads in {elapsed:.2f}s")
+assert sorted(results) == list(range(1000, 1008)) and 0.6 <= elapsed < 1.5
+
+# Results are streamed and decoded as with the other backends
+assert list(nums.acount(3)) == [0, 10, 20]
+assert list(nums.count(3)) == [0, 1, 2]
+assert nums.table(2, 1) == {0: ["x"], 1: ["x"]}
+print("✅ streamed and typed results")
+
+# An async component served by the ASGI server awaits its own receptacle calls
+response = requests.post(f"http://{meta.getComponentAttributeValue('Calculator1', 'Host')}/Calculator1/add?a=2&b=3")
+response.raise_for_status()
+print(f"✅ async calculator add(2, 3) = {response.json()['result']}")
+assert response.json()["result"] == 5
+
+# Clean up
+for label in ["Client1", "Numbers1", "Calculator1", "Adder1"]:
+    opencom.delete("web", label)
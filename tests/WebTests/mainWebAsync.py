@@ -0,0 +1,46 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+from requests.auth import HTTPBasicAuth
+import requests
+import json
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components; the calculator's methods are coroutines using async receptacles
+calc1 = opencom.create("web", "Examples.CalculatorAsync", "Calculator1", False)
+add1 = opencom.create("web", "Examples.Adder", "Adder1", False)
+sub1 = opencom.create("web", "Examples.Subber", "Subber1", False)
+
+# Connect components
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", calc1, add1, "Examples.IAdd"))
+print(opencom.connect("web", calc1, sub1, "Examples.ISub"))
+
+auth = HTTPBasicAuth("user", "pass")
+base_url = "http://localhost:8000/Calculator1"
+
+# Helper function to perform POST request and return the result
+def call_api(endpoint, a, b):
+    url = f"{base_url}/{endpoint}?a={a}&b={b}"
+    try:
+        response = requests.post(url, auth=auth)
+        response.raise_for_status()
+        data = response.json()
+        print(f"✅ {endpoint}({a}, {b}) = {data.get('result')}")
+        return data.get('result')
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Error calling {endpoint}: {e}")
+    except json.JSONDecodeError:
+        print(f"❌ Invalid JSON response from {endpoint}")
+
+# Test the async calculator methods
+print("\n🧪 Testing async Calculator:")
+assert call_api("add", 676, 8) == 684
+assert call_api("sub", 676, 8) == 668
+assert call_api("add", 1, 2) == 3
+
+# Clean up
+for label in ["Calculator1", "Adder1", "Subber1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,72 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+from AddasuSec.ServerBackend import ServerBackendException
+import requests
+import threading
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Serve one worker with the single-threaded wsgiref server and another with waitress
+opencom.webRuntime.setServerBackend("wsgiref", component="Worker1")
+opencom.webRuntime.setServerBackend("waitress", component="Worker2", threads=4, keep_alive=10)
+
+# Create components
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+worker2 = opencom.create("web", "Examples.Worker", "Worker2", False)
+
+# The effective settings are published as component attributes
+print("\n🧪 Testing server backends:")
+for label in ["Worker1", "Worker2"]:
+    settings = [meta.getComponentAttributeValue(label, name)
+                for name in ("ServerBackend", "ServerThreads", "ConnectionLimit", "KeepAlive")]
+    print(f"✅ {label}: {settings}")
+assert meta.getComponentAttributeValue("Worker1", "ServerBackend") == "wsgiref"
+assert meta.getComponentAttributeValue("Worker2", "ServerBackend") == "waitress"
+assert meta.getComponentAttributeValue("Worker2", "ServerThreads") == 4
+assert meta.getComponentAttributeValue("Worker2", "KeepAlive") == 10
+
+def call_concurrently(label, count):
+    """Make concurrent half-second calls to a worker and return how long they took."""
+    url = f"http://{meta.getComponentAttributeValue(label, 'Host')}/{label}/work?seconds=0.5&key=k"
+    threads = [threading.Thread(target=lambda: requests.post(url).raise_for_status()) for _ in range(count)]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.monotonic() - start
+
+# wsgiref serves one request at a time, waitress serves them on its worker threads
+serial, threaded = call_concurrently("Worker1", 4), call_concurrently("Worker2", 4)
+print(f"✅ 4 concurrent calls: wsgiref {serial:.2f}s, waitress {threaded:.2f}s")
+assert serial >= 2.0 and threaded < 1.5
+
+# waitress keeps connections alive between requests
+session = requests.Session()
+url = f"http://{meta.getComponentAttributeValue('Worker2', 'Host')}/Worker2/pid"
+for i in range(5):
+    session.post(url).raise_for_status()
+pools = session.get_adapter(url).poolmanager.pools
+connections = sum(pools[key].num_connections for key in pools.keys())
+print(f"✅ 5 requests over {connections} kept-alive connection(s)")
+assert connections == 1
+session.close()
+
+# Unknown backends are refused
+try:
+    opencom.webRuntime.setServerBackend("gunicorn")
+    print("❌ Unknown backend was accepted")
+    assert False
+except ServerBackendException as e:
+    print(f"✅ {e}")
+
+# Deleting the components stops their servers promptly
+start = time.monotonic()
+for label in ["Worker1", "Worker2"]:
+    opencom.delete("web", label)
+elapsed = time.monotonic() - start
+print(f"✅ servers stopped in {elapsed:.2f}s")
+assert elapsed < 2.0
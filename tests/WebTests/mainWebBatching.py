@@ -0,0 +1,49 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import threading
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components
+calc1 = opencom.create("web", "Examples.Calculator", "Calculator1", False)
+add1 = opencom.create("web", "Examples.Adder", "Adder1", False)
+
+# Connect components; calls go over HTTP rather than in-process so they can be batched
+meta.setReceptacleAttributeValue("Calculator1", "Examples.IAdd", "ShortCircuit", False)
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", calc1, add1, "Examples.IAdd"))
+
+adder = calc1.innerComponent.getReceptacle("Examples.IAdd")
+
+# Explicit batch: the calls are sent together when the block exits
+print("\n🧪 Testing explicit batch:")
+with adder.batch() as batch:
+    calls = [batch.add(i, i) for i in range(5)]
+    bad = batch.add("x", 1)
+results = [call.result() for call in calls]
+print(f"✅ batch results = {results}")
+assert results == [0, 2, 4, 6, 8]
+try:
+    bad.result()
+    print("❌ Failing call in batch did not raise")
+    assert False
+except Exception as e:
+    print(f"✅ Failing call raised on its own: {type(e).__name__}")
+
+# Implicit batching: concurrent calls within the window share one request
+print("\n🧪 Testing implicit batching:")
+adder.enableBatching(0.01)
+results = []
+threads = [threading.Thread(target=lambda i=i: results.append(adder.add(i, 100))) for i in range(10)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+print(f"✅ batched results = {sorted(results)}")
+assert sorted(results) == [100 + i for i in range(10)]
+
+# Clean up
+for label in ["Calculator1", "Adder1"]:
+    opencom.delete("web", label)
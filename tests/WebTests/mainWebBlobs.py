@@ -0,0 +1,70 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import hashlib
+import io
+import os
+import requests
+import tempfile
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+IFILES = "Examples.IFiles"
+
+# Create components; calls go over HTTP rather than in-process so blobs travel as bodies
+client = opencom.create("web", "Examples.Client", "Client1", False)
+files = opencom.create("web", "Examples.Files", "Files1", False)
+meta.setReceptacleAttributeValue("Client1", IFILES, "ShortCircuit", False)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", client, files, IFILES))
+
+blobs = client.innerComponent.getReceptacle(IFILES)
+data = os.urandom(4 * 1024 * 1024)
+
+# A bytes argument is sent as the raw request body, and a bytes result as the raw reply
+print("\n🧪 Testing binary arguments and results:")
+assert blobs.size(data) == len(data)
+result = blobs.fetch(1000)
+assert result == bytes(i % 256 for i in range(1000))
+print(f"✅ bytes round trip: sent {len(data)} bytes, received {len(result)} bytes")
+
+# A memoryview argument is handed to the method as a view over the received body
+assert blobs.view(memoryview(data)) == f"memoryview:{len(data)}"
+print("✅ memoryview argument")
+
+# A file argument is streamed to the method
+with tempfile.NamedTemporaryFile(delete=False) as f:
+    f.write(data)
+    path = f.name
+with open(path, "rb") as f:
+    assert blobs.upload("data", f) == f"data:{hashlib.sha256(data).hexdigest()}"
+print("✅ file argument streamed")
+
+# Several blob arguments are sent as a multipart form with the other arguments in the query
+assert blobs.pair(b"abc", memoryview(b"defg"), "t1") == "t1:3:4"
+print("✅ multipart form")
+
+# A file result is sent as the raw reply body
+result = blobs.file(path)
+assert result.read() == data
+print(f"✅ file result of {len(data)} bytes")
+os.remove(path)
+
+# Bodies over the component's limit are rejected with 413
+meta.setComponentAttributeValue("Files1", "MaxBodySize", 1024)
+for call in (lambda: blobs.size(b"x" * 2048), lambda: blobs.upload("big", io.BytesIO(b"x" * 4096)),
+             lambda: blobs.pair(b"x" * 2048, memoryview(b"y"), "t2")):
+    try:
+        call()
+        print("❌ Body over the limit was accepted")
+        assert False
+    except requests.HTTPError as e:
+        assert e.response.status_code == 413
+assert blobs.size(b"x" * 100) == 100
+print("✅ bodies over the limit rejected with 413")
+
+# Clean up
+for label in ["Client1", "Files1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,65 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+from AddasuSec.CircuitBreaker import CircuitOpenException
+import requests
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components
+foreman = opencom.create("web", "Examples.Foreman", "Foreman1", False)
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+
+# Open the circuit after two failures and probe again after one second; calls go over
+# HTTP rather than in-process so the server's error replies reach the breaker
+meta.setReceptacleAttributeValue("Foreman1", "Examples.IWork", "FailureThreshold", 2)
+meta.setReceptacleAttributeValue("Foreman1", "Examples.IWork", "ResetTimeout", 1)
+meta.setReceptacleAttributeValue("Foreman1", "Examples.IWork", "ShortCircuit", False)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", foreman, worker1, "Examples.IWork"))
+
+work = foreman.innerComponent.getReceptacle("Examples.IWork")
+
+def circuit_state():
+    return meta.getReceptacleAttributeValue("Foreman1", "Examples.IWork", "CircuitState")
+
+print("\n🧪 Testing circuit breaker:")
+assert work.work(0, "a") == "a#1"
+assert circuit_state() == "closed"
+print(f"✅ circuit {circuit_state()} while the worker succeeds")
+
+# 500 replies count as failures and open the circuit
+worker1.innerComponent.failing = True
+for i in range(2):
+    try:
+        work.work(0, "b")
+        print("❌ Failing call did not raise")
+        assert False
+    except requests.HTTPError as e:
+        print(f"✅ failing call raised {e.response.status_code}")
+assert circuit_state() == "open"
+print(f"✅ circuit {circuit_state()} after two 500 replies")
+
+# While open, calls fail fast without reaching the worker
+worker1.innerComponent.failing = False
+runs = worker1.innerComponent.runs
+try:
+    work.work(0, "c")
+    print("❌ Call through an open circuit did not raise")
+    assert False
+except CircuitOpenException:
+    print("✅ call rejected while the circuit is open")
+assert worker1.innerComponent.runs == runs
+
+# After the reset timeout a trial call succeeds and closes the circuit
+time.sleep(1.1)
+assert work.work(0, "d").startswith("d#")
+assert circuit_state() == "closed"
+print(f"✅ circuit {circuit_state()} after a successful trial call")
+
+# Clean up
+for label in ["Foreman1", "Worker1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,66 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import asyncio
+import requests
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components; calls go over HTTP rather than in-process so they use the result cache
+client = opencom.create("web", "Examples.Client", "Client1", False)
+numbers = opencom.create("web", "Examples.Numbers", "Numbers1", False)
+meta.setReceptacleAttributeValue("Client1", "Examples.INumbers", "ShortCircuit", False)
+meta.setReceptacleAttributeValue("Client1", "Examples.INumbers", "CacheSize", 8)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", client, numbers, "Examples.INumbers"))
+
+nums = client.innerComponent.getReceptacle("Examples.INumbers")
+
+# lookup is cacheable for half a second: repeated calls are served from the cache
+print("\n🧪 Testing result cache:")
+assert [nums.lookup("a") for _ in range(3)] == ["a#1"] * 3
+assert nums.lookup("b") == "b#2"
+stats = nums.cacheStats()
+print(f"✅ cache stats {stats}")
+assert stats == {"hits": 2, "misses": 2, "size": 2, "max_size": 8}
+assert numbers.innerComponent.lookups == 2
+
+# Cached results expire after their TTL
+time.sleep(0.6)
+assert nums.lookup("a") == "a#3"
+print("✅ result fetched again once expired")
+
+# Failed calls and empty results are not cached
+for i in range(2):
+    try:
+        nums.lookup("bad")
+        print("❌ Failing lookup did not raise")
+        assert False
+    except requests.HTTPError as e:
+        assert e.response.status_code == 500
+assert nums.lookup("") is None
+assert nums.lookup("") is None
+assert numbers.innerComponent.lookups == 7
+print("✅ errors and empty results not cached")
+
+# The async proxy shares the cache, and does not cache empty results either
+async def async_lookups():
+    proxy = nums.asyncProxy()
+    return [await proxy.lookup("a"), await proxy.lookup(""), await proxy.lookup("")]
+assert asyncio.run(async_lookups()) == ["a#3", None, None]
+assert numbers.innerComponent.lookups == 9
+print("✅ async proxy served from the shared cache")
+
+# Reconnecting drops cached results
+opencom.disconnect("web", client, numbers, "Examples.INumbers")
+print(opencom.connect("web", client, numbers, "Examples.INumbers"))
+assert nums.cacheStats()["size"] == 0
+assert nums.lookup("a") == "a#10"
+print("✅ cache cleared on reconnect")
+
+# Clean up
+for label in ["Client1", "Numbers1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,65 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import requests
+import threading
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Serve the component with enough threads to take all the concurrent calls at once
+opencom.webRuntime.setServerBackend("waitress", component="Worker1", threads=16)
+
+# Create the component and coalesce identical concurrent calls of its work method
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+meta.setComponentAttributeValue("Worker1", "Coalesce", ["work"])
+
+base_url = f"http://{meta.getComponentAttributeValue('Worker1', 'Host')}/Worker1"
+
+# Helper function to make concurrent identical calls and return their results
+def call_concurrently(count, key):
+    results = []
+    def call():
+        response = requests.post(f"{base_url}/work?seconds=0.5&key={key}")
+        response.raise_for_status()
+        results.append(response.json().get("result"))
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+print("\n🧪 Testing coalescing:")
+results = call_concurrently(10, "a")
+print(f"✅ results = {set(results)}, runs = {worker1.innerComponent.runs}")
+assert results == ["a#1"] * 10
+assert worker1.innerComponent.runs == 1
+coalesced = meta.getComponentAttributeValue("Worker1", "CoalescedCalls")
+print(f"✅ coalesced calls = {coalesced}")
+assert coalesced == 9
+
+# Calls with different arguments, or made after the first completed, run again
+results = call_concurrently(2, "b") + call_concurrently(1, "a")
+print(f"✅ results = {results}")
+assert results == ["b#2", "b#2", "a#3"]
+
+# Calls through a receptacle bound to the co-located worker are coalesced too, as they go
+# over HTTP rather than in-process for coalesced methods
+foreman = opencom.create("web", "Examples.Foreman", "Foreman1", False)
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", foreman, worker1, "Examples.IWork"))
+work = foreman.innerComponent.getReceptacle("Examples.IWork")
+assert work.local is not None
+results = []
+threads = [threading.Thread(target=lambda: results.append(work.work(0.5, "c"))) for _ in range(5)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+print(f"✅ results through the receptacle = {set(results)}")
+assert results == ["c#4"] * 5
+
+# Clean up
+for label in ["Foreman1", "Worker1"]:
+    opencom.delete("web", label)
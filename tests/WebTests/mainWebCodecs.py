@@ -0,0 +1,58 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+from AddasuSec.WireCodec import Codec, get_codec
+import datetime
+import json
+import requests
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+INUMBERS = "Examples.INumbers"
+
+# Create components; calls go over HTTP rather than in-process so they use the codecs
+client = opencom.create("web", "Examples.Client", "Client1", False)
+numbers = opencom.create("web", "Examples.Numbers", "Numbers1", False)
+meta.setReceptacleAttributeValue("Client1", INUMBERS, "ShortCircuit", False)
+base_url = f"http://{meta.getComponentAttributeValue('Numbers1', 'Host')}/Numbers1"
+
+# Each available codec carries typed arguments and results; "query" sends the arguments
+# in the query string
+print("\n🧪 Testing wire codecs:")
+for name in ["msgpack", "cbor", "json", "query"]:
+    if name != "query" and get_codec(name) is None:
+        print(f"⚠️ {name} is not installed")
+        continue
+    meta.setReceptacleAttributeValue("Client1", INUMBERS, "Codec", name)
+    assert opencom.connect("web", client, numbers, INUMBERS)
+    nums = client.innerComponent.getReceptacle(INUMBERS)
+    assert (nums.codec.name if nums.codec is not None else "query") == name
+    assert nums.shift(datetime.date(2024, 2, 28), 2) == datetime.date(2024, 3, 1)
+    assert nums.table(2, 1) == {0: ["x"], 1: ["x"]}
+    print(f"✅ {name}: typed arguments and results")
+    opencom.disconnect("web", client, numbers, INUMBERS)
+
+# The server replies in the codec the client accepts
+codec = get_codec("msgpack") or get_codec("json")
+response = requests.post(f"{base_url}/table", data=codec.dumps({"rows": 1, "width": 2}),
+                         headers={"Content-Type": codec.content_type, "Accept": codec.content_type})
+response.raise_for_status()
+assert response.headers["Content-Type"].startswith(codec.content_type)
+print(f"✅ {codec.name} reply: {codec.loads(response.content)}")
+
+# A codec the sink cannot decode is answered with 415, after which the receptacle falls
+# back to query-string arguments
+meta.setReceptacleAttributeValue("Client1", INUMBERS, "Codec", "json")
+assert opencom.connect("web", client, numbers, INUMBERS)
+nums = client.innerComponent.getReceptacle(INUMBERS)
+nums.codec = Codec("bogus", "application/x-bogus", lambda value: json.dumps(value).encode(), json.loads)
+response = requests.post(f"{base_url}/table", data=b"{}", headers={"Content-Type": "application/x-bogus"})
+assert response.status_code == 415
+assert nums.table(1, 3) == {0: ["xxx"]}
+assert nums.codec is None
+print("✅ unsupported codec answered with 415 and the call retried with query-string arguments")
+
+# Clean up
+for label in ["Client1", "Numbers1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,68 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import gzip
+import json
+import requests
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components; calls go over HTTP rather than in-process so replies are compressed
+client = opencom.create("web", "Examples.Client", "Client1", False)
+numbers = opencom.create("web", "Examples.Numbers", "Numbers1", False)
+meta.setReceptacleAttributeValue("Client1", "Examples.INumbers", "ShortCircuit", False)
+base_url = f"http://{meta.getComponentAttributeValue('Numbers1', 'Host')}/Numbers1"
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", client, numbers, "Examples.INumbers"))
+
+nums = client.innerComponent.getReceptacle("Examples.INumbers")
+
+def reply(rows, width, accept_encoding):
+    """Call table directly and return the reply's encoding and its size on the wire."""
+    response = requests.post(f"{base_url}/table?rows={rows}&width={width}", stream=True,
+                             headers={"Accept-Encoding": accept_encoding})
+    response.raise_for_status()
+    size = len(response.raw.read(decode_content=False))
+    return response.headers.get("Content-Encoding"), size
+
+# Large replies are compressed with the first encoding the client accepts
+print("\n🧪 Testing compression:")
+plain = reply(200, 50, "identity")
+gzipped = reply(200, 50, "gzip, deflate")
+deflated = reply(200, 50, "deflate, gzip")
+print(f"✅ reply sizes: plain {plain}, gzip {gzipped}, deflate {deflated}")
+assert plain[0] is None
+assert gzipped[0] == "gzip" and gzipped[1] < plain[1] / 10
+assert deflated[0] == "deflate" and deflated[1] < plain[1] / 10
+
+# Replies under the threshold, or with compression disabled, are sent as they are
+assert reply(1, 1, "gzip")[0] is None
+meta.setComponentAttributeValue("Numbers1", "CompressionLevel", 0)
+assert reply(200, 50, "gzip")[0] is None
+meta.setComponentAttributeValue("Numbers1", "CompressionLevel", 9)
+print("✅ small replies and compression level 0 not compressed")
+
+# Receptacles accept compressed replies and decode them transparently
+assert nums.table(200, 50) == {i: ["x" * 50] for i in range(200)}
+print("✅ compressed reply decoded by the receptacle")
+
+# Compressed request bodies are inflated before the call is dispatched
+body = gzip.compress(json.dumps({"rows": 2, "width": 3}).encode())
+headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+response = requests.post(f"{base_url}/table", data=body, headers=headers)
+response.raise_for_status()
+print(f"✅ gzip request body: {response.json()}")
+assert response.json()["result"] == {"0": ["xxx"], "1": ["xxx"]}
+
+# ... up to the component's body limit, past which they are rejected with 413
+meta.setComponentAttributeValue("Numbers1", "MaxBodySize", 1024)
+body = gzip.compress(json.dumps({"rows": 2, "width": 3, "pad": " " * 4096}).encode())
+response = requests.post(f"{base_url}/table", data=body, headers=headers)
+print(f"✅ request body inflating past the limit answered with {response.status_code}")
+assert len(body) < 1024 and response.status_code == 413
+
+# Clean up
+for label in ["Client1", "Numbers1"]:
+    opencom.delete("web", label)
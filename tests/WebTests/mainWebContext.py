@@ -0,0 +1,76 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+from AddasuSec.RequestContext import bind_request, current_request, propagate, request_token, reset_request
+import asyncio
+import requests
+import threading
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+AUTH_URL = "http://localhost:8676/token"
+IADD = "Examples.IAdd"
+
+# Create secure components: the calculator forwards the caller's token to the adder
+calc1 = opencom.create("web", "Examples.CalculatorAuthZ", "Calculator1", True)
+add1 = opencom.create("web", "Examples.AdderAuthZ", "Adder1", True)
+base_url = f"http://{meta.getComponentAttributeValue('Calculator1', 'Host')}/Calculator1"
+
+# Obtain Auth Token
+resp = requests.post(AUTH_URL, data={"username": "alice", "password": "password123"})
+resp.raise_for_status()
+TOKEN = resp.json().get("access_token")
+assert TOKEN, "Token retrieval failed"
+
+def call_add(token, a, b):
+    """Call the calculator over HTTP and return the status and result."""
+    response = requests.post(f"{base_url}/add?a={a}&b={b}", headers={"Authorization": f"Bearer {token}"})
+    return response.status_code, response.json().get("result") if response.ok else None
+
+# The request context follows calls into asyncio tasks, and into threads with propagate
+print("\n🧪 Testing request context:")
+assert current_request() is None
+handle = bind_request({"sub": "alice"}, TOKEN)
+try:
+    async def in_task():
+        return await asyncio.create_task(asyncio.sleep(0, request_token()))
+    assert asyncio.run(in_task()) == TOKEN
+    seen = []
+    thread = threading.Thread(target=propagate(lambda: seen.append(request_token())))
+    thread.start()
+    thread.join()
+    assert seen == [TOKEN]
+    assert current_request().principal == {"sub": "alice"}
+finally:
+    reset_request(handle)
+assert request_token() is None
+print("✅ context carried into a task and a thread, and reset afterwards")
+
+# The token of the served request is forwarded to the downstream secure adder, both
+# in-process and over HTTP
+for short_circuit in (True, False):
+    way = "in-process" if short_circuit else "over HTTP"
+    if meta.connectionsFromRecp("Calculator1", IADD):
+        opencom.disconnect("web", calc1, add1, IADD)
+    meta.setReceptacleAttributeValue("Calculator1", IADD, "ShortCircuit", short_circuit)
+    assert opencom.connect("web", calc1, add1, IADD)
+    results = [call_add(TOKEN, 1, 2), call_add("nulltoken", 1, 2)]
+    print(f"✅ {way}: {results}")
+    assert results == [(200, 3), (401, None)]
+
+# Concurrent requests each forward their own token, so a rejected token never borrows a
+# valid one from another request
+results = []
+tokens = [TOKEN, "nulltoken"] * 4
+threads = [threading.Thread(target=lambda i=i: results.append((i, call_add(tokens[i], i, i)))) for i in range(8)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+print(f"✅ concurrent requests: {sorted(results)}")
+assert sorted(results) == [(i, (200, 2 * i) if i % 2 == 0 else (401, None)) for i in range(8)]
+
+# Clean up
+for label in ["Calculator1", "Adder1"]:
+    opencom.delete("web", label)
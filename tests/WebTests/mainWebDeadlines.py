@@ -0,0 +1,78 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+from AddasuSec.Deadline import DEADLINE_HEADER, DeadlineExceededException, deadline
+import requests
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+IWORK = "Examples.IWork"
+
+# Create components: a chain of two foremen and a worker, connected over HTTP rather than
+# in-process so deadlines travel in the request headers
+foreman0 = opencom.create("web", "Examples.Foreman", "Foreman0", False)
+foreman1 = opencom.create("web", "Examples.Foreman", "Foreman1", False)
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+
+print("\n🔗 Connecting components:")
+for source, sink in ((foreman0, foreman1), (foreman1, worker1)):
+    meta.setReceptacleAttributeValue(source.label, IWORK, "ShortCircuit", False)
+    print(opencom.connect("web", source, sink, IWORK))
+
+work = foreman0.innerComponent.getReceptacle(IWORK)
+
+def timed(call):
+    """Run a call and return its outcome and duration."""
+    start = time.monotonic()
+    try:
+        outcome = call()
+    except Exception as e:
+        outcome = type(e).__name__
+    return outcome, time.monotonic() - start
+
+# A call through the chain that cannot finish before its deadline fails when it passes
+print("\n🧪 Testing deadlines:")
+def slow_call():
+    with deadline(0.5):
+        return work.work(2.0, "a")
+outcome, elapsed = timed(slow_call)
+print(f"✅ call through the chain stopped after {elapsed:.2f}s: {outcome}")
+assert outcome in ("ReadTimeout", DeadlineExceededException.__name__) and elapsed < 1.5
+time.sleep(2.0)
+
+# A call whose deadline has already passed is not sent
+runs = worker1.innerComponent.runs
+def expired_call():
+    with deadline(0):
+        return work.work(0, "b")
+outcome, elapsed = timed(expired_call)
+print(f"✅ expired deadline: {outcome}")
+assert outcome == DeadlineExceededException.__name__
+assert worker1.innerComponent.runs == runs
+
+# Calls within their deadline complete
+with deadline(2.0):
+    assert work.work(0.1, "c").startswith("c#")
+print("✅ call within its deadline completed")
+
+# The server answers 504 to a request whose deadline passed while it was queued
+base_url = f"http://{meta.getComponentAttributeValue('Worker1', 'Host')}/Worker1"
+runs = worker1.innerComponent.runs
+response = requests.post(f"{base_url}/work?seconds=0&key=d", headers={DEADLINE_HEADER: str(time.time() - 1)})
+print(f"✅ expired request answered with {response.status_code}")
+assert response.status_code == 504
+assert worker1.innerComponent.runs == runs
+
+# Each edge learns a timeout from the latencies it observes, here down to its one second floor
+for i in range(50):
+    work.work(0, "e")
+stats = work.timeoutStats()
+print(f"✅ adaptive timeouts {stats}")
+assert stats == {"work": 1.0}
+assert work.callTimeout("work") == 1.0
+
+# Clean up
+for label in ["Foreman0", "Foreman1", "Worker1"]:
+    opencom.delete("web", label)
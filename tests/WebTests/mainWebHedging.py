@@ -0,0 +1,64 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import datetime
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Serve the numbers service with enough threads for the slow requests left behind by hedges
+opencom.webRuntime.setServerBackend("waitress", component="Numbers1", threads=16)
+
+# Create components; calls go over HTTP rather than in-process so they can be hedged
+client = opencom.create("web", "Examples.Client", "Client1", False)
+numbers = opencom.create("web", "Examples.Numbers", "Numbers1", False)
+meta.setReceptacleAttributeValue("Client1", "Examples.INumbers", "ShortCircuit", False)
+
+# Hedge calls slower than the 95th percentile latency, up to one in two calls
+meta.setReceptacleAttributeValue("Client1", "Examples.INumbers", "HedgePercentile", 95)
+meta.setReceptacleAttributeValue("Client1", "Examples.INumbers", "HedgeBudget", 0.5)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", client, numbers, "Examples.INumbers"))
+
+nums = client.innerComponent.getReceptacle("Examples.INumbers")
+
+# Learn the latency of the idempotent sample method
+for i in range(20):
+    assert nums.sample(i) == i
+print(f"\n⏱️ hedge stats after warm up {nums.hedgeStats()}")
+
+# The first request for each new value is slow; its hedge is answered at once and wins
+print("\n🧪 Testing hedged calls:")
+numbers.innerComponent.delay = 1.0
+start = time.monotonic()
+for i in range(100, 105):
+    assert nums.sample(i) == i
+elapsed = time.monotonic() - start
+stats = nums.hedgeStats()
+print(f"✅ 5 slow calls in {elapsed:.2f}s, hedge stats {stats}")
+assert elapsed < 1.0
+assert stats["hedge_wins"] >= 5
+assert stats["hedges"] <= stats["calls"] * 0.5
+
+# Methods that are not idempotent are never hedged
+calls = stats["calls"]
+assert nums.shift(datetime.date(2024, 1, 1), 1) == datetime.date(2024, 1, 2)
+assert nums.hedgeStats()["calls"] == calls
+print("✅ non-idempotent call not hedged")
+
+# Once the budget is spent, slow calls wait for their first request
+start = time.monotonic()
+for i in range(200, 220):
+    assert nums.sample(i) == i
+elapsed = time.monotonic() - start
+stats = nums.hedgeStats()
+print(f"✅ 20 slow calls in {elapsed:.2f}s, hedge stats {stats}")
+assert elapsed >= 1.0
+assert stats["hedges"] <= stats["calls"] * 0.5
+
+# Clean up
+time.sleep(1.0)
+for label in ["Client1", "Numbers1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,56 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import asyncio
+import requests
+import threading
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Serve the components created from now on behind one shared listener, except the worker
+# given a server of its own
+opencom.webRuntime.multiplexHost()
+opencom.webRuntime.setServerBackend("waitress", component="Worker1")
+
+# Create many components; the first starts the shared listener, the others add no threads
+adders = [opencom.create("web", "Examples.Adder", "Adder0", False)]
+threads = threading.active_count()
+adders += [opencom.create("web", "Examples.Adder", f"Adder{i}", False) for i in range(1, 50)]
+calc1 = opencom.create("web", "Examples.Calculator", "Calculator1", False)
+added = threading.active_count() - threads
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+
+print("\n🧪 Testing the multiplexed host:")
+hosts = {meta.getComponentAttributeValue(f"Adder{i}", "Host") for i in range(50)}
+host = meta.getComponentAttributeValue("Calculator1", "Host")
+print(f"✅ 51 components behind {hosts}, {added} threads added after the first")
+assert hosts == {host} and added == 0
+assert meta.getComponentAttributeValue("Worker1", "Host") != host
+
+# Requests are dispatched to the component mounted under the path's label
+for i in (0, 25, 49):
+    response = requests.post(f"http://{host}/Adder{i}/add?a={i}&b=1")
+    response.raise_for_status()
+    assert response.json()["result"] == i + 1
+print("✅ requests dispatched by label")
+
+# Receptacles call mounted components over the shared listener
+meta.setReceptacleAttributeValue("Calculator1", "Examples.IAdd", "ShortCircuit", False)
+print(opencom.connect("web", calc1, adders[49], "Examples.IAdd"))
+adder = calc1.innerComponent.getReceptacle("Examples.IAdd")
+assert adder.add(2, 3) == 5
+assert asyncio.run(adder.asyncProxy().add(4, 4)) == 8
+print(f"✅ receptacle calls over {adder.url}")
+
+# Unmounted and unknown labels are answered with 404, and a label can be mounted again
+opencom.delete("web", "Adder5")
+assert requests.post(f"http://{host}/Adder5/add?a=1&b=2").status_code == 404
+assert requests.post(f"http://{host}/nothing").status_code == 404
+opencom.create("web", "Examples.Adder", "Adder5", False)
+assert requests.post(f"http://{host}/Adder5/add?a=1&b=2").json()["result"] == 3
+print("✅ 404 for unmounted labels, and remounting")
+
+# Clean up
+for label in [f"Adder{i}" for i in range(50)] + ["Calculator1", "Worker1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,50 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import threading
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components
+foreman = opencom.create("web", "Examples.Foreman", "Foreman1", False)
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+
+# Admit one call at a time with no queue; calls to a co-located worker with a concurrency
+# limit go over HTTP rather than in-process, so the limit applies to them
+meta.setComponentAttributeValue("Worker1", "MaxConcurrency", 1)
+meta.setComponentAttributeValue("Worker1", "MaxQueue", 0)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", foreman, worker1, "Examples.IWork"))
+
+work = foreman.innerComponent.getReceptacle("Examples.IWork")
+
+# Warm the edge so its adaptive timeout drops to the one second floor and the worker
+# learns its service time, from which it estimates the Retry-After of shed calls
+for i in range(60):
+    work.work(0.05, "w")
+print(f"\n⏱️ adaptive timeout {work.callTimeout('work')}s, retry budget {work.retryBudget()}s")
+assert work.callTimeout("work") < work.retryBudget()
+
+# Concurrent calls are shed with 503 and retried within the receptacle's retry budget
+print("\n🧪 Testing overload retries:")
+results = []
+def call(i):
+    try:
+        results.append(work.work(0.05, f"k{i}"))
+    except Exception as e:
+        results.append(e)
+threads = [threading.Thread(target=call, args=(i,)) for i in range(3)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+shed = meta.getComponentAttributeValue("Worker1", "ShedRequests")
+print(f"✅ results = {sorted(map(str, results))}, shed = {shed}")
+assert all(isinstance(r, str) for r in results)
+assert shed and shed > 0
+
+# Clean up
+for label in ["Foreman1", "Worker1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,59 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components
+calc1 = opencom.create("web", "Examples.Calculator", "Calculator1", False)
+add1 = opencom.create("web", "Examples.Adder", "Adder1", False)
+
+# Pool two connections per host and reap them after half a second idle; calls go over
+# HTTP rather than in-process so they use the pool
+meta.setReceptacleAttributeValue("Calculator1", "Examples.IAdd", "PoolSize", 2)
+meta.setReceptacleAttributeValue("Calculator1", "Examples.IAdd", "IdleTimeout", 0.5)
+meta.setReceptacleAttributeValue("Calculator1", "Examples.IAdd", "ShortCircuit", False)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", calc1, add1, "Examples.IAdd"))
+
+adder = calc1.innerComponent.getReceptacle("Examples.IAdd")
+base_url = f"http://{meta.getComponentAttributeValue('Adder1', 'Host')}/Adder1"
+
+def connections():
+    """Return the number of connections opened to the adder by the receptacle's pool."""
+    session = adder.session.get()
+    pools = session.get_adapter(base_url).poolmanager.pools
+    return sum(pools[key].num_connections for key in pools.keys())
+
+# Connecting opens the pool ahead of the first call, and successive calls reuse it
+print("\n🧪 Testing pooled connections:")
+assert adder.session.pool_size == 2 and adder.session.idle_timeout == 0.5
+assert adder.session.session is not None
+for i in range(20):
+    assert adder.add(i, 1) == i + 1
+print(f"✅ 20 calls over {connections()} connection(s)")
+assert connections() == 1
+
+# An idle session is reaped and reopened on the next call
+time.sleep(0.6)
+assert adder.session.reap()
+assert adder.session.session is None
+print("✅ idle session reaped")
+assert adder.add(2, 3) == 5
+assert adder.session.session is not None
+print("✅ session reopened by the next call")
+
+# The pool can be reconfigured at run time
+adder.configurePool(pool_size=4, idle_timeout=10)
+assert adder.session.pool_size == 4 and adder.session.idle_timeout == 10
+assert adder.add(4, 5) == 9
+time.sleep(0.6)
+assert not adder.session.reap()
+print("✅ reconfigured pool kept open while idle for less than its timeout")
+
+# Clean up
+for label in ["Calculator1", "Adder1"]:
+    opencom.delete("web", label)
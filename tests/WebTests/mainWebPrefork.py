@@ -0,0 +1,38 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import os
+import threading
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Serve the worker from two pre-forked processes
+opencom.webRuntime.setServerBackend("waitress", component="Worker1", workers=2)
+
+# Create components
+foreman = opencom.create("web", "Examples.Foreman", "Foreman1", False)
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+
+# Connect components
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", foreman, worker1, "Examples.IWork"))
+
+work = foreman.innerComponent.getReceptacle("Examples.IWork")
+
+# Calls are served by the worker processes, never by the parent's instance
+print("\n🧪 Testing pre-forked workers:")
+assert meta.getComponentAttributeValue("Worker1", "Workers") == 2
+assert work.local is None
+pids = set()
+threads = [threading.Thread(target=lambda: pids.update(work.pid() for _ in range(5))) for _ in range(8)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+print(f"✅ served by processes {sorted(pids)}")
+assert pids and os.getpid() not in pids
+
+# Clean up
+for label in ["Foreman1", "Worker1"]:
+    opencom.delete("web", label)
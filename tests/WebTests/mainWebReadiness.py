@@ -0,0 +1,48 @@
+from Runtimes.runtime import runtime, ComponentException
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import requests
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+def add(label, a, b):
+    """Call a component's add method directly over HTTP."""
+    response = requests.post(f"http://{meta.getComponentAttributeValue(label, 'Host')}/{label}/add?a={a}&b={b}")
+    response.raise_for_status()
+    return response.json()["result"]
+
+# create returns once the component's server accepts requests
+print("\n🧪 Testing server readiness:")
+start = time.monotonic()
+opencom.create("web", "Examples.Adder", "Single", False)
+elapsed = time.monotonic() - start
+assert add("Single", 1, 1) == 2
+print(f"✅ component answered straight after a {elapsed:.3f}s create")
+
+# createAll creates components concurrently, each ready when it returns, and reports the
+# ones that failed without stopping the others
+specs = [("Examples.Adder", f"Bulk{i}", False) for i in range(20)]
+specs += [("Examples.Missing", "Broken", False), ("Examples.Adder", "Single", False),
+          ("Examples.Adder", "bad-name", False)]
+start = time.monotonic()
+created, errors = opencom.createAll("web", specs)
+print(f"✅ createAll made {len(created)} components in {time.monotonic() - start:.2f}s")
+for label, error in errors.items():
+    print(f"✅ {label}: {type(error).__name__}: {error}")
+assert sorted(created) == sorted(f"Bulk{i}" for i in range(20))
+assert sorted(errors) == ["Broken", "Single", "bad-name"]
+assert all(isinstance(error, Exception) for error in errors.values())
+assert isinstance(errors["bad-name"], ComponentException)
+assert all(add(label, i, 2) == i + 2 for i, label in enumerate(sorted(created)))
+print("✅ every created component answered at once")
+
+# Failed components leave nothing behind in the meta architecture
+assert meta.getComponentAttributeValue("Broken", "Host") is None
+assert add("Single", 2, 2) == 4
+print("✅ failed components not registered, existing component untouched")
+
+# Clean up
+for label in list(created) + ["Single"]:
+    opencom.delete("web", label)
@@ -0,0 +1,71 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import threading
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create a foreman and two replicas of the worker it delegates to
+foreman = opencom.create("web", "Examples.Foreman", "Foreman1", False)
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+worker2 = opencom.create("web", "Examples.Worker", "Worker2", False)
+worker3 = opencom.create("web", "Examples.Worker", "Worker3", False)
+
+# Connect the foreman to both replicas
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", foreman, [worker1, worker2], "Examples.IWork"))
+
+work = foreman.innerComponent.getReceptacle("Examples.IWork")
+
+# Helper function to make concurrent calls and return their results or errors
+def call_concurrently(count, seconds, key):
+    results = []
+    def call():
+        try:
+            results.append(work.work(seconds, key))
+        except Exception as e:
+            results.append(e)
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+# Concurrent calls are balanced across the replicas
+print("\n🧪 Testing balancing:")
+results = call_concurrently(10, 0.1, "k")
+assert all(isinstance(r, str) for r in results)
+runs = {"Worker1": worker1.innerComponent.runs, "Worker2": worker2.innerComponent.runs}
+print(f"✅ calls per replica = {runs}")
+assert runs["Worker1"] > 0 and runs["Worker2"] > 0
+
+# A failing replica is ejected and the calls go to the healthy one
+print("\n🧪 Testing ejection:")
+worker2.innerComponent.failing = True
+failures = 0
+for i in range(20):
+    failures += sum(isinstance(r, Exception) for r in call_concurrently(2, 0.05, "e"))
+    if work.replicaStats()["Worker2"]["ejected"]:
+        break
+stats = work.replicaStats()
+print(f"✅ Worker2 ejected after {failures} failures: {stats['Worker2']}")
+assert stats["Worker2"]["ejected"] and not stats["Worker1"]["ejected"]
+before = worker1.innerComponent.runs
+for i in range(5):
+    assert work.work(0, "h").startswith("h#")
+assert worker1.innerComponent.runs == before + 5
+print("✅ calls served by Worker1 while Worker2 is ejected")
+
+# Replicas are added and removed at runtime
+print("\n🧪 Testing replica changes:")
+print(opencom.addReplica("web", foreman, worker3, "Examples.IWork"))
+print(opencom.removeReplica("web", foreman, worker2, "Examples.IWork"))
+labels = sorted(work.replicaStats())
+print(f"✅ replicas = {labels}")
+assert labels == ["Worker1", "Worker3"]
+
+# Clean up
+for label in ["Foreman1", "Worker1", "Worker2", "Worker3"]:
+    opencom.delete("web", label)
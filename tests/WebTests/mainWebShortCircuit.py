@@ -0,0 +1,81 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+from AddasuSec.RequestContext import bind_request, reset_request
+import aiohttp
+import asyncio
+import requests
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+AUTH_URL = "http://localhost:8676/token"
+IWORK = "Examples.IWork"
+IADD = "Examples.IAdd"
+
+# Create components: a foreman and its worker, and a calculator whose secure adder is
+# protected by role_required
+foreman = opencom.create("web", "Examples.Foreman", "Foreman1", False)
+worker1 = opencom.create("web", "Examples.Worker", "Worker1", False)
+calc1 = opencom.create("web", "Examples.Calculator", "Calculator1", False)
+add1 = opencom.create("web", "Examples.AdderAuthZ", "Adder1", True)
+
+# Obtain Auth Token
+resp = requests.post(AUTH_URL, data={"username": "alice", "password": "password123"})
+resp.raise_for_status()
+TOKEN = resp.json().get("access_token")
+assert TOKEN, "Token retrieval failed"
+
+def connect(source, sink, interface, short_circuit):
+    """(Re)connect a co-located sink, called in-process or over HTTP."""
+    owner = source.label
+    if meta.connectionsFromRecp(owner, interface):
+        opencom.disconnect("web", source, sink, interface)
+    meta.setReceptacleAttributeValue(owner, interface, "ShortCircuit", short_circuit)
+    assert opencom.connect("web", source, sink, interface)
+    receptacle = source.innerComponent.getReceptacle(interface)
+    assert (receptacle.local is not None) == short_circuit
+    return receptacle
+
+def call_with_token(receptacle, token, a, b):
+    """Call the protected adder carrying a bearer token, as a served request would."""
+    handle = bind_request(None, token)
+    try:
+        return receptacle.receptacle_with_token(receptacle.add, a, b)
+    finally:
+        reset_request(handle)
+
+def outcome(call):
+    """Return a call's result, or the type and status of the error it raised."""
+    try:
+        return call()
+    except requests.HTTPError as e:
+        return ("HTTPError", e.response.status_code)
+    except aiohttp.ClientResponseError as e:
+        return ("ClientResponseError", e.status)
+
+def run(work, adder):
+    worker1.innerComponent.failing = False
+    results = [outcome(lambda: work.work(0, "a")[:2]),
+               outcome(lambda: asyncio.run(work.asyncProxy().work(0, "b"))[:2]),
+               outcome(lambda: call_with_token(adder, TOKEN, 1, 2)),
+               outcome(lambda: call_with_token(adder, "nulltoken", 1, 2))]
+    worker1.innerComponent.failing = True
+    results += [outcome(lambda: work.work(0, "c")),
+                outcome(lambda: asyncio.run(work.asyncProxy().work(0, "d")))]
+    return results
+
+expected = ["a#", "b#", 3, ("HTTPError", 401), ("HTTPError", 500), ("ClientResponseError", 500)]
+
+for short_circuit in (True, False):
+    way = "in-process" if short_circuit else "over HTTP"
+    print(f"\n🧪 Testing co-located calls {way}:")
+    work = connect(foreman, worker1, IWORK, short_circuit)
+    adder = connect(calc1, add1, IADD, short_circuit)
+    results = run(work, adder)
+    print(f"✅ {way}: {results}")
+    assert results == expected
+
+# Clean up
+for label in ["Foreman1", "Worker1", "Calculator1", "Adder1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,71 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import asyncio
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+INUMBERS = "Examples.INumbers"
+
+# Create components; calls go over HTTP rather than in-process so results are streamed
+client = opencom.create("web", "Examples.Client", "Client1", False)
+numbers = opencom.create("web", "Examples.Numbers", "Numbers1", False)
+meta.setReceptacleAttributeValue("Client1", INUMBERS, "ShortCircuit", False)
+
+print("\n🧪 Testing streamed results:")
+for codec in ["msgpack", "json"]:
+    meta.setReceptacleAttributeValue("Client1", INUMBERS, "Codec", codec)
+    assert opencom.connect("web", client, numbers, INUMBERS)
+    nums = client.innerComponent.getReceptacle(INUMBERS)
+
+    # Items arrive as they are produced, long before the generator finishes
+    start = time.monotonic()
+    stream = nums.count(100)
+    assert next(stream) == 0
+    first = time.monotonic() - start
+    assert list(stream) == list(range(1, 100))
+    print(f"✅ {codec}: first of 100 items after {first:.2f}s, all after {time.monotonic() - start:.2f}s")
+    assert first < 0.5
+    assert stream.cursor == 100 and stream.done
+
+    # Async generators stream too, also through the async proxy
+    assert list(nums.acount(3)) == [0, 10, 20]
+    async def consume():
+        return [item async for item in nums.asyncProxy().acount(4)]
+    assert asyncio.run(consume()) == [0, 10, 20, 30]
+    print(f"✅ {codec}: async generator streamed")
+    opencom.disconnect("web", client, numbers, INUMBERS)
+
+assert opencom.connect("web", client, numbers, INUMBERS)
+nums = client.innerComponent.getReceptacle(INUMBERS)
+
+# A broken stream is reopened at its cursor and continues where it stopped
+stream = nums.count(10)
+assert [next(stream) for _ in range(3)] == [0, 1, 2]
+stream.response.close()
+assert list(stream) == list(range(3, 10))
+assert stream.retries == 1
+print(f"✅ broken stream resumed at cursor 3, ended at cursor {stream.cursor}")
+
+# Streams can be opened at a cursor with a page size to page through a result
+pages, cursor, done = [], 0, False
+while not done:
+    page = nums.openStream("count", 10, cursor=cursor, limit=4)
+    pages.append(list(page))
+    cursor, done = page.cursor, page.done
+print(f"✅ pages {pages}")
+assert pages == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+# Only iterator methods can be opened as streams
+try:
+    nums.openStream("lookup", "a")
+    print("❌ openStream of a non-iterator method did not raise")
+    assert False
+except TypeError as e:
+    print(f"✅ {e}")
+
+# Clean up
+for label in ["Client1", "Numbers1"]:
+    opencom.delete("web", label)
@@ -0,0 +1,68 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components: two calculators sharing two adders
+calc1 = opencom.create("web", "Examples.Calculator", "Calculator1", False)
+calc2 = opencom.create("web", "Examples.Calculator", "Calculator2", False)
+add1 = opencom.create("web", "Examples.Adder", "Adder1", False)
+add2 = opencom.create("web", "Examples.Adder", "Adder2", False)
+
+# Calls go over HTTP rather than in-process so they are made by the stubs
+for label in ["Calculator1", "Calculator2"]:
+    meta.setReceptacleAttributeValue(label, "Examples.IAdd", "ShortCircuit", False)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", calc1, add1, "Examples.IAdd"))
+print(opencom.connect("web", calc2, add2, "Examples.IAdd"))
+
+adder1 = calc1.innerComponent.getReceptacle("Examples.IAdd")
+adder2 = calc2.innerComponent.getReceptacle("Examples.IAdd")
+
+# Both receptacles share the stub class compiled for the interface, each bound to its sink
+print("\n🧪 Testing interface stubs:")
+assert type(adder1.stub) is type(adder2.stub)
+assert list(adder1.stub.specs) == ["add"]
+assert adder1.stub.specs["add"].params == ["a", "b"]
+assert adder1.stub.endpoints["add"].endswith("/Adder1/add")
+assert adder2.stub.endpoints["add"].endswith("/Adder2/add")
+print(f"✅ shared stub {type(adder1.stub).__name__} bound to {adder1.stub.endpoints['add']} and {adder2.stub.endpoints['add']}")
+
+# Calls through the stub take positional and keyword arguments
+assert calc1.innerComponent.add(3, 4) == 7
+assert adder1.add(3, b=5) == 8
+assert adder2.add(a=1, b=2) == 3
+print("✅ positional and keyword arguments")
+
+# Too many arguments are refused before any request is sent
+try:
+    adder1.add(1, 2, 3)
+    print("❌ Call with too many arguments did not raise")
+    assert False
+except TypeError as e:
+    print(f"✅ {e}")
+
+# Methods that are not in the interface are not available
+try:
+    adder1.sub(1, 2)
+    print("❌ Unknown method did not raise")
+    assert False
+except AttributeError:
+    print("✅ unknown method raised AttributeError")
+
+# A disconnected receptacle drops its stub
+opencom.disconnect("web", calc2, add2, "Examples.IAdd")
+assert adder2.stub is None
+try:
+    adder2.add(1, 2)
+    print("❌ Call on a disconnected receptacle did not raise")
+    assert False
+except AttributeError as e:
+    print(f"✅ {e}")
+
+# Clean up
+for label in ["Calculator1", "Calculator2", "Adder1", "Adder2"]:
+    opencom.delete("web", label)
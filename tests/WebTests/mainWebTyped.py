@@ -0,0 +1,38 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+import asyncio
+import datetime
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Create components; calls go over HTTP rather than in-process so results are decoded
+client = opencom.create("web", "Examples.Client", "Client1", False)
+numbers = opencom.create("web", "Examples.Numbers", "Numbers1", False)
+meta.setReceptacleAttributeValue("Client1", "Examples.INumbers", "ShortCircuit", False)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", client, numbers, "Examples.INumbers"))
+
+nums = client.innerComponent.getReceptacle("Examples.INumbers")
+
+# Dates are sent as ISO strings and decoded back into dates
+print("\n🧪 Testing typed results:")
+result = nums.shift(datetime.date(2024, 2, 27), 3)
+print(f"✅ shift = {result!r}")
+assert result == datetime.date(2024, 3, 1)
+
+# JSON object keys come back as strings and are decoded into the annotated key type
+result = nums.table(2, 3)
+print(f"✅ table = {result!r}")
+assert result == {0: ["xxx"], 1: ["xxx"]}
+
+# The async proxy decodes results in the same way
+result = asyncio.run(nums.asyncProxy().shift(datetime.date(2024, 12, 31), 1))
+print(f"✅ async shift = {result!r}")
+assert result == datetime.date(2025, 1, 1)
+
+# Clean up
+for label in ["Client1", "Numbers1"]:
+    opencom.delete("web", label)
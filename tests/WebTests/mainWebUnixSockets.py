@@ -0,0 +1,68 @@
+from Runtimes.runtime import runtime
+from MetaArchitecture.MetaArchitecture import MetaArchitecture
+from AddasuSec.UnixSocket import UNIX_SCHEME
+import asyncio
+import os
+import requests
+import time
+
+# Initialize architecture and runtime
+meta = MetaArchitecture()
+opencom = runtime(meta)
+
+# Serve the components created from now on on Unix sockets as well as on TCP
+socket_dir = opencom.webRuntime.serveUnixSockets()
+
+# Create components; calls go over HTTP rather than in-process so they use the socket
+calc1 = opencom.create("web", "Examples.Calculator", "Calculator1", False)
+add1 = opencom.create("web", "Examples.Adder", "Adder1", False)
+meta.setReceptacleAttributeValue("Calculator1", "Examples.IAdd", "ShortCircuit", False)
+
+print("\n🔗 Connecting components:")
+print(opencom.connect("web", calc1, add1, "Examples.IAdd"))
+
+adder = calc1.innerComponent.getReceptacle("Examples.IAdd")
+
+# Receptacles on this host call the sink over its socket
+print("\n🧪 Testing Unix sockets:")
+path = meta.getComponentAttributeValue("Adder1", "Socket")
+assert path == os.path.join(socket_dir, "Adder1.sock") and os.path.exists(path)
+assert adder.url.startswith(f"{UNIX_SCHEME}://")
+assert adder.add(2, 3) == 5
+assert asyncio.run(adder.asyncProxy().add(4, 4)) == 8
+print(f"✅ calls over {adder.url}")
+
+# The sink is still served on TCP for callers on other hosts
+host = meta.getComponentAttributeValue("Adder1", "Host")
+response = requests.post(f"http://{host}/Adder1/add?a=1&b=1")
+response.raise_for_status()
+assert response.json()["result"] == 2
+print(f"✅ TCP still served at {host}")
+
+# The UnixSocket receptacle attribute turns the socket off for a connection
+opencom.disconnect("web", calc1, add1, "Examples.IAdd")
+meta.setReceptacleAttributeValue("Calculator1", "Examples.IAdd", "UnixSocket", False)
+print(opencom.connect("web", calc1, add1, "Examples.IAdd"))
+assert adder.url.startswith("http://")
+assert adder.add(2, 3) == 5
+print(f"✅ calls over {adder.url} with UnixSocket off")
+
+# Without TCP, components are only served on their socket
+opencom.webRuntime.serveUnixSockets(socket_dir, tcp=False)
+add2 = opencom.create("web", "Examples.Adder", "Adder2", False)
+calc2 = opencom.create("web", "Examples.Calculator", "Calculator2", False)
+meta.setReceptacleAttributeValue("Calculator2", "Examples.IAdd", "ShortCircuit", False)
+print(opencom.connect("web", calc2, add2, "Examples.IAdd"))
+assert add2.port is None
+assert calc2.innerComponent.add(5, 6) == 11
+print(f"✅ socket-only component called over {calc2.innerComponent.getReceptacle('Examples.IAdd').url}")
+
+# Deleting a component removes its socket
+opencom.delete("web", "Adder2")
+time.sleep(0.5)
+assert not os.path.exists(os.path.join(socket_dir, "Adder2.sock"))
+print("✅ socket removed with its component")
+
+# Clean up
+for label in ["Calculator1", "Calculator2", "Adder1"]:
+    opencom.delete("web", label)